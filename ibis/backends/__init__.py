@@ -5,12 +5,15 @@ import collections.abc
 import contextlib
 import functools
 import importlib.metadata
+import json
 import keyword
+import os
 import re
 import sys
+import tempfile
 import urllib.parse
 import weakref
-from collections import Counter
+from collections import Counter, OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple
 
@@ -22,7 +25,7 @@ import ibis.expr.types as ir
 from ibis import util
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+    from collections.abc import Collection, Iterable, Iterator, Mapping, MutableMapping
     from urllib.parse import ParseResult
 
     import pandas as pd
@@ -171,9 +174,7 @@ class _FileIOHandler:
         expr = expr.as_table()
         schema = expr.schema()
         yield from (
-            orig_expr.__pandas_result__(
-                PandasData.convert_table(batch.to_pandas(), schema)
-            )
+            orig_expr.__pandas_result__(PandasData.convert_pyarrow(batch, schema))
             for batch in self.to_pyarrow_batches(
                 expr, params=params, limit=limit, chunk_size=chunk_size, **kwargs
             )
@@ -223,9 +224,7 @@ class _FileIOHandler:
         ) as reader:
             table = pa.Table.from_batches(reader, schema=arrow_schema)
 
-        return expr.__pyarrow_result__(
-            table.rename_columns(list(table_expr.columns)).cast(arrow_schema)
-        )
+        return expr.__pyarrow_result__(table)
 
     @util.experimental
     def to_polars(
@@ -777,9 +776,20 @@ class CacheEntry(NamedTuple):
 class CacheHandler:
     """A mixin for handling `.cache()`/`CachedTable` operations."""
 
+    supports_cache_spill: ClassVar[bool] = False
+    """Whether cached tables can be spilled to memory-mapped Arrow IPC files."""
+
     def __init__(self):
         self._cache_name_to_entry = {}
         self._cache_op_to_entry = {}
+        # spilled and persisted cached table names to (path, size), least
+        # recently used first
+        self._spilled_tables = OrderedDict()
+        # names of cached tables registered from the persistent cache
+        self._persisted_tables = set()
+        # names of cached tables evicted while still referenced, to whether
+        # they were computed approximately
+        self._evicted_tables = {}
 
     def _cached_table(self, table: ir.Table) -> ir.CachedTable:
         """Convert a Table to a CachedTable.
@@ -794,9 +804,13 @@ class CacheHandler:
         Table
             Cached table
         """
-        entry = self._cache_op_to_entry.get(table.op())
+        # results computed under `ibis.approximate()` are never shared, so that
+        # exact and approximate results don't get mixed up
+        approximate = ibis.options.approximate
+        entry = None if approximate else self._cache_op_to_entry.get(table.op())
         if entry is None or (cached_op := entry.cached_op_ref()) is None:
-            cached_op = self._create_cached_table(util.gen_name("cached"), table).op()
+            name = util.gen_name("cached")
+            cached_op = self._store_cached_table(name, table).op()
             entry = CacheEntry(
                 table.op(),
                 weakref.ref(cached_op),
@@ -804,10 +818,27 @@ class CacheHandler:
                     cached_op, self._finalize_cached_table, cached_op.name
                 ),
             )
-            self._cache_op_to_entry[table.op()] = entry
+            if not approximate:
+                self._cache_op_to_entry[table.op()] = entry
             self._cache_name_to_entry[cached_op.name] = entry
+            self._evict_spilled_tables(keep={cached_op.name})
+        elif cached_op.name in self._spilled_tables:
+            self._spilled_tables.move_to_end(cached_op.name)
         return ir.CachedTable(cached_op)
 
+    def _store_cached_table(self, name: str, table: ir.Table) -> ir.Table:
+        """Compute `table` and register the result as `name`."""
+        options = ibis.config.options.cache
+        if (
+            options.persist
+            and self.supports_cache_spill
+            and (key := self._cache_key(table)) is not None
+        ):
+            return self._persist_cached_table(name, table, key)
+        elif options.spill and self.supports_cache_spill:
+            return self._spill_cached_table(name, table)
+        return self._create_cached_table(name, table)
+
     def _finalize_cached_table(self, name: str) -> None:
         """Release a cached table given its name.
 
@@ -819,10 +850,20 @@ class CacheHandler:
             The name of the cached table.
         """
         if (entry := self._cache_name_to_entry.pop(name, None)) is not None:
-            self._cache_op_to_entry.pop(entry.orig_op)
+            if self._cache_op_to_entry.get(entry.orig_op) is entry:
+                del self._cache_op_to_entry[entry.orig_op]
             entry.finalizer.detach()
             try:
-                self._drop_cached_table(name)
+                if (spilled := self._spilled_tables.pop(name, None)) is not None:
+                    path, _ = spilled
+                    self._drop_spilled_table(name)
+                    if name in self._persisted_tables:
+                        # persisted entries outlive the tables that use them
+                        self._persisted_tables.discard(name)
+                    else:
+                        path.unlink(missing_ok=True)
+                elif self._evicted_tables.pop(name, None) is None:
+                    self._drop_cached_table(name)
             except Exception:
                 # suppress exceptions during interpreter shutdown
                 if not sys.is_finalizing():
@@ -834,6 +875,202 @@ class CacheHandler:
     def _drop_cached_table(self, name: str) -> None:
         self.drop_table(name, force=True)
 
+    @staticmethod
+    def _cache_directory() -> Path:
+        directory = Path(ibis.config.options.cache.directory or tempfile.gettempdir())
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory
+
+    def _write_cache_file(
+        self, path: Path, expr: ir.Table, metadata: dict[str, str] | None = None
+    ) -> None:
+        """Stream the result of `expr` into an Arrow IPC file at `path`."""
+        import pyarrow as pa
+
+        from ibis.formats.pyarrow import PyArrowData
+
+        schema = expr.schema()
+        arrow_schema = schema.to_pyarrow()
+        if metadata is not None:
+            arrow_schema = arrow_schema.with_metadata(metadata)
+
+        with self.to_pyarrow_batches(expr) as reader:
+            with pa.ipc.new_file(str(path), arrow_schema) as writer:
+                for batch in reader:
+                    writer.write_batch(PyArrowData.convert_table(batch, schema))
+
+    def _spill_cached_table(self, name: str, expr: ir.Table) -> ir.Table:
+        """Write `expr` to an Arrow IPC file and register it as `name`."""
+        path = self._cache_directory() / f"{name}.arrow"
+        self._write_cache_file(path, expr)
+
+        try:
+            table = self._register_spilled_table(name, path)
+        except Exception:
+            path.unlink(missing_ok=True)
+            raise
+
+        self._spilled_tables[name] = path, path.stat().st_size
+        return table
+
+    def _cache_key(self, expr: ir.Table) -> str | None:
+        """Return a process independent key for `expr`, if it has one.
+
+        Expressions over a table without a version have no key, because other
+        processes couldn't tell whether a persisted result is still valid.
+        """
+        from ibis.expr.fingerprint import fingerprint
+
+        if any(
+            op.source._table_version(op) is None
+            for op in expr.op().find(ops.DatabaseTable)
+        ):
+            return None
+
+        def identify(source):
+            if isinstance(source, CacheHandler):
+                return source._cache_identity()
+            return None
+
+        digest = fingerprint(expr.op(), identify)
+        if digest is None:
+            return None
+        elif ibis.options.approximate:
+            return f"{self.name}-approx-{digest}"
+        return f"{self.name}-{digest}"
+
+    def _cache_identity(self) -> str | None:
+        """Return an identity for this backend's data that other processes share.
+
+        Tables of backends without one are not persisted across processes.
+        """
+        return None
+
+    def _table_version(self, op: ops.DatabaseTable) -> str | None:
+        """Return a token that changes whenever the data of `op` changes.
+
+        [](`None`) means the backend cannot tell, in which case cached tables
+        derived from `op` aren't persisted.
+        """
+        return None
+
+    def _persist_cached_table(self, name: str, expr: ir.Table, key: str) -> ir.Table:
+        """Register `expr` from the persistent cache, computing it if needed.
+
+        The entry is recomputed when it is missing or when the versions of the
+        source tables it was computed from have changed.
+        """
+        import pyarrow as pa
+
+        versions = {
+            f"{op.namespace.catalog}.{op.namespace.database}.{op.name}": (
+                op.source._table_version(op)
+            )
+            for op in expr.op().find(ops.DatabaseTable)
+        }
+        token = json.dumps(versions, sort_keys=True).encode()
+
+        directory = self._cache_directory()
+        path = directory / f"{key}.arrow"
+        try:
+            with pa.memory_map(str(path)) as source:
+                metadata = pa.ipc.open_file(source).schema.metadata or {}
+        except (FileNotFoundError, pa.ArrowInvalid):
+            metadata = {}
+
+        if metadata.get(b"ibis.source_versions") != token:
+            # write next to the final location and atomically move it in place
+            # so that concurrent readers never observe a partial file
+            tmp = directory / f"{name}.tmp"
+            try:
+                self._write_cache_file(tmp, expr, {"ibis.source_versions": token})
+                os.replace(tmp, path)
+            finally:
+                tmp.unlink(missing_ok=True)
+
+        table = self._register_spilled_table(name, path)
+        self._spilled_tables[name] = path, path.stat().st_size
+        self._persisted_tables.add(name)
+        return table
+
+    @staticmethod
+    def _read_spilled_table(path: Path) -> pa.Table:
+        """Memory-map a spilled cached table without copying its buffers."""
+        import pyarrow as pa
+
+        return pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+
+    def _register_spilled_table(self, name: str, path: Path) -> ir.Table:
+        raise NotImplementedError(
+            f"{self.name} does not support spilling cached tables"
+        )
+
+    def _drop_spilled_table(self, name: str) -> None:
+        self._drop_cached_table(name)
+
+    def _evict_spilled_tables(self, keep: Collection[str] = ()) -> None:
+        """Free spilled and persisted cached tables until under budget.
+
+        Persisted entries of this backend that no cached table uses are
+        deleted first, oldest first. Then the least recently used cached
+        tables, except those in `keep`, are evicted, to be recomputed when an
+        expression that still refers to them is executed.
+        """
+        if (max_size := ibis.config.options.cache.max_size) is None:
+            return
+
+        spilled = self._spilled_tables
+        used = {path for path, _ in spilled.values()}
+        unused = []
+        for path in self._cache_directory().glob(f"{self.name}-*.arrow"):
+            if path not in used:
+                with contextlib.suppress(FileNotFoundError):
+                    stat = path.stat()
+                    unused.append((stat.st_mtime, path, stat.st_size))
+
+        total = sum(size for _, size in spilled.values())
+        total += sum(size for *_, size in unused)
+        for _, path, size in sorted(unused):
+            if total <= max_size:
+                return
+            with contextlib.suppress(OSError):
+                path.unlink(missing_ok=True)
+            total -= size
+
+        for name in [name for name in spilled if name not in keep]:
+            if total <= max_size:
+                return
+            total -= spilled[name][1]
+            self._evict_spilled_table(name)
+
+    def _evict_spilled_table(self, name: str) -> None:
+        """Free the file of cached table `name`, keeping its cache entry."""
+        path, _ = self._spilled_tables.pop(name)
+        self._persisted_tables.discard(name)
+        self._drop_spilled_table(name)
+        with contextlib.suppress(OSError):
+            path.unlink(missing_ok=True)
+        entry = self._cache_name_to_entry[name]
+        self._evicted_tables[name] = (
+            self._cache_op_to_entry.get(entry.orig_op) is not entry
+        )
+
+    def _restore_evicted_tables(self, expr: ir.Expr) -> None:
+        """Recompute the evicted cached tables that `expr` refers to."""
+        if not self._evicted_tables:
+            return
+
+        names = {
+            op.name for op in expr.op().find(ops.DatabaseTable)
+        } & self._evicted_tables.keys()
+        for name in names:
+            approximate = self._evicted_tables.pop(name)
+            table = self._cache_name_to_entry[name].orig_op.to_expr()
+            with ibis.approximate(approximate):
+                self._store_cached_table(name, table)
+        if names:
+            self._evict_spilled_tables(keep=names)
+
 
 class BaseBackend(abc.ABC, _FileIOHandler, CacheHandler):
     """Base backend class.
@@ -1159,6 +1396,7 @@ class BaseBackend(abc.ABC, _FileIOHandler, CacheHandler):
 
     def _run_pre_execute_hooks(self, expr: ir.Expr) -> None:
         """Backend-specific hooks to run before an expression is executed."""
+        self._restore_evicted_tables(expr)
         self._register_udfs(expr)
         self._register_in_memory_tables(expr)
 
@@ -283,6 +283,8 @@ class Backend(SQLBackend, CanCreateDatabase, DirectExampleLoader):
     def _collect_in_memory_tables(
         self, expr: ir.Table | None, external_tables: Mapping | None = None
     ):
+        # large `isin` lists are lowered to memtables when executing
+        expr = self.compiler.lower_in_values(expr.op()).to_expr()
         memtables = {
             op.name: op for op in self._verify_in_memory_tables_are_unique(expr)
         }
@@ -543,7 +545,7 @@ class Backend(SQLBackend, CanCreateDatabase, DirectExampleLoader):
                 raise com.TableNotFound(table_name) from e
 
         return sch.Schema(
-            dict(zip(names, map(self.compiler.type_mapper.from_string, types)))
+            dict(zip(names, self.compiler.type_mapper.from_strings(types)))
         )
 
     def _get_schema_using_query(self, query: str) -> sch.Schema:
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import contextlib
 import inspect
+import os
+import queue
+import threading
 import typing
 from collections.abc import Mapping
 from pathlib import Path
@@ -50,6 +53,8 @@ except ImportError:
     RuntimeConfig = None
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     import pandas as pd
     import polars as pl
 
@@ -73,11 +78,56 @@ def as_nullable(dtype: dt.DataType) -> dt.DataType:
         return dtype.copy(nullable=True)
 
 
+def _hive_partitions(path: str) -> list[tuple[str, str]]:
+    """Infer hive partition columns from the `key=value` directories of `path`.
+
+    Only local directories whose data files all live under the same partition
+    keys are considered partitioned, ignoring hidden files and files starting
+    with an underscore. Keys that are also columns of the files are skipped.
+    Partition columns are typed as `string`: the only other partition type
+    DataFusion supports is a 32-bit `int`, which can't hold every integer.
+    """
+    import pyarrow.parquet as pq
+
+    root = Path(path)
+    if not root.is_dir():
+        return []
+
+    names = None
+    sample = None
+    for dirpath, _, filenames in os.walk(root):
+        # skip markers such as `_SUCCESS` and `.part-0.parquet.crc`
+        filenames = [name for name in filenames if not name.startswith(("_", "."))]
+        if not filenames:
+            continue
+        parts = [part.partition("=") for part in Path(dirpath).relative_to(root).parts]
+        keys = [key for key, sep, _ in parts if sep]
+        if not parts or len(keys) != len(parts) or names not in (None, keys):
+            return []
+        names = keys
+        if sample is None:
+            sample = next(
+                (
+                    os.path.join(dirpath, name)
+                    for name in filenames
+                    if name.endswith(".parquet")
+                ),
+                None,
+            )
+
+    if names is None:
+        return []
+
+    columns = set() if sample is None else set(pq.read_schema(sample).names)
+    return [(name, "string") for name in names if name not in columns]
+
+
 class Backend(
     SQLBackend, CanCreateCatalog, CanCreateDatabase, NoUrl, DirectPyArrowExampleLoader
 ):
     name = "datafusion"
     supports_arrays = True
+    supports_cache_spill = True
     compiler = sc.datafusion.compiler
 
     @property
@@ -254,14 +304,23 @@ class Backend(
             self.con.register_udf(udf)
 
     def _register_udfs(self, expr: ir.Expr) -> None:
+        registered = self._registered_udfs
+
         for udf_node in expr.op().find(ops.ScalarUDF):
             if udf_node.__input_type__ == InputType.PYARROW:
-                udf = self._compile_pyarrow_udf(udf_node)
-                self.con.register_udf(udf)
+                name = udf_node.__func_name__
+                if registered.get(name) is not type(udf_node):
+                    udf = self._compile_pyarrow_udf(udf_node)
+                    self.con.register_udf(udf)
+                    registered[name] = type(udf_node)
 
         for udf_node in expr.op().find(ops.ElementWiseVectorizedUDF):
-            udf = self._compile_elementwise_udf(udf_node)
-            self.con.register_udf(udf)
+            name = udf_node.func.__name__
+            definition = (udf_node.func, udf_node.input_type, udf_node.return_type)
+            if registered.get(name) != definition:
+                udf = self._compile_elementwise_udf(udf_node)
+                self.con.register_udf(udf)
+                registered[name] = definition
 
     def _compile_pyarrow_udf(self, udf_node):
         return df.udf(
@@ -432,7 +491,13 @@ class Backend(
         return self.table(table_name)
 
     def read_parquet(
-        self, path: str | Path, /, *, table_name: str | None = None, **kwargs: Any
+        self,
+        path: str | Path,
+        /,
+        *,
+        table_name: str | None = None,
+        hive_partitioning: bool = False,
+        **kwargs: Any,
     ) -> ir.Table:
         """Register a parquet file as a table in the current database.
 
@@ -443,6 +508,11 @@ class Backend(
         table_name
             An optional name to use for the created table. This defaults to
             a sequentially generated name.
+        hive_partitioning
+            Whether to infer the hive partition columns of a local directory
+            (e.g. `date` for `lake/date=2024-01-01/part-0.parquet`) as `string`
+            columns, so that filters on them skip reading the files of other
+            partitions. Ignored if `table_partition_cols` is passed.
         **kwargs
             Additional keyword arguments passed to DataFusion loading function.
 
@@ -453,6 +523,12 @@ class Backend(
         """
         path = normalize_filename(path)
         table_name = table_name or gen_name("read_parquet")
+        if (
+            hive_partitioning
+            and "table_partition_cols" not in kwargs
+            and (partitions := _hive_partitions(path))
+        ):
+            kwargs["table_partition_cols"] = partitions
         # Our other backends support overwriting views / tables when reregistering
         self.con.deregister_table(table_name)
         self.con.register_parquet(table_name, path, **kwargs)
@@ -504,12 +580,35 @@ class Backend(
         /,
         *,
         chunk_size: int = 1_000_000,
+        ordered: bool = True,
         **kwargs: Any,
     ) -> pa.ipc.RecordBatchReader:
+        """Execute expression and return an iterator of PyArrow record batches.
+
+        This method is eager and will execute the associated expression
+        immediately.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow
+        chunk_size
+            Maximum number of rows in each returned record batch.
+        ordered
+            Whether batches must be returned in the order of the result. If
+            `False`, each output partition of the query plan is drained on its
+            own thread and batches are returned as soon as they are ready.
+        kwargs
+            Keyword arguments
+
+        Returns
+        -------
+        RecordBatchReader
+            Collection of pyarrow `RecordBatch`s.
+        """
         pa = self._import_pyarrow()
 
-        self._register_udfs(expr)
-        self._register_in_memory_tables(expr)
+        self._run_pre_execute_hooks(expr)
 
         table_expr = expr.as_table()
         raw_sql = self.compile(table_expr, **kwargs)
@@ -519,25 +618,28 @@ class Backend(
         schema = sch.Schema(
             {name: as_nullable(typ) for name, typ in table_expr.schema().items()}
         )
-        names = schema.names
-
-        struct_schema = schema.as_struct().to_pyarrow()
-
-        def make_gen():
-            yield from (
-                # convert the renamed + casted columns into a record batch
-                pa.RecordBatch.from_struct_array(
-                    # rename columns to match schema because datafusion lowercases things
-                    pa.RecordBatch.from_arrays(batch.to_pyarrow().columns, names=names)
-                    # cast the struct array to the desired types to work around
-                    # https://github.com/apache/arrow-datafusion-python/issues/534
-                    .to_struct_array()
-                    .cast(struct_schema, safe=False)
-                )
-                for batch in frame.execute_stream()
+        target_schema = schema.to_pyarrow()
+
+        def convert(batch: df.RecordBatch) -> pa.RecordBatch:
+            # rename columns to match schema because datafusion lowercases
+            # things, and cast to the desired types to work around
+            # https://github.com/apache/arrow-datafusion-python/issues/534
+            return pa.RecordBatch.from_arrays(
+                [
+                    column
+                    if column.type == field.type
+                    else column.cast(field.type, safe=False)
+                    for column, field in zip(batch.to_pyarrow().columns, target_schema)
+                ],
+                schema=target_schema,
             )
 
-        return pa.ipc.RecordBatchReader.from_batches(schema.to_pyarrow(), make_gen())
+        if ordered:
+            batches = map(convert, frame.execute_stream())
+        else:
+            batches = _drain_partitions(frame.execute_stream_partitioned(), convert)
+
+        return pa.ipc.RecordBatchReader.from_batches(target_schema, batches)
 
     def to_pyarrow(
         self,
@@ -694,6 +796,74 @@ class Backend(
     def _create_cached_table(self, name: str, expr: ir.Table) -> ir.Table:
         return self.create_table(name, expr, schema=expr.schema())
 
+    def _register_spilled_table(self, name: str, path: Path) -> ir.Table:
+        table = self._read_spilled_table(path)
+        self.con.register_record_batches(name, [table.to_batches()])
+        return self.table(name)
+
+    def _drop_spilled_table(self, name: str) -> None:
+        self.con.deregister_table(name)
+
+
+def _drain_partitions(
+    streams: list[df.RecordBatchStream], convert: Callable[[Any], pa.RecordBatch]
+) -> Iterator[pa.RecordBatch]:
+    """Drain each of `streams` on its own thread, yielding converted batches.
+
+    Batches are yielded in the order they are produced, and at most two per
+    stream are buffered at a time. Errors raised while draining a stream are
+    re-raised in the consumer.
+    """
+    if len(streams) == 1:
+        yield from map(convert, streams[0])
+        return
+
+    done = object()
+    results = queue.Queue(maxsize=2 * len(streams))
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            else:
+                return True
+        return False
+
+    def drain(stream):
+        try:
+            for batch in stream:
+                if not put(convert(batch)):
+                    return
+        except Exception as e:  # noqa: BLE001
+            put(e)
+        finally:
+            put(done)
+
+    threads = [
+        threading.Thread(target=drain, args=(stream,), daemon=True)
+        for stream in streams
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        remaining = len(threads)
+        while remaining:
+            item = results.get()
+            if item is done:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
 
 @contextlib.contextmanager
 def _create_and_drop_memtable(_conn, table_name, tmp_name, overwrite):
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pyarrow as pa
+import pytest
+from datafusion import SessionConfig, SessionContext
+
+import ibis
+
+
+@pytest.fixture
+def partitioned_con():
+    return ibis.datafusion.connect(
+        SessionContext(SessionConfig().with_target_partitions(4))
+    )
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_to_pyarrow_batches_partitioned(partitioned_con, ordered):
+    t = ibis.memtable(
+        pa.table({"Key": [str(i % 10) for i in range(10_000)], "x": range(10_000)})
+    )
+    expr = t.group_by("Key").agg(n=t.x.count().cast("int32"), total=t.x.sum())
+
+    reader = partitioned_con.to_pyarrow_batches(expr, ordered=ordered)
+    assert reader.schema.equals(expr.schema().to_pyarrow())
+
+    result = reader.read_all().sort_by("Key")
+    assert result["Key"].to_pylist() == list(map(str, range(10)))
+    assert result["n"].to_pylist() == [1_000] * 10
+    assert result["total"].to_pylist() == [sum(range(i, 10_000, 10)) for i in range(10)]
+
+
+def test_to_pyarrow_batches_unordered_error(partitioned_con):
+    t = ibis.memtable({"x": ["1", "2", "a"] * 1_000})
+
+    with pytest.raises(Exception, match="Cannot cast"):
+        partitioned_con.to_pyarrow_batches(
+            t.select(y=t.x.cast("int64")), ordered=False
+        ).read_all()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import ibis
+from ibis.backends.datafusion import _hive_partitions
+
+
+def write_partitioned(root, **columns):
+    for day in (1, 2, 3):
+        directory = root / f"date=2024-01-0{day}" / f"hour={day}"
+        directory.mkdir(parents=True)
+        pq.write_table(
+            pa.table({"x": range(10), "y": ["a"] * 10, **columns}),
+            directory / "part-0.parquet",
+        )
+    return root
+
+
+def test_hive_partitions(tmp_path):
+    root = write_partitioned(tmp_path / "lake")
+    assert _hive_partitions(str(root)) == [("date", "string"), ("hour", "string")]
+
+    (root / "_SUCCESS").touch()
+    assert _hive_partitions(str(root)) == [("date", "string"), ("hour", "string")]
+
+    (root / "stray.parquet").touch()
+    assert _hive_partitions(str(root)) == []
+    assert _hive_partitions(str(tmp_path / "missing")) == []
+
+
+def test_hive_partitions_skip_file_columns(tmp_path):
+    root = write_partitioned(tmp_path / "lake", hour=[0] * 10)
+    assert _hive_partitions(str(root)) == [("date", "string")]
+
+    con = ibis.datafusion.connect()
+    t = con.read_parquet(root, hive_partitioning=True)
+    assert t.schema() == ibis.schema(
+        {"x": "int64", "y": "string", "hour": "int64", "date": "!string"}
+    )
+    assert t.count().execute() == 30
+
+
+def test_read_parquet_hive_partitioning(tmp_path):
+    con = ibis.datafusion.connect()
+    root = write_partitioned(tmp_path / "lake")
+
+    # partition columns are only inferred when asked for
+    assert con.read_parquet(root).schema() == ibis.schema({"x": "int64", "y": "string"})
+
+    t = con.read_parquet(root, hive_partitioning=True)
+    assert t.schema() == ibis.schema(
+        {"x": "int64", "y": "string", "date": "!string", "hour": "!string"}
+    )
+
+    expr = t.filter(t.date == "2024-01-02", t.x > 5).select("x", "hour")
+    assert expr.count().execute() == 4
+
+    # only the files of the selected partition are scanned
+    plan = con.con.sql(f"EXPLAIN {con.compile(expr)}").to_pandas().plan.iloc[-1]
+    assert "date=2024-01-02" in plan
+    assert "date=2024-01-01" not in plan
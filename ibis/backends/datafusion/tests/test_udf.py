@@ -3,6 +3,7 @@ from __future__ import annotations
 import pandas.testing as tm
 import pytest
 
+import ibis
 import ibis.expr.datatypes as dt
 import ibis.expr.types as ir
 from ibis import udf
@@ -74,3 +75,26 @@ def test_builtin_agg_udf_filtered(con):
         """Median of a column."""
 
     median(con.tables.batting.G).execute()
+
+
+def test_pyarrow_udf_registered_once(mocker):
+    con = ibis.datafusion.connect()
+
+    @udf.scalar.pyarrow(name="plus")
+    def plus_one(x: int) -> int:
+        return pc.add(x, 1)
+
+    @udf.scalar.pyarrow(name="plus")
+    def plus_two(x: int) -> int:
+        return pc.add(x, 2)
+
+    spy = mocker.spy(con, "_compile_pyarrow_udf")
+
+    assert con.execute(plus_one(ibis.literal(1, type="int64"))) == 2
+    assert con.execute(plus_one(ibis.literal(2, type="int64"))) == 3
+    assert spy.call_count == 1
+
+    # both udfs share a name, so switching between them re-registers
+    assert con.execute(plus_two(ibis.literal(1, type="int64"))) == 3
+    assert con.execute(plus_one(ibis.literal(1, type="int64"))) == 2
+    assert spy.call_count == 3
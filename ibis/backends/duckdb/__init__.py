@@ -22,14 +22,25 @@ import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
-from ibis.backends import CanCreateDatabase, DirectExampleLoader, UrlFromPath
+from ibis.backends import (
+    CanCreateDatabase,
+    DirectExampleLoader,
+    UrlFromPath,
+)
 from ibis.backends.sql import SQLBackend
 from ibis.backends.sql.compilers.base import STAR, AlterTable, C, RenameTable
+from ibis.backends.sql.incremental import CanMaterializeIncrementally
 from ibis.common.dispatch import lazy_singledispatch
 from ibis.expr.operations.udf import InputType
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+    from collections.abc import (
+        Iterable,
+        Iterator,
+        Mapping,
+        MutableMapping,
+        Sequence,
+    )
 
     import pandas as pd
     import polars as pl
@@ -38,6 +49,7 @@ if TYPE_CHECKING:
     import torch
     from fsspec import AbstractFileSystem
 
+    from ibis.backends.duckdb.dataset import Dataset
     from ibis.expr.schema import SchemaLike
 
 
@@ -47,6 +59,21 @@ _UDF_INPUT_TYPE_MAPPING = {
 }
 
 
+def _read_option(key: str, value: Any) -> sge.Expression:
+    """Convert a keyword argument of a DuckDB file reader to a SQL option."""
+    # readers take structs rather than maps, e.g. `hive_types={"date": "DATE"}`
+    if isinstance(value, dict):
+        value = sge.Struct(
+            expressions=[
+                sge.PropertyEQ(this=sge.to_identifier(k), expression=sge.convert(v))
+                for k, v in value.items()
+            ]
+        )
+    else:
+        value = sge.convert(value)
+    return C[key].eq(value)
+
+
 class _Settings:
     def __init__(self, con: duckdb.DuckDBPyConnection) -> None:
         self.con = con
@@ -66,9 +93,16 @@ class _Settings:
         return repr(self.con.sql("from duckdb_settings()"))
 
 
-class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, DirectExampleLoader):
+class Backend(
+    SQLBackend,
+    CanCreateDatabase,
+    CanMaterializeIncrementally,
+    UrlFromPath,
+    DirectExampleLoader,
+):
     name = "duckdb"
     compiler = sc.duckdb.compiler
+    supports_cache_spill = True
 
     @property
     def settings(self) -> _Settings:
@@ -107,6 +141,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, DirectExampleLoader):
         database: str | None = None,
         temp: bool = False,
         overwrite: bool = False,
+        incremental_on: str | None = None,
     ):
         """Create a table in DuckDB.
 
@@ -132,7 +167,25 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, DirectExampleLoader):
         overwrite
             If `True`, replace the table if it already exists, otherwise fail
             if the table exists
+        incremental_on
+            Name of a monotonically increasing column of the source of `obj`,
+            such as an event timestamp. The table then keeps track of the
+            largest value it has seen, and
+            [`refresh`](#ibis.backends.duckdb.Backend.refresh) only computes the
+            rows added since. `obj` must be a table expression over a single
+            table made of filters and projections, optionally followed by an
+            aggregation with `sum`, `count`, `min` or `max` metrics.
         """
+        if incremental_on is not None:
+            return self._create_incremental_table(
+                name,
+                obj,
+                incremental_on=incremental_on,
+                database=database,
+                temp=temp,
+                overwrite=overwrite,
+            )
+
         table_loc = self._to_sqlglot_table(database)
 
         if getattr(table_loc, "catalog", False) and temp:
@@ -157,83 +210,137 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, DirectExampleLoader):
             catalog = "temp"
             database = "main"
 
-        if obj is not None:
-            if not isinstance(obj, ir.Expr):
-                table = ibis.memtable(obj)
+        with contextlib.ExitStack() as stack:
+            if obj is not None:
+                table = stack.enter_context(self._in_memory_scan(obj))
+                self._run_pre_execute_hooks(table)
+
+                query = self.compiler.to_sqlglot(table)
             else:
-                table = obj
+                query = None
 
-            self._run_pre_execute_hooks(table)
+            if schema is None:
+                schema = table.schema()
+            else:
+                schema = ibis.schema(schema)
 
-            query = self.compiler.to_sqlglot(table)
-        else:
-            query = None
+            if null_fields := schema.null_fields:
+                raise exc.IbisTypeError(
+                    "DuckDB does not support creating tables with NULL typed columns. "
+                    "Ensure that every column has non-NULL type. "
+                    f"NULL columns: {null_fields}"
+                )
 
-        if schema is None:
-            schema = table.schema()
-        else:
-            schema = ibis.schema(schema)
+            if overwrite:
+                temp_name = util.gen_name("duckdb_table")
+            else:
+                temp_name = name
 
-        if null_fields := schema.null_fields:
-            raise exc.IbisTypeError(
-                "DuckDB does not support creating tables with NULL typed columns. "
-                "Ensure that every column has non-NULL type. "
-                f"NULL columns: {null_fields}"
+            initial_table = sg.table(
+                temp_name, catalog=catalog, db=database, quoted=quoted
+            )
+            target = sge.Schema(
+                this=initial_table, expressions=schema.to_sqlglot(dialect)
             )
 
-        if overwrite:
-            temp_name = util.gen_name("duckdb_table")
-        else:
-            temp_name = name
-
-        initial_table = sg.table(temp_name, catalog=catalog, db=database, quoted=quoted)
-        target = sge.Schema(this=initial_table, expressions=schema.to_sqlglot(dialect))
-
-        create_stmt = sge.Create(
-            kind="TABLE",
-            this=target,
-            properties=sge.Properties(expressions=properties),
-        )
+            create_stmt = sge.Create(
+                kind="TABLE",
+                this=target,
+                properties=sge.Properties(expressions=properties),
+            )
 
-        # This is the same table as initial_table unless overwrite == True
-        final_table = sg.table(name, catalog=catalog, db=database, quoted=quoted)
-        with self._safe_raw_sql(create_stmt) as cur:
-            if query is not None:
-                insert_stmt = sge.insert(query, into=initial_table).sql(dialect)
-                cur.execute(insert_stmt).fetchall()
+            # This is the same table as initial_table unless overwrite == True
+            final_table = sg.table(name, catalog=catalog, db=database, quoted=quoted)
+            with self._safe_raw_sql(create_stmt) as cur:
+                if query is not None:
+                    insert_stmt = sge.insert(query, into=initial_table).sql(dialect)
+                    cur.execute(insert_stmt).fetchall()
 
-            if overwrite:
-                cur.execute(
-                    sge.Drop(kind="TABLE", this=final_table, exists=True).sql(dialect)
-                )
-                # TODO: This branching should be removed once DuckDB >=0.9.3 is
-                # our lower bound (there's an upstream bug in 0.9.2 that
-                # disallows renaming temp tables)
-                # We should (pending that release) be able to remove the if temp
-                # branch entirely.
-                if temp:
+                if overwrite:
                     cur.execute(
-                        sge.Create(
-                            kind="TABLE",
-                            this=final_table,
-                            expression=sg.select(STAR).from_(initial_table),
-                            properties=sge.Properties(expressions=properties),
-                        ).sql(dialect)
-                    )
-                    cur.execute(
-                        sge.Drop(kind="TABLE", this=initial_table, exists=True).sql(
+                        sge.Drop(kind="TABLE", this=final_table, exists=True).sql(
                             dialect
                         )
                     )
-                else:
-                    cur.execute(
-                        AlterTable(
-                            this=initial_table, actions=[RenameTable(this=final_table)]
-                        ).sql(dialect)
-                    )
+                    # TODO: This branching should be removed once DuckDB >=0.9.3 is
+                    # our lower bound (there's an upstream bug in 0.9.2 that
+                    # disallows renaming temp tables)
+                    # We should (pending that release) be able to remove the if temp
+                    # branch entirely.
+                    if temp:
+                        cur.execute(
+                            sge.Create(
+                                kind="TABLE",
+                                this=final_table,
+                                expression=sg.select(STAR).from_(initial_table),
+                                properties=sge.Properties(expressions=properties),
+                            ).sql(dialect)
+                        )
+                        cur.execute(
+                            sge.Drop(kind="TABLE", this=initial_table, exists=True).sql(
+                                dialect
+                            )
+                        )
+                    else:
+                        cur.execute(
+                            AlterTable(
+                                this=initial_table,
+                                actions=[RenameTable(this=final_table)],
+                            ).sql(dialect)
+                        )
 
         return self.table(name, database=(catalog, database))
 
+    def insert(
+        self,
+        name: str,
+        /,
+        obj: pd.DataFrame
+        | pa.Table
+        | pa.RecordBatchReader
+        | pl.DataFrame
+        | ir.Table
+        | list
+        | dict,
+        *,
+        database: str | None = None,
+        overwrite: bool = False,
+    ) -> None:
+        """Insert data into a table.
+
+        Arrow tables, datasets, record batch readers and polars frames are
+        scanned in place and inserted with a single `INSERT INTO ... SELECT`
+        statement.
+
+        Parameters
+        ----------
+        name
+            The name of the table to which data needs will be inserted
+        obj
+            The source data or expression to insert
+        database
+            Name of the attached database that the table is located in.
+
+            For multi-level table hierarchies, you can pass in a dotted string
+            path like `"catalog.database"` or a tuple of strings like
+            `("catalog", "database")`.
+        overwrite
+            If `True` then replace existing contents of table
+        """
+        table_loc = self._to_sqlglot_table(database)
+        catalog, db = self._to_catalog_db_tuple(table_loc)
+
+        if overwrite:
+            self.truncate_table(name, database=(catalog, db))
+
+        with self._in_memory_scan(obj) as table:
+            self._run_pre_execute_hooks(table)
+            query = self._build_insert_from_table(
+                target=name, source=table, db=db, catalog=catalog
+            )
+            with self._safe_raw_sql(query):
+                pass
+
     def table(self, name: str, /, *, database: str | None = None) -> ir.Table:
         """Construct a table expression.
 
@@ -309,17 +416,74 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, DirectExampleLoader):
         nullables = meta["null"].to_pylist()
 
         type_mapper = self.compiler.type_mapper
-        return sch.Schema(
-            {
-                name: type_mapper.from_string(typ, nullable=null == "YES")
-                for name, typ, null in zip(names, types, nullables)
-            }
+        dtypes = type_mapper.from_strings(types, [null == "YES" for null in nullables])
+        return sch.Schema(dict(zip(names, dtypes)))
+
+    def _get_schemas(
+        self,
+        names: list[str],
+        *,
+        catalog: str | None = None,
+        database: str | None = None,
+    ) -> dict[str, sch.Schema]:
+        # like `DESCRIBE`, prefer temporary tables when no catalog is given
+        catalogs = [catalog] if catalog is not None else ["temp", self.current_catalog]
+        database = database or self.current_database
+
+        sql = (
+            sg.select(
+                C.table_catalog,
+                C.table_name,
+                C.column_name,
+                C.data_type,
+                C.is_nullable,
+            )
+            .from_(sg.table("columns", db="information_schema"))
+            .where(
+                C.table_catalog.isin(*map(sge.convert, catalogs)),
+                C.table_schema.eq(sge.convert(database)),
+                C.table_name.isin(*map(sge.convert, names)),
+            )
+            .order_by(C.ordinal_position)
+            .sql(self.dialect)
         )
+        meta = self.con.execute(sql).fetch_arrow_table()
+
+        columns = {}
+        for table_catalog, table_name, name, typ, null in zip(
+            *(meta[col].to_pylist() for col in meta.column_names)
+        ):
+            columns.setdefault((table_name, table_catalog), []).append(
+                (name, typ, null == "YES")
+            )
+
+        type_mapper = self.compiler.type_mapper
+        schemas = {}
+        for name in names:
+            for table_catalog in catalogs:
+                if (fields := columns.get((name, table_catalog))) is not None:
+                    cols, types, nullables = zip(*fields)
+                    dtypes = type_mapper.from_strings(types, nullables)
+                    schemas[name] = sch.Schema(dict(zip(cols, dtypes)))
+                    break
+        return schemas
 
     @contextlib.contextmanager
     def _safe_raw_sql(self, *args, **kwargs):
         yield self.raw_sql(*args, **kwargs)
 
+    @contextlib.contextmanager
+    def begin(self):
+        con = self.con
+        con.begin()
+        try:
+            yield con
+        except Exception:
+            con.rollback()
+            raise
+        else:
+            con.commit()
+
     def list_catalogs(self, *, like: str | None = None) -> list[str]:
         col = "catalog_name"
         query = sg.select(sge.Distinct(expressions=[sg.column(col)])).from_(
@@ -681,7 +845,7 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, DirectExampleLoader):
         # TODO: clean this up
         # We want to _usually_ quote arguments but if we quote `columns` it messes
         # up DuckDB's struct parsing.
-        options = [C[key].eq(sge.convert(val)) for key, val in kwargs.items()]
+        options = [_read_option(key, val) for key, val in kwargs.items()]
 
         def make_struct_argument(obj: Mapping[str, str | dt.DataType]) -> sge.Struct:
             expressions = []
@@ -803,15 +967,85 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, DirectExampleLoader):
         if any(path.startswith(("http://", "https://", "s3://")) for path in paths):
             self._load_extensions(["httpfs"])
 
-        options = [
-            sg.to_identifier(key).eq(sge.convert(val)) for key, val in kwargs.items()
-        ]
+        options = [_read_option(key, val) for key, val in kwargs.items()]
         self._create_temp_view(
             table_name,
             sg.select(STAR).from_(self.compiler.f.read_parquet(paths, *options)),
         )
         return self.table(table_name)
 
+    def dataset(
+        self,
+        path: str | Path,
+        /,
+        *,
+        format: Literal["parquet", "csv"] = "parquet",
+        partitions: Mapping[str, str | dt.DataType] | None = None,
+        **kwargs: Any,
+    ) -> Dataset:
+        """Discover the data files under `path` without reading them.
+
+        Unlike [`read_parquet`](#ibis.backends.duckdb.Backend.read_parquet)
+        and [`read_csv`](#ibis.backends.duckdb.Backend.read_csv), the files
+        are listed up front. Their hive partition values (e.g.
+        `lake/date=2024-01-01/part-0.parquet`) become typed columns that
+        select the files to read, and the number of files and bytes a query
+        will read is known before it runs.
+
+        Parameters
+        ----------
+        path
+            A file or a directory of files, locally or in object storage.
+        format
+            The format of the files.
+        partitions
+            An optional mapping of a **subset** of partition column names to
+            their types. The types of the other partition columns are inferred
+            from their values.
+        **kwargs
+            Additional keyword arguments passed to `read_parquet` or
+            `read_csv` when the dataset is read, such as `union_by_name=True`
+            for files with different columns.
+
+        Returns
+        -------
+        Dataset
+            The dataset.
+
+        Examples
+        --------
+        >>> import ibis
+        >>> import pyarrow as pa
+        >>> import pyarrow.parquet as pq
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> lake = Path(tempfile.mkdtemp())
+        >>> for day in ("2024-01-01", "2024-01-02"):
+        ...     (lake / f"date={day}").mkdir()
+        ...     pq.write_table(pa.table({"x": [1, 2]}), lake / f"date={day}" / "0.parquet")
+        >>> con = ibis.duckdb.connect()
+        >>> ds = con.dataset(lake)
+        >>> ds.partitions
+        ibis.Schema {
+          date  date
+        }
+        >>> ds = ds.filter(ds.date > ibis.date("2024-01-01"))
+        >>> ds.size().files
+        1
+        >>> ds.to_table().count().execute()
+        2
+
+        """
+        from ibis.backends.duckdb.dataset import Dataset
+
+        path = util.normalize_filename(path)
+        if path.startswith(("http://", "https://", "s3://")):
+            self._load_extensions(["httpfs"])
+
+        return Dataset._discover(
+            self, path, format=format, partitions=partitions, options=kwargs
+        )
+
     def read_delta(
         self, path: str | Path, /, *, table_name: str | None = None, **kwargs: Any
     ) -> ir.Table:
@@ -1444,10 +1678,13 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, DirectExampleLoader):
         rel = self._to_duckdb_relation(expr, params=params, limit=limit, **kwargs)
         table = rel.arrow()
 
+        arrow_dtypes = ibis.options.nested_arrow_dtypes
         df = pd.DataFrame(
             {
                 name: (
-                    col.to_pylist()
+                    pd.arrays.ArrowExtensionArray(col)
+                    if arrow_dtypes and pat.is_nested(col.type)
+                    else col.to_pylist()
                     if (
                         pat.is_nested(col.type)
                         or
@@ -1744,14 +1981,10 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, DirectExampleLoader):
         rows = rows.to_pydict()
 
         type_mapper = self.compiler.type_mapper
-        return sch.Schema(
-            {
-                name: type_mapper.from_string(typ, nullable=null == "YES")
-                for name, typ, null in zip(
-                    rows["column_name"], rows["column_type"], rows["null"]
-                )
-            }
+        dtypes = type_mapper.from_strings(
+            rows["column_type"], [null == "YES" for null in rows["null"]]
         )
+        return sch.Schema(dict(zip(rows["column_name"], dtypes)))
 
     def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
         data = op.data
@@ -1760,10 +1993,103 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, DirectExampleLoader):
         try:
             obj = data.to_pyarrow_dataset(schema)
         except AttributeError:
-            obj = data.to_pyarrow(schema)
+            # polars frames are scanned in place when their Arrow
+            # representation already matches the memtable schema, avoiding a
+            # cast of e.g. large_string columns to string
+            if _arrow_scan_schema(data.obj) == schema:
+                obj = data.obj
+            else:
+                obj = data.to_pyarrow(schema)
 
         self.con.register(op.name, obj)
 
+    @contextlib.contextmanager
+    def _in_memory_scan(self, obj: Any) -> Iterator[ir.Table]:
+        """Yield a table expression that reads from `obj`.
+
+        Arrow tables, datasets, record batch readers and polars frames are
+        registered as a DuckDB replacement scan for the duration of the
+        context, so their data is read in place without a round trip through
+        pandas or Python objects. Anything else goes through `ibis.memtable`.
+        """
+        if isinstance(obj, ir.Expr):
+            yield obj
+        elif (schema := _arrow_scan_schema(obj)) is None:
+            yield ibis.memtable(obj)
+        else:
+            name = util.gen_name("duckdb_arrow_scan")
+            self.con.register(name, obj)
+            try:
+                yield ops.UnboundTable(name, schema).to_expr()
+            finally:
+                self.con.unregister(name)
+
+    def _database_path(self, catalog: str | None = None) -> Path | None:
+        query = sg.select("path").from_("duckdb_databases()")
+        query = query.where(
+            sg.column("database_name").eq(
+                sge.convert(catalog)
+                if catalog is not None
+                else self.compiler.f.current_database()
+            )
+        )
+        with self._safe_raw_sql(query) as cur:
+            rows = cur.fetchall()
+        if not rows or rows[0][0] is None:
+            return None
+        return Path(rows[0][0]).resolve()
+
+    def _cache_identity(self) -> str | None:
+        if (path := self._database_path()) is None:
+            return None
+        return f"duckdb:{path}"
+
+    def _table_version(self, op: ops.DatabaseTable) -> str | None:
+        # DuckDB doesn't version tables, but writes change the database file
+        # or its write-ahead log. That only tracks base tables stored in the
+        # main database file; temporary tables, views (which can read other
+        # files) and tables of attached databases have no version.
+        catalog = self.current_catalog
+        if op.namespace.catalog not in (None, catalog):
+            return None
+        if (path := self._database_path(catalog)) is None:
+            return None
+
+        query = (
+            sg.select(C.database_name, C.temporary)
+            .from_(self.compiler.f.duckdb_tables())
+            .where(
+                C.table_name.eq(sge.convert(op.name)),
+                C.schema_name.eq(
+                    sge.convert(op.namespace.database or self.current_database)
+                ),
+            )
+        )
+        with self._safe_raw_sql(query) as cur:
+            tables = cur.fetchall()
+        # unqualified names resolve to temporary tables first
+        if op.namespace.catalog is None and any(temp for _, temp in tables):
+            return None
+        if (catalog, False) not in tables:
+            return None
+
+        parts = []
+        for file in (path, path.with_name(f"{path.name}.wal")):
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                parts.append("")
+            else:
+                parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        return ";".join(parts)
+
+    def _register_spilled_table(self, name: str, path: Path) -> ir.Table:
+        self.con.register(name, self._read_spilled_table(path))
+        return self.table(name)
+
+    def _drop_spilled_table(self, name: str) -> None:
+        self.con.unregister(name)
+
     def _finalize_memtable(self, name: str) -> None:
         # if we don't aggressively unregister tables duckdb will keep a
         # reference to every memtable ever registered, even if there's no
@@ -1776,17 +2102,23 @@ class Backend(SQLBackend, CanCreateDatabase, UrlFromPath, DirectExampleLoader):
 
     def _register_udfs(self, expr: ir.Expr) -> None:
         con = self.con
+        registered = self._registered_udfs
 
         for udf_node in expr.op().find(ops.ScalarUDF):
+            name = type(udf_node).__name__
+            if registered.get(name) is type(udf_node):
+                continue
+
             register_func = getattr(
                 self, f"_register_{udf_node.__input_type__.name.lower()}_udf"
             )
             with contextlib.suppress(duckdb.InvalidInputException):
-                con.remove_function(udf_node.__class__.__name__)
+                con.remove_function(name)
 
             registration_func = register_func(udf_node)
             if registration_func is not None:
                 registration_func(con)
+            registered[name] = type(udf_node)
 
     def _register_udf(self, udf_node: ops.ScalarUDF):
         type_mapper = self.compiler.type_mapper
@@ -1847,3 +2179,24 @@ def _pyarrow_rbr(source, table_name, _conn, **_: Any):
     # Ensure the reader isn't marked as started, in case the name is
     # being overwritten.
     _conn._record_batch_readers_consumed[table_name] = False
+
+
+@lazy_singledispatch
+def _arrow_scan_schema(source: Any) -> sch.Schema | None:
+    """Return the schema of `source` if DuckDB can scan it in place."""
+    return None
+
+
+@_arrow_scan_schema.register("pyarrow.Table")
+@_arrow_scan_schema.register("pyarrow.RecordBatchReader")
+@_arrow_scan_schema.register("pyarrow.dataset.Dataset")
+def _arrow_scan_schema_pyarrow(source) -> sch.Schema:
+    return sch.Schema.from_pyarrow(source.schema)
+
+
+@_arrow_scan_schema.register("polars.DataFrame")
+@_arrow_scan_schema.register("polars.LazyFrame")
+def _arrow_scan_schema_polars(source) -> sch.Schema:
+    from ibis.formats.polars import PolarsSchema
+
+    return PolarsSchema.to_ibis(source.collect_schema())
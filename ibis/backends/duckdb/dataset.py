@@ -0,0 +1,323 @@
+"""Partitioned file datasets for the DuckDB backend."""
+
+from __future__ import annotations
+
+import datetime
+import os
+import urllib.parse
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+import ibis
+import ibis.common.exceptions as exc
+import ibis.expr.datatypes as dt
+import ibis.expr.schema as sch
+import ibis.expr.types as ir
+from ibis import util
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from pathlib import Path
+
+    from ibis.backends.duckdb import Backend
+
+# the directory name hive uses for NULL partition values
+_HIVE_NULL = "__HIVE_DEFAULT_PARTITION__"
+
+# names of the listing columns; directories starting with an underscore are
+# never partitions, so these can't clash with partition columns
+_PATH = "_path"
+_SIZE = "_size"
+
+# candidate partition types in the order they are tried, with their parsers
+_PARTITION_TYPES = (
+    (dt.int64, int),
+    (dt.date, datetime.date.fromisoformat),
+    (dt.timestamp, datetime.datetime.fromisoformat),
+)
+
+
+class DatasetSize(NamedTuple):
+    """The files a dataset reads."""
+
+    files: int
+    """Number of files."""
+    bytes: int
+    """Total size of the files in bytes."""
+
+
+# matches the data files under a directory, skipping markers
+_DATA_FILES = "**/[!_.]*"
+
+
+def _list_files(path: str) -> tuple[str | None, list[tuple[str, str, int]]]:
+    """Return a glob and the `(uri, relative path, size)` of the data files.
+
+    The glob matches exactly the data files under `path`, or is
+    [](`None`) when no glob does.
+    """
+    import pyarrow.fs as pafs
+
+    if "://" in path:
+        fs, root = pafs.FileSystem.from_uri(path)
+        scheme = path.partition("://")[0]
+        prefix = f"{scheme}://"
+    else:
+        fs, root, prefix = pafs.LocalFileSystem(), os.path.abspath(path), ""
+
+    info = fs.get_file_info(root)
+    if info.type == pafs.FileType.NotFound:
+        raise FileNotFoundError(path)
+    elif info.type == pafs.FileType.File:
+        infos = [info]
+        glob = prefix + info.path
+        root = info.path.rpartition("/")[0]
+    else:
+        infos = fs.get_file_info(pafs.FileSelector(root, recursive=True))
+        glob = f"{prefix}{root}/{_DATA_FILES}"
+        if any(char in root for char in "*?[{"):
+            glob = None
+
+    files = []
+    for info in infos:
+        if info.type != pafs.FileType.File:
+            continue
+        relative = info.path[len(root) :].lstrip("/")
+        *directories, name = relative.split("/")
+        # skip markers such as `_SUCCESS` and `.part-0.parquet.crc`
+        if name.startswith(("_", ".")):
+            continue
+        elif any(part.startswith(("_", ".")) for part in directories):
+            # such as `_temporary/part-0.parquet`, which the glob matches
+            glob = None
+        else:
+            files.append((prefix + info.path, relative, info.size))
+    return glob, sorted(files)
+
+
+def _infer_partition_type(values: Sequence[str | None]) -> dt.DataType:
+    for dtype, parse in _PARTITION_TYPES:
+        try:
+            for value in values:
+                if value is not None:
+                    parse(value)
+        except ValueError:
+            continue
+        return dtype
+    return dt.string
+
+
+def _partition_values(relative: str) -> dict[str, str | None]:
+    values = {}
+    for part in relative.split("/")[:-1]:
+        key, sep, value = part.partition("=")
+        if sep:
+            value = urllib.parse.unquote(value)
+            values[key] = None if value == _HIVE_NULL else value
+    return values
+
+
+class Dataset:
+    """A set of data files, possibly hive partitioned, read as one table.
+
+    Datasets are created with [`dataset`](#ibis.backends.duckdb.Backend.dataset).
+    Partition columns are accessed like table columns and can be used in
+    [`filter`](#ibis.backends.duckdb.dataset.Dataset.filter) to skip entire
+    files before anything is read.
+    """
+
+    def __init__(
+        self,
+        backend: Backend,
+        listing: ir.Table,
+        *,
+        glob: str | None,
+        format: Literal["parquet", "csv"],
+        partitions: sch.Schema,
+        options: Mapping[str, Any],
+        predicates: Sequence[ir.BooleanValue] = (),
+    ) -> None:
+        self._backend = backend
+        self._listing = listing
+        self._glob = glob
+        self._predicates = tuple(predicates)
+        self._format = format
+        self._partitions = partitions
+        self._options = options
+
+    @classmethod
+    def _discover(
+        cls,
+        backend: Backend,
+        path: str | Path,
+        /,
+        *,
+        format: Literal["parquet", "csv"],
+        partitions: Mapping[str, str | dt.DataType] | None,
+        options: Mapping[str, Any],
+    ) -> Dataset:
+        if format not in ("parquet", "csv"):
+            raise exc.IbisInputError(
+                f"Unsupported dataset format {format!r}, expected 'parquet' or 'csv'"
+            )
+
+        glob, files = _list_files(util.normalize_filename(path))
+        if not files:
+            raise exc.IbisInputError(f"No data files found in {path!r}")
+
+        values = [_partition_values(relative) for _, relative, _ in files]
+        names = list(values[0])
+        if any(list(row) != names for row in values):
+            raise exc.IbisInputError(
+                f"Files in {path!r} are not consistently hive partitioned"
+            )
+
+        explicit = {} if partitions is None else dict(partitions)
+        if unknown := explicit.keys() - set(names):
+            raise exc.IbisInputError(
+                f"Unknown partition columns {sorted(unknown)}; found {names}"
+            )
+        schema = sch.Schema(
+            {
+                name: dt.dtype(explicit[name])
+                if name in explicit
+                else _infer_partition_type([row[name] for row in values])
+                for name in names
+            }
+        )
+
+        columns = {
+            _PATH: [uri for uri, _, _ in files],
+            _SIZE: [size for *_, size in files],
+            **{name: [row[name] for row in values] for name in names},
+        }
+        listing = ibis.memtable(
+            columns,
+            schema={_PATH: "string", _SIZE: "int64", **dict.fromkeys(names, "string")},
+        ).cast(dict(schema.items()))
+        return cls(
+            backend,
+            listing,
+            glob=glob,
+            format=format,
+            partitions=schema,
+            options=options,
+        )
+
+    @property
+    def partitions(self) -> sch.Schema:
+        """The hive partition columns of the dataset and their types."""
+        return self._partitions
+
+    @property
+    def files(self) -> ir.Table:
+        """The `_path`, `_size` and partition values of the files that are read."""
+        if self._predicates:
+            return self._listing.filter(*self._predicates)
+        return self._listing
+
+    def __getitem__(self, name: str) -> ir.Column:
+        if name not in self._partitions:
+            raise KeyError(f"{name!r} is not a partition column")
+        return self._listing[name]
+
+    def __getattr__(self, name: str) -> ir.Column:
+        if name.startswith("_") or name not in self._partitions:
+            raise AttributeError(f"{type(self).__name__} has no attribute {name!r}")
+        return self._listing[name]
+
+    def __repr__(self) -> str:
+        partitions = list(self._partitions)
+        return (
+            f"{type(self).__name__}(format={self._format!r}, partitions={partitions})"
+        )
+
+    def filter(self, *predicates: ir.BooleanValue) -> Dataset:
+        """Select the files whose partition values satisfy `predicates`.
+
+        Parameters
+        ----------
+        predicates
+            Boolean expressions over the partition columns of the dataset.
+
+        Returns
+        -------
+        Dataset
+            A dataset reading only the selected files.
+
+        """
+        return type(self)(
+            self._backend,
+            self._listing,
+            glob=self._glob,
+            format=self._format,
+            partitions=self._partitions,
+            options=self._options,
+            predicates=self._predicates + predicates,
+        )
+
+    def size(self) -> DatasetSize:
+        """Return the number of files and bytes the dataset reads.
+
+        Returns
+        -------
+        DatasetSize
+            The file count and total file size.
+
+        """
+        files = self.files
+        expr = files.agg(files=files.count(), bytes=files[_SIZE].sum())
+        row = self._backend.to_pyarrow(expr).to_pylist()[0]
+        return DatasetSize(files=row["files"], bytes=row["bytes"] or 0)
+
+    def to_table(self, *, table_name: str | None = None) -> ir.Table:
+        """Read the selected files as a table.
+
+        Unfiltered datasets are read with a glob over their directory, so
+        the file listing isn't part of the query.
+
+        Parameters
+        ----------
+        table_name
+            An optional name for the temporary view that reads the files.
+            This defaults to a sequentially generated name.
+
+        Returns
+        -------
+        Table
+            A table with the columns of the files followed by the partition
+            columns.
+
+        """
+        backend = self._backend
+        if self._predicates or self._glob is None:
+            # DuckDB only skips files for filters on the partition values as
+            # read, not on their casts or on file names, so the selected files
+            # are read by path
+            paths = backend.to_pyarrow(self.files[_PATH]).to_pylist()
+        else:
+            paths = [self._glob]
+        # read the schema from any file when no file is selected
+        empty = not paths
+        if empty:
+            paths = backend.to_pyarrow(self._listing.limit(1)[_PATH]).to_pylist()
+
+        options = {"hive_partitioning": bool(self._partitions), **self._options}
+        if self._partitions:
+            # partition values are read as strings so that hive's directory
+            # name for NULL can be mapped to NULL before they're cast
+            options["hive_types"] = dict.fromkeys(self._partitions, "VARCHAR")
+        table_name = table_name or util.gen_name("read_dataset")
+        if self._format == "parquet":
+            table = backend.read_parquet(paths, table_name=table_name, **options)
+        else:
+            table = backend.read_csv(paths, table_name=table_name, **options)
+        if self._partitions:
+            table = table.mutate(
+                {
+                    name: table[name].nullif(_HIVE_NULL).cast(dtype)
+                    for name, dtype in self._partitions.items()
+                }
+            )
+        if empty:
+            table = table.limit(0)
+        return table
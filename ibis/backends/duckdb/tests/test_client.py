@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import contextlib
+import json
 import os
 import subprocess
 import sys
+import types
 
 import duckdb
 import numpy as np
@@ -14,6 +17,7 @@ from pytest import param
 import ibis
 import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
+import ibis.expr.operations as ops
 from ibis.conftest import LINUX, SANDBOXED, not_windows
 from ibis.util import gen_name
 
@@ -473,3 +477,418 @@ def test_create_temp_table_in_nondefault_schema():
     con.create_database(database)
     con.con.execute(f"USE {database}")
     con.create_table("foo", {"id": [1, 2, 3]}, temp=True)
+
+
+@pytest.mark.parametrize(
+    "make_source",
+    [
+        param(lambda t: t, id="pyarrow_table"),
+        param(lambda t: t.to_reader(), id="pyarrow_rbr"),
+        param(lambda t: pa.dataset.dataset(t), id="pyarrow_dataset"),
+        param(lambda t: pytest.importorskip("polars").from_arrow(t), id="polars"),
+    ],
+)
+def test_insert_arrow_sources(con, make_source):
+    pytest.importorskip("pyarrow.dataset")
+
+    name = gen_name("duckdb_insert_arrow")
+    data = pa.table({"a": [1, 2, 3], "b": ["x", "y", None]})
+
+    t = con.create_table(name, make_source(data), temp=True)
+    assert t.schema() == ibis.schema({"a": "int64", "b": "string"})
+
+    con.insert(name, make_source(data))
+    assert t.count().execute() == 6
+
+    con.insert(name, make_source(data), overwrite=True)
+    assert con.to_pyarrow(t.order_by("a")).equals(data)
+
+    # the replacement scan is dropped once the insert is done
+    assert con.list_tables(like="duckdb_arrow_scan") == []
+
+
+def test_polars_memtable_skips_cast(con, mocker):
+    pl = pytest.importorskip("polars")
+
+    from ibis.formats.polars import PolarsDataFrameProxy
+
+    t = ibis.memtable(pl.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
+
+    spy = mocker.spy(PolarsDataFrameProxy, "to_pyarrow")
+    assert con.execute(t).b.tolist() == ["x", "y"]
+    spy.assert_not_called()
+
+
+def test_metadata_cache(monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "metadata_cache_ttl", None)
+
+    con = ibis.duckdb.connect()
+    con.create_table("t", schema=ibis.schema({"a": "int64"}))
+    assert con.get_schema("t") == ibis.schema({"a": "int64"})
+
+    # changes made behind ibis' back aren't visible until the cache is refreshed
+    con.con.execute("ALTER TABLE t ADD COLUMN b VARCHAR")
+    assert con.get_schema("t") == ibis.schema({"a": "int64"})
+
+    con.refresh_metadata()
+    assert con.get_schema("t") == ibis.schema({"a": "int64", "b": "string"})
+
+    # statements run with raw_sql invalidate the cache, queries don't
+    version = con._data_version
+    con.raw_sql("SELECT * FROM t").fetchall()
+    assert con._data_version == version
+    con.raw_sql("ALTER TABLE t DROP COLUMN b")
+    assert con.get_schema("t") == ibis.schema({"a": "int64"})
+    assert con._data_version > version
+
+    # ddl issued through ibis invalidates the cache
+    con.create_table("t", schema=ibis.schema({"c": "float64"}), overwrite=True)
+    assert con.get_schema("t") == ibis.schema({"c": "float64"})
+    assert "v" not in con.list_tables()
+    con.create_view("v", con.table("t"))
+    assert "v" in con.list_tables()
+
+
+def test_metadata_cache_disabled():
+    con = ibis.duckdb.connect()
+    con.create_table("t", schema=ibis.schema({"a": "int64"}))
+    con.get_schema("t")
+    con.raw_sql("ALTER TABLE t ADD COLUMN b VARCHAR")
+    assert con.get_schema("t") == ibis.schema({"a": "int64", "b": "string"})
+
+
+@pytest.mark.parametrize("ttl", [0, None], ids=["disabled", "enabled"])
+def test_metadata_cache_unhashable_arguments(monkeypatch, ttl):
+    monkeypatch.setattr(ibis.options.sql, "metadata_cache_ttl", ttl)
+
+    con = ibis.duckdb.connect()
+    con.create_table("t", schema=ibis.schema({"a": "int64"}))
+    assert con.list_tables(database=["memory", "main"]) == ["t"]
+
+
+def test_tables_schemas():
+    con = ibis.duckdb.connect()
+    con.create_table("t", schema=ibis.schema({"a": "int64", "b": "string"}))
+    con.create_table("u", schema=ibis.schema({"c": "date"}))
+    con.create_table("u", schema=ibis.schema({"d": "bool"}), temp=True)
+
+    result = con.tables_schemas(["t", "u"])
+    assert result == {"t": con.get_schema("t"), "u": ibis.schema({"d": "boolean"})}
+
+    with pytest.raises(com.TableNotFound):
+        con.tables_schemas(["t", "missing"])
+
+
+def test_persistent_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(ibis.options.cache, "persist", True)
+    monkeypatch.setattr(ibis.options.cache, "directory", str(tmp_path / "cache"))
+    path = str(tmp_path / "test.ddb")
+
+    con = ibis.duckdb.connect(path)
+    con.create_table("t", ibis.memtable({"a": [1, 2, 3]}))
+    con.disconnect()
+
+    def cached_total():
+        # a fresh connection stands in for another process
+        con = ibis.duckdb.connect(path)
+        t = con.table("t")
+        cached = t.mutate(b=t.a * 2).cache()
+        total = cached.b.sum().execute()
+        cached.release()
+        con.disconnect()
+        return total
+
+    assert cached_total() == 12
+    [entry] = (tmp_path / "cache").iterdir()
+    mtime = entry.stat().st_mtime_ns
+
+    # the persisted entry outlives the connection and is reused
+    assert cached_total() == 12
+    assert entry.stat().st_mtime_ns == mtime
+
+    # modifying the source table invalidates the entry
+    con = ibis.duckdb.connect(path)
+    con.insert("t", ibis.memtable({"a": [4]}))
+    con.disconnect()
+
+    assert cached_total() == 20
+    assert [entry] == list((tmp_path / "cache").iterdir())
+
+
+@pytest.mark.parametrize("kind", ["temp", "view", "attached"])
+def test_persistent_cache_unversioned_tables(tmp_path, monkeypatch, kind):
+    monkeypatch.setattr(ibis.options.cache, "persist", True)
+    monkeypatch.setattr(ibis.options.cache, "directory", str(tmp_path / "cache"))
+    path = str(tmp_path / "test.ddb")
+    other = tmp_path / "other.ddb"
+
+    def cached_total(values):
+        # a fresh connection stands in for another process
+        con = ibis.duckdb.connect(path)
+        data = ibis.memtable({"a": values})
+        if kind == "temp":
+            t = con.create_table("t", data, temp=True)
+        elif kind == "view":
+            # views can read files that change without the database changing
+            source = tmp_path / "source.parquet"
+            data.to_parquet(source)
+            con.raw_sql(
+                f"CREATE OR REPLACE VIEW t AS SELECT * FROM read_parquet('{source}')"
+            )
+            t = con.table("t")
+        else:
+            other.unlink(missing_ok=True)
+            con.attach(other, name="other")
+            t = con.create_table("t", data, database="other.main")
+        cached = t.mutate(b=t.a * 2).cache()
+        total = cached.b.sum().execute()
+        cached.release()
+        con.disconnect()
+        return total
+
+    assert cached_total([1, 2, 3]) == 12
+    assert cached_total([10, 20]) == 60
+    assert not (tmp_path / "cache").exists() or not list((tmp_path / "cache").iterdir())
+
+
+def test_persistent_cache_in_memory_database(tmp_path, monkeypatch):
+    monkeypatch.setattr(ibis.options.cache, "persist", True)
+    monkeypatch.setattr(ibis.options.cache, "directory", str(tmp_path))
+    con = ibis.duckdb.connect()
+
+    # tables of in-memory databases can't be shared across processes
+    t = con.create_table("t", ibis.memtable({"a": [1, 2, 3]}))
+    assert t.cache().count().execute() == 3
+    assert not list(tmp_path.iterdir())
+
+    # but expressions over in-memory data can be
+    m = ibis.memtable({"a": [1, 2, 3]})
+    assert con._cached_table(m.mutate(b=1)).count().execute() == 3
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_persistent_cache_max_size(tmp_path, monkeypatch):
+    monkeypatch.setattr(ibis.options.cache, "persist", True)
+    monkeypatch.setattr(ibis.options.cache, "directory", str(tmp_path))
+    monkeypatch.setattr(ibis.options.cache, "max_size", 1)
+    con = ibis.duckdb.connect()
+    m = ibis.memtable({"a": [1, 2, 3]})
+
+    first = con._cached_table(m.mutate(b=1))
+    assert first.count().execute() == 3
+    first.release()
+    # released entries stay for other processes, but count toward the budget
+    [entry] = tmp_path.iterdir()
+
+    second = con._cached_table(m.mutate(b=2))
+    assert [path.name for path in tmp_path.iterdir()] != [entry.name]
+    assert len(list(tmp_path.iterdir())) == 1
+    assert second.b.sum().execute() == 6
+
+
+@pytest.mark.parametrize("method", ["info", "describe"])
+def test_summary_single_scan(con, method):
+    import sqlglot.expressions as sge
+
+    name = gen_name("summary")
+    t = con.create_table(
+        name,
+        ibis.memtable({"a": [1, 2, None], "b": ["x", "y", "y"]}),
+        temp=True,
+    )
+    expr = getattr(t, method)()
+
+    sql = con.compiler.to_sqlglot(expr)
+    assert len(list(sql.find_all(sge.Table))) == 1
+
+    result = expr.execute()
+    assert list(result.name) == ["a", "b"]
+    assert list(result.nulls) == [1, 0]
+
+
+def test_describe_approx(con):
+    t = ibis.memtable({"a": [1, 2, 2, 3], "b": ["x", "y", "y", "z"]})
+    expr = t.describe(approx=True)
+    assert expr.op().find(ops.ApproxCountDistinct)
+    assert expr.op().find(ops.ApproxQuantile)
+
+    result = con.execute(expr).set_index("name")
+    assert result.loc["a", "unique"] == 3
+    assert result.loc["b", "mode"] == "y"
+
+
+@pytest.mark.parametrize("nulls_first", [False, True])
+@pytest.mark.parametrize("page_size", [1, 2, 3, 10])
+def test_paginate_nullable_keys(con, nulls_first, page_size):
+    t = con.create_table(
+        gen_name("paginate"),
+        ibis.memtable({"g": [None, 1, 1, 2, None, 2, 3], "id": range(7)}),
+        temp=True,
+    )
+    order_by = [ibis.desc("g", nulls_first=nulls_first), "id"]
+    nulls, values = [0, 4], [6, 3, 5, 1, 2]
+    expected = nulls + values if nulls_first else values + nulls
+
+    pages = t.paginate(order_by, page_size=page_size)
+    assert [id for page, _ in pages for id in page["id"].to_pylist()] == expected
+
+
+@pytest.mark.parametrize("null_order", ["nulls_first", "nulls_last"])
+def test_paginate_ignores_session_null_order(null_order):
+    con = ibis.duckdb.connect()
+    con.settings["null_order"] = null_order
+    t = con.create_table(
+        "t", ibis.memtable({"g": [None, 1, 1, 2, None, 2, 3], "id": range(7)})
+    )
+
+    for nulls_first in (False, True):
+        order_by = [ibis.desc("g", nulls_first=nulls_first), "id"]
+        nulls, values = [0, 4], [6, 3, 5, 1, 2]
+        expected = nulls + values if nulls_first else values + nulls
+
+        pages = t.paginate(order_by, page_size=2)
+        assert [id for page, _ in pages for id in page["id"].to_pylist()] == expected
+
+
+def test_paginate_invalid_cursor(con):
+    t = ibis.memtable({"a": [1, 2, 3], "b": [4, 5, 6]})
+    _, cursor = next(t.paginate("a", page_size=1))
+    with pytest.raises(com.IbisInputError, match="cursor"):
+        next(t.paginate(["a", "b"], cursor=cursor))
+
+
+def test_incremental_refresh():
+    con = ibis.duckdb.connect()
+    events = con.create_table(
+        "events",
+        ibis.memtable(
+            {
+                "ts": [1, 2, None],
+                "user": ["a", "b", "a"],
+                "n": [1, 2, 7],
+            }
+        ),
+    )
+    totals = con.create_table(
+        "totals",
+        events.group_by("user").agg(
+            total=events.n.sum(),
+            events=events.count(),
+            first=events.ts.min(),
+            last=events.ts.max(),
+        ),
+        incremental_on="ts",
+    )
+    selected = con.create_table(
+        "selected",
+        events.filter(events.n > 1).select("ts", "n"),
+        incremental_on="ts",
+    )
+    assert con.refresh("totals").to_pyarrow().equals(totals.to_pyarrow())
+
+    con.insert("events", ibis.memtable({"ts": [3, 4], "user": ["a", "c"], "n": [5, 6]}))
+    con.refresh("totals")
+    con.refresh("selected")
+
+    # rows with a NULL watermark are never included
+    source = events.filter(events.ts.notnull())
+    expected = source.group_by("user").agg(
+        total=source.n.sum(),
+        events=source.count(),
+        first=source.ts.min(),
+        last=source.ts.max(),
+    )
+    pd.testing.assert_frame_equal(
+        totals.order_by("user").execute(), expected.order_by("user").execute()
+    )
+    assert selected.order_by("ts").n.to_pyarrow().to_pylist() == [2, 5, 6]
+
+
+def test_incremental_refresh_temp():
+    con = ibis.duckdb.connect()
+    events = con.create_table(
+        "events", ibis.memtable({"ts": [1, 2], "user": ["a", "b"], "n": [1, 2]})
+    )
+    totals = con.create_table(
+        "totals",
+        events.group_by("user").agg(total=events.n.sum()),
+        incremental_on="ts",
+        temp=True,
+    )
+
+    con.insert("events", ibis.memtable({"ts": [3], "user": ["a"], "n": [5]}))
+    con.refresh("totals")
+
+    assert totals.order_by("user").total.to_pyarrow().to_pylist() == [6, 2]
+    assert "totals" in con.list_tables(database="temp.main")
+
+
+def test_incremental_state():
+    con = ibis.duckdb.connect()
+    events = con.create_table("events", ibis.memtable({"ts": [1, 2], "n": [1, 2]}))
+    con.create_table("selected", events, incremental_on="ts")
+    con.insert("events", ibis.memtable({"ts": [3], "n": [3]}))
+    con.refresh("selected")
+
+    state = con.table("_ibis_incremental_selected")
+    assert state.schema() == ibis.schema(
+        {"definition": "string", "watermark": "int64", "upper": "int64"}
+    )
+    ((definition, watermark, upper),) = con.raw_sql(
+        "SELECT definition, watermark, upper FROM _ibis_incremental_selected"
+    ).fetchall()
+    definition = json.loads(definition)
+    assert definition["source"][0] == "events"
+    assert definition["column"] == "ts"
+    assert "query" not in definition
+    assert watermark == upper == 3
+
+
+def test_incremental_refresh_is_atomic():
+    con = ibis.duckdb.connect()
+    events = con.create_table("events", ibis.memtable({"ts": [1], "n": [1]}))
+    selected = con.create_table("selected", events, incremental_on="ts")
+    con.insert("events", ibis.memtable({"ts": [2], "n": [2]}))
+
+    begin = con.begin
+
+    @contextlib.contextmanager
+    def failing_begin():
+        with begin() as cur:
+
+            def execute(query):
+                if query.startswith("INSERT INTO") and "_ibis_incremental" in query:
+                    raise duckdb.IOException("disk full")
+                return cur.execute(query)
+
+            yield types.SimpleNamespace(execute=execute)
+
+    con.begin = failing_begin
+    with pytest.raises(duckdb.IOException):
+        con.refresh("selected")
+    assert selected.ts.to_pyarrow().to_pylist() == [1]
+
+    del con.begin
+    con.refresh("selected")
+    assert selected.order_by("ts").ts.to_pyarrow().to_pylist() == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        param(lambda t: t.mutate(m=t.n.mean().over()), id="window"),
+        param(lambda t: t.agg(m=t.n.mean()), id="mean"),
+        param(lambda t: t.join(t.view(), "ts"), id="join"),
+        param(lambda t: t.distinct(), id="distinct"),
+    ],
+)
+def test_incremental_unsupported(expr):
+    con = ibis.duckdb.connect()
+    t = con.create_table("t", schema={"ts": "int64", "n": "int64"})
+    with pytest.raises(com.UnsupportedOperationError):
+        con.create_table("derived", expr(t), incremental_on="ts")
+
+
+def test_refresh_not_incremental(con):
+    with pytest.raises(com.IbisInputError, match="incremental_on"):
+        con.refresh("functional_alltypes")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime
 import os
 import sqlite3
 
@@ -13,6 +14,7 @@ from packaging.version import parse as parse_version
 from pytest import param
 
 import ibis
+import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 from ibis.conftest import LINUX, SANDBOXED
 from ibis.util import gen_name
@@ -480,3 +482,126 @@ def test_roundtrip_xlsx_with_sheet(con, tmp_path):
     assert ncolumns == 5
     assert t.columns == ft.columns[:ncolumns]
     assert t.count().execute() == 2
+
+
+def test_read_parquet_struct_options(con, tmp_path):
+    directory = tmp_path / "date=2024-01-01"
+    directory.mkdir()
+    pq = pytest.importorskip("pyarrow.parquet")
+    pq.write_table(pa.table({"x": [1]}), directory / "0.parquet")
+
+    t = con.read_parquet(
+        directory / "0.parquet", hive_partitioning=True, hive_types={"date": "DATE"}
+    )
+    assert t.schema()["date"] == dt.date
+
+
+@pytest.fixture
+def lake(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    root = tmp_path / "lake"
+    partitions = [
+        ("2024-01-01", "a", {"x": [1, 2]}),
+        ("2024-01-01", "__HIVE_DEFAULT_PARTITION__", {"x": [3]}),
+        ("2024-01-02", "a", {"x": [4, 5], "y": ["p", "q"]}),
+        ("2024-01-03", "b", {"x": [6]}),
+    ]
+    for date, region, data in partitions:
+        directory = root / f"date={date}" / f"region={region}"
+        directory.mkdir(parents=True)
+        pq.write_table(pa.table(data), directory / "part-0.parquet")
+    (root / "_SUCCESS").touch()
+    return root
+
+
+def test_dataset_partitions(con, lake):
+    ds = con.dataset(lake, union_by_name=True)
+    assert ds.partitions == ibis.schema({"date": "date", "region": "string"})
+
+    files = ds.files.order_by("_path").execute()
+    assert len(files) == 4
+    assert files.region.isna().sum() == 1
+    assert ds.size() == (4, sum(os.path.getsize(path) for path in files._path))
+
+    t = ds.to_table()
+    assert t.schema() == ibis.schema(
+        {"x": "int64", "y": "string", "date": "date", "region": "string"}
+    )
+    assert t.count().execute() == 6
+    assert t.filter(t.region.isnull()).x.to_pyarrow().to_pylist() == [3]
+
+
+def test_dataset_filter(con, lake):
+    ds = con.dataset(lake, partitions={"region": "string"}, union_by_name=True)
+    ds = ds.filter(ds.date >= ibis.date("2024-01-02")).filter(ds.region == "a")
+    assert ds.size().files == 1
+
+    t = ds.to_table()
+    assert t.x.to_pyarrow().to_pylist() == [4, 5]
+
+    empty = ds.filter(ds.region == "missing")
+    assert empty.size() == (0, 0)
+    assert empty.to_table().count().execute() == 0
+
+
+def test_dataset_to_table_temporary(lake, tmp_path):
+    con = ibis.duckdb.connect(tmp_path / "lake.ddb")
+    t = con.dataset(lake, union_by_name=True).to_table(table_name="lake")
+    assert t.count().execute() == 6
+
+    # unfiltered datasets are read with a glob instead of a list of files
+    [(sql,)] = con.raw_sql(
+        "SELECT sql FROM duckdb_views() WHERE view_name = 'lake'"
+    ).fetchall()
+    assert "part-0" not in sql
+
+    # nothing persistent is left behind
+    con.disconnect()
+    con = ibis.duckdb.connect(tmp_path / "lake.ddb")
+    assert con.list_tables() == []
+
+
+def test_dataset_null_partitions(con, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    for date, size in [("2024-01-01", 1), ("__HIVE_DEFAULT_PARTITION__", 2)]:
+        directory = tmp_path / f"date={date}" / f"size={size}"
+        directory.mkdir(parents=True)
+        pq.write_table(pa.table({"x": [size]}), directory / "part-0.parquet")
+
+    ds = con.dataset(tmp_path)
+    assert ds.partitions == ibis.schema({"date": "date", "size": "int64"})
+    assert ds.size().files == 2
+    assert ds.filter(ds["size"] == 2).size().files == 1
+
+    t = ds.to_table(table_name=gen_name("dataset"))
+    assert t.schema() == ibis.schema({"x": "int64", "date": "date", "size": "int64"})
+    assert t.order_by("x").to_pyarrow().to_pylist() == [
+        {"x": 1, "date": datetime.date(2024, 1, 1), "size": 1},
+        {"x": 2, "date": None, "size": 2},
+    ]
+
+
+def test_dataset_csv(con, tmp_path):
+    for hour in (1, 2):
+        directory = tmp_path / f"hour={hour}"
+        directory.mkdir()
+        (directory / "data.csv").write_text("a,b\n1,x\n")
+
+    ds = con.dataset(tmp_path, format="csv")
+    assert ds.partitions == ibis.schema({"hour": "int64"})
+    t = ds.filter(ds.hour == 2).to_table()
+    assert t.to_pyarrow().to_pylist() == [{"a": 1, "b": "x", "hour": 2}]
+
+
+def test_dataset_invalid(con, lake, tmp_path):
+    with pytest.raises(com.IbisInputError, match="Unknown partition columns"):
+        con.dataset(lake, partitions={"day": "date"})
+
+    (lake / "stray.parquet").touch()
+    with pytest.raises(com.IbisInputError, match="consistently"):
+        con.dataset(lake)
+
+    with pytest.raises(FileNotFoundError):
+        con.dataset(tmp_path / "missing")
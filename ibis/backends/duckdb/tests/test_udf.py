@@ -134,6 +134,34 @@ def test_kwargs_are_forwarded(con):
         con.execute(expr)
 
 
+def test_udfs_are_registered_once_per_connection(mocker):
+    con = ibis.duckdb.connect()
+
+    @udf.scalar.python
+    def add_one(x: int) -> int:
+        return x + 1
+
+    spy = mocker.spy(con, "_register_python_udf")
+
+    expr = add_one(ibis.literal(1))
+    assert con.execute(expr) == 2
+    assert con.execute(expr + 1) == 3
+    assert spy.call_count == 1
+
+    # redefining a udf registers the new definition
+    @udf.scalar.python
+    def add_one(x: int) -> int:
+        return x + 2
+
+    assert con.execute(add_one(ibis.literal(1))) == 3
+    assert spy.call_count == 2
+
+    # a fresh connection knows nothing about previously registered udfs
+    con.reconnect()
+    assert con.execute(add_one(ibis.literal(1))) == 3
+    assert spy.call_count == 3
+
+
 def test_builtin_udf_uses_dialect():
     # in raw sqlglot, if you call regexp_extract, it will assume the
     # 3rd arg is "position" and not "groups". So when we make the UDF,
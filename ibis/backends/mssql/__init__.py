@@ -34,6 +34,11 @@ if TYPE_CHECKING:
     import polars as pl
     import pyarrow as pa
 
+# SQL Server's limits on the number of rows in a VALUES clause and the number
+# of parameters in a single statement
+_MAX_ROWS_PER_INSERT = 1000
+_MAX_PARAMETERS = 2099
+
 
 def datetimeoffset_to_datetime(value):
     """Convert a datetimeoffset value to a datetime.
@@ -788,13 +793,27 @@ GO"""
             ),
         )
 
-        df = op.data.to_frame()
-        data = df.itertuples(index=False)
-
-        insert_stmt = self._build_insert_template(name, schema=schema, columns=True)
         with self._safe_ddl(create_stmt) as cur:
-            if not df.empty:
-                cur.executemany(insert_stmt, data)
+            # bind all parameters of a batch as arrays in a single round trip
+            cur.fast_executemany = True
+            try:
+                self._bulk_insert(cur, op, name=name)
+            except pyodbc.IntegrityError:
+                raise
+            except pyodbc.Error:
+                # not every driver and column type supports array binding, fall
+                # back to inserting as many rows per statement as is allowed
+                cur.execute(
+                    sge.Delete(this=sg.table(name, quoted=quoted)).sql(self.dialect)
+                )
+                cur.fast_executemany = False
+                self._bulk_insert(
+                    cur,
+                    op,
+                    name=name,
+                    max_rows_per_statement=_MAX_ROWS_PER_INSERT,
+                    max_parameters=_MAX_PARAMETERS,
+                )
 
     def _cursor_batches(
         self,
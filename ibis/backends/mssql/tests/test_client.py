@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from urllib.parse import urlencode
 
+import pyodbc
 import pytest
 import sqlglot as sg
 import sqlglot.expressions as sge
@@ -347,3 +348,31 @@ def test_mssql_without_password_is_valid():
 )
 def test_list_tables_with_dash(con, database):
     assert con.list_tables(database=database)
+
+
+def test_memtable_fast_executemany_fallback(con, mocker):
+    bulk_insert = con._bulk_insert
+
+    def bulk_insert_without_array_binding(cur, op, **kwargs):
+        if cur.fast_executemany:
+            raise pyodbc.Error("HY000", "array binding is not supported")
+        return bulk_insert(cur, op, **kwargs)
+
+    mock = mocker.patch.object(
+        con, "_bulk_insert", side_effect=bulk_insert_without_array_binding
+    )
+
+    t = ibis.memtable({"x": [1, 2, 3], "y": ["a", None, "c"]})
+    assert con.to_pyarrow(t.x.sum()).as_py() == 6
+    assert mock.call_count == 2
+
+
+def test_memtable_integrity_error_not_retried(con, mocker):
+    mock = mocker.patch.object(
+        con, "_bulk_insert", side_effect=pyodbc.IntegrityError("23000", "duplicate")
+    )
+
+    t = ibis.memtable({"x": [1, 2, 3]})
+    with pytest.raises(pyodbc.IntegrityError):
+        con.to_pyarrow(t.x.sum())
+    assert mock.call_count == 1
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import contextlib
+import os
+import tempfile
 import warnings
 from functools import cached_property
 from operator import itemgetter
@@ -27,18 +29,23 @@ from ibis.backends.sql import SQLBackend
 from ibis.backends.sql.compilers.base import STAR, TRUE, C, RenameTable
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping
     from urllib.parse import ParseResult
 
     import pandas as pd
     import polars as pl
     import pyarrow as pa
 
+# error codes for `LOAD DATA LOCAL INFILE` being disabled by the client or server
+_LOCAL_INFILE_DISABLED = frozenset((ER.NOT_ALLOWED_COMMAND, 3948))
+
 
 class Backend(SQLBackend, CanCreateDatabase, PyArrowExampleLoader):
     name = "mysql"
     compiler = sc.mysql.compiler
     supports_create_or_replace = False
+    # nan can not be used with MySQL
+    _insert_nan_as_null = True
 
     def _from_url(self, url: ParseResult, **kwargs):
         """Connect to a backend using a URL `url`.
@@ -152,7 +159,7 @@ class Backend(SQLBackend, CanCreateDatabase, PyArrowExampleLoader):
             **kwargs,
         )
 
-        self._post_connect()
+        self._post_connect(local_infile=bool(kwargs.get("local_infile")))
 
     @util.experimental
     @classmethod
@@ -170,13 +177,28 @@ class Backend(SQLBackend, CanCreateDatabase, PyArrowExampleLoader):
         new_backend._post_connect()
         return new_backend
 
-    def _post_connect(self) -> None:
+    def _post_connect(self, *, local_infile: bool | None = None) -> None:
+        """Set up a new connection.
+
+        `local_infile` is whether the client allows `LOAD DATA LOCAL INFILE`,
+        `None` if unknown, as for connections passed to `from_connection`.
+        """
         with self.con.cursor() as cur:
             try:
                 cur.execute("SET @@session.time_zone = 'UTC'")
             except Exception as e:  # noqa: BLE001
                 warnings.warn(f"Unable to set session timezone to UTC: {e}")
 
+            if local_infile is False:
+                self._supports_local_infile = False
+            else:
+                try:
+                    cur.execute("SELECT @@GLOBAL.local_infile")
+                    [(enabled,)] = cur.fetchall()
+                except MySQLdb.Error:
+                    enabled = False
+                self._supports_local_infile = bool(enabled)
+
     @property
     def current_database(self) -> str:
         with self._safe_raw_sql(sg.select(self.compiler.f.database())) as cur:
@@ -381,6 +403,7 @@ class Backend(SQLBackend, CanCreateDatabase, PyArrowExampleLoader):
         *,
         params: Mapping[ir.Scalar, Any] | None = None,
         limit: int | str | None = None,
+        chunk_size: int | None = None,
         **kwargs: Any,
     ) -> pd.DataFrame | pd.Series | Any:
         """Execute an Ibis expression and return a pandas `DataFrame`, `Series`, or scalar.
@@ -394,9 +417,15 @@ class Backend(SQLBackend, CanCreateDatabase, PyArrowExampleLoader):
         limit
             An integer to effect a specific row limit. A value of `None` means
             no limit. The default is in `ibis/config.py`.
+        chunk_size
+            Stream the result from the server in chunks of this many rows
+            with an unbuffered cursor, converting each chunk as it arrives.
+            This bounds the memory used by raw rows for very large results.
+            [](`None`) fetches the whole result at once.
         kwargs
             Keyword arguments
         """
+        import pandas as pd
 
         self._run_pre_execute_hooks(expr)
         table = expr.as_table()
@@ -404,8 +433,16 @@ class Backend(SQLBackend, CanCreateDatabase, PyArrowExampleLoader):
 
         schema = table.schema()
 
-        with self._safe_raw_sql(sql) as cur:
-            result = self._fetch_from_cursor(cur, schema)
+        if chunk_size is None:
+            with self._safe_raw_sql(sql) as cur:
+                result = self._fetch_from_cursor(cur, schema)
+        else:
+            chunks = list(self._fetch_chunks(sql, schema, chunk_size=chunk_size))
+            result = (
+                pd.concat(chunks, ignore_index=True)
+                if chunks
+                else self._convert_rows([], schema)
+            )
         return expr.__pandas_result__(result)
 
     def create_table(
@@ -510,19 +547,68 @@ class Backend(SQLBackend, CanCreateDatabase, PyArrowExampleLoader):
         )
         create_stmt_sql = create_stmt.sql(dialect)
 
-        df = op.data.to_frame()
-        # nan can not be used with MySQL
-        df = df.replace(float("nan"), None)
-
-        data = df.itertuples(index=False)
-        sql = self._build_insert_template(
-            name, schema=schema, columns=True, placeholder="%s"
-        )
         with self.begin() as cur:
             cur.execute(create_stmt_sql)
 
-            if not df.empty:
-                cur.executemany(sql, data)
+            if not self._load_data_local_infile(cur, op):
+                self._bulk_insert(cur, op, name=name, placeholder="%s")
+
+    def _load_data_local_infile(
+        self, cur: MySQLdb.cursors.Cursor, op: ops.InMemoryTable
+    ) -> bool:
+        """Bulk load the data backing `op` using `LOAD DATA LOCAL INFILE`.
+
+        Requires `local_infile` to be enabled on both the client (by passing
+        `local_infile=True` to `connect`) and the server. Returns `False`
+        without loading anything if the data can't be loaded this way, in
+        which case the caller should fall back to inserting rows.
+        """
+        from ibis.backends.mysql.converter import to_load_data_lines
+
+        if not self._supports_local_infile:
+            return False
+
+        schema = op.schema
+        lines = to_load_data_lines(op.data.to_pyarrow(schema), schema)
+        if lines is None:
+            return False
+
+        dialect = self.dialect
+        quoted = self.compiler.quoted
+        table = sg.table(op.name, quoted=quoted)
+        columns = ", ".join(
+            sg.to_identifier(col, quoted=quoted).sql(dialect) for col in schema.names
+        )
+        # the file path is passed as a parameter, so escape any `%` in names
+        target = table.sql(dialect).replace("%", "%%")
+        columns = columns.replace("%", "%%")
+        sql = (
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {target} "
+            "CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+            f"LINES TERMINATED BY '\\n' ({columns})"
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, f"{op.name}.tsv")
+            with open(path, "wb") as f:
+                for chunk in lines.iterchunks():
+                    f.write("".join(chunk.to_numpy(zero_copy_only=False)).encode())
+
+            try:
+                cur.execute(sql, (path,))
+            except MySQLdb.Error as e:
+                if e.args[0] not in _LOCAL_INFILE_DISABLED:
+                    raise
+                # local_infile is disabled, don't try again on this connection
+                self._supports_local_infile = False
+                return False
+
+        if self.con.warning_count():
+            # values were silently truncated or converted, insert them instead
+            cur.execute(sge.Delete(this=table).sql(dialect))
+            return False
+        return True
 
     @util.experimental
     def to_pyarrow_batches(
@@ -540,21 +626,56 @@ class Backend(SQLBackend, CanCreateDatabase, PyArrowExampleLoader):
         self._run_pre_execute_hooks(expr)
 
         schema = expr.as_table().schema()
-        with self._safe_raw_sql(
-            self.compile(expr, limit=limit, params=params)
-        ) as cursor:
-            df = self._fetch_from_cursor(cursor, schema)
-        table = pa.Table.from_pandas(
-            df, schema=schema.to_pyarrow(), preserve_index=False
-        )
-        return table.to_reader(max_chunksize=chunk_size)
+        arrow_schema = schema.to_pyarrow()
+        query = self.compile(expr, limit=limit, params=params)
+
+        def batches():
+            for df in self._fetch_chunks(query, schema, chunk_size=chunk_size):
+                yield pa.RecordBatch.from_pandas(
+                    df, schema=arrow_schema, preserve_index=False
+                )
+
+        return pa.RecordBatchReader.from_batches(arrow_schema, batches())
+
+    def _fetch_chunks(
+        self, query: str, schema: sch.Schema, *, chunk_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """Yield the result of `query` in converted chunks of `chunk_size` rows.
+
+        Rows are read with an unbuffered server-side cursor, so only one
+        chunk is held client-side at a time. The connection can't run other
+        queries until the result is exhausted or the iterator is closed.
+        """
+        con = self.con
+        autocommit = con.get_autocommit()
+        cursor = con.cursor(MySQLdb.cursors.SSCursor)
+
+        if not autocommit:
+            con.begin()
+
+        try:
+            cursor.execute(query)
+            while rows := cursor.fetchmany(chunk_size):
+                yield self._convert_rows(rows, schema)
+        except BaseException:
+            # including the iterator being closed before it's exhausted
+            if not autocommit:
+                con.rollback()
+            raise
+        else:
+            if not autocommit:
+                con.commit()
+        finally:
+            # closing an unbuffered cursor discards any unread rows
+            cursor.close()
 
     def _fetch_from_cursor(self, cursor, schema: sch.Schema) -> pd.DataFrame:
+        return self._convert_rows(cursor.fetchall(), schema)
+
+    def _convert_rows(self, rows, schema: sch.Schema) -> pd.DataFrame:
         import pandas as pd
 
         from ibis.backends.mysql.converter import MySQLPandasData
 
-        df = pd.DataFrame.from_records(
-            cursor.fetchall(), columns=schema.names, coerce_float=True
-        )
+        df = pd.DataFrame.from_records(rows, columns=schema.names, coerce_float=True)
         return MySQLPandasData.convert_table(df, schema)
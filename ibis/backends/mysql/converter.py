@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import datetime
+from typing import TYPE_CHECKING
 
 from ibis.formats.pandas import PandasData
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    import ibis.expr.schema as sch
+
 
 class MySQLPandasData(PandasData):
     # TODO(kszucs): this could be reused at other backends, like pyspark
@@ -25,3 +31,52 @@ class MySQLPandasData(PandasData):
         if s.dtype == "object":
             s = s.replace("0000-00-00 00:00:00", None)
         return super().convert_Timestamp(s, dtype, pandas_type)
+
+
+_LOAD_DATA_ESCAPES = (
+    # backslashes must be escaped first
+    ("\\", "\\\\"),
+    ("\t", "\\t"),
+    ("\n", "\\n"),
+    ("\r", "\\r"),
+    ("\x00", "\\0"),
+)
+
+
+def to_load_data_lines(table: pa.Table, schema: sch.Schema) -> pa.ChunkedArray | None:
+    r"""Convert `table` into lines of text readable by `LOAD DATA`.
+
+    Each line is terminated by a newline and its fields are separated by tabs,
+    using the default `LOAD DATA` escaping: NULLs are written as `\N` and
+    backslashes, tabs, newlines and NULs are backslash-escaped. Returns `None`
+    if `schema` contains a type that can't be round-tripped through text.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    columns = []
+    for name, dtype in schema.items():
+        column = table.column(name)
+        if dtype.is_boolean():
+            column = column.cast(pa.int8())
+        elif dtype.is_floating():
+            column = pc.if_else(pc.is_nan(column), None, column)
+        elif dtype.is_timestamp():
+            # the session time zone is UTC, see `Backend._post_connect`
+            column = column.cast(pa.timestamp(column.type.unit))
+        elif not (
+            dtype.is_numeric()
+            or dtype.is_string()
+            or dtype.is_date()
+            or dtype.is_time()
+        ):
+            return None
+
+        column = column.cast(pa.string())
+        if dtype.is_string():
+            for char, escaped in _LOAD_DATA_ESCAPES:
+                column = pc.replace_substring(column, char, escaped)
+        columns.append(pc.fill_null(column, "\\N"))
+    return pc.binary_join_element_wise(
+        pc.binary_join_element_wise(*columns, "\t"), "\n", ""
+    )
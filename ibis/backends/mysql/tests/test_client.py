@@ -277,3 +277,84 @@ def test_drop_database_exists(con):
         con.drop_database(dbname)
 
     con.drop_database(dbname, force=True)
+
+
+@pytest.mark.parametrize("local_infile", [False, True])
+def test_memtable_bulk_load(local_infile):
+    con = ibis.mysql.connect(
+        host=MYSQL_HOST,
+        user=MYSQL_USER,
+        password=MYSQL_PASS,
+        database=IBIS_TEST_MYSQL_DB,
+        local_infile=local_infile,
+    )
+    t = ibis.memtable(
+        {
+            "id": [1, 2, 3],
+            "f": [1.5, float("nan"), None],
+            "s": ['tab\tnew\nline\\ "quote"', None, ""],
+            "d": [date(2020, 1, 1), None, date(1970, 1, 1)],
+        }
+    )
+
+    result = con.to_pyarrow(t.order_by("id")).to_pydict()
+
+    assert result == {
+        "id": [1, 2, 3],
+        "f": [1.5, None, None],
+        "s": ['tab\tnew\nline\\ "quote"', None, ""],
+        "d": [date(2020, 1, 1), None, date(1970, 1, 1)],
+    }
+
+
+def test_local_infile_checked_on_connect(mocker):
+    con = ibis.mysql.connect(
+        host=MYSQL_HOST,
+        user=MYSQL_USER,
+        password=MYSQL_PASS,
+        database=IBIS_TEST_MYSQL_DB,
+    )
+    assert not con._supports_local_infile
+
+    load = mocker.spy(con, "_load_data_local_infile")
+    lines = mocker.patch("ibis.backends.mysql.converter.to_load_data_lines")
+    assert con.to_pyarrow(ibis.memtable({"x": [1, 2]}).x.sum()).as_py() == 3
+    load.assert_called_once()
+    lines.assert_not_called()
+
+
+def test_memtable_load_data_fallback(con, mocker):
+    spy = mocker.spy(con, "_bulk_insert")
+    con._supports_local_infile = False
+
+    t = ibis.memtable({"x": [1, 2, 3]})
+    assert con.to_pyarrow(t.x.sum()).as_py() == 6
+
+    spy.assert_called_once()
+
+
+def test_to_pyarrow_batches_streams(con):
+    t = con.table("functional_alltypes").order_by("id")
+
+    with con.to_pyarrow_batches(t, chunk_size=1000) as reader:
+        first = reader.read_next_batch()
+        assert len(first) == 1000
+        rest = list(reader)
+
+    assert sum(map(len, rest)) == t.count().execute() - 1000
+    assert all(batch.schema == first.schema for batch in rest)
+
+    # the connection is usable again once the stream is done
+    assert con.execute(t.count()) > 0
+
+
+def test_execute_chunked(con):
+    t = con.table("functional_alltypes").order_by("id")
+
+    result = con.execute(t, chunk_size=1000)
+    expected = con.execute(t)
+    tm.assert_frame_equal(result, expected)
+
+    empty = con.execute(t.filter(t.id < 0), chunk_size=1000)
+    assert empty.empty
+    assert list(empty.columns) == list(expected.columns)
@@ -23,16 +23,25 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import CanListDatabase, PyArrowExampleLoader
+from ibis.backends.oracle.converter import to_input_sizes
 from ibis.backends.sql import SQLBackend
 from ibis.backends.sql.compilers.base import STAR, C
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from urllib.parse import ParseResult
 
     import pandas as pd
     import polars as pl
     import pyarrow as pa
 
+# Number of rows bound per `executemany` call when inserting
+_ARRAY_DML_BATCH_SIZE = 10_000
+
+# Number of rows fetched per round trip, and prefetched along with the
+# statement execution
+_FETCH_ARRAY_SIZE = 10_000
+
 
 def metadata_row_to_type(
     *, type_mapper, type_string, precision, scale, nullable
@@ -78,6 +87,7 @@ def metadata_row_to_type(
 class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
     name = "oracle"
     compiler = sc.oracle.compiler
+    _insert_nan_as_null = True
 
     @cached_property
     def version(self):
@@ -256,6 +266,7 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
 
         con = self.con
         cursor = con.cursor()
+        cursor.arraysize = cursor.prefetchrows = _FETCH_ARRAY_SIZE
 
         try:
             cursor.execute(query, **kwargs)
@@ -523,16 +534,18 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
             properties=sge.Properties(expressions=[sge.TemporaryProperty()]),
         ).sql(self.name)
 
-        data = op.data.to_frame().replace(float("nan"), None)
+        table = op.data.to_pyarrow(schema)
+        input_sizes = to_input_sizes(table, schema)
         insert_stmt = self._build_insert_template(
             name, schema=schema, placeholder=":{i:d}"
         )
         with self.begin() as cur:
             cur.execute(create_stmt)
-            for start, end in util.chunks(len(data), chunk_size=128):
-                cur.executemany(
-                    insert_stmt, list(data.iloc[start:end].itertuples(index=False))
-                )
+            for rows in self._iter_insert_chunks(
+                table, schema, chunk_size=_ARRAY_DML_BATCH_SIZE
+            ):
+                cur.setinputsizes(*input_sizes)
+                cur.executemany(insert_stmt, list(rows))
 
     def _get_schema_using_query(self, query: str) -> sch.Schema:
         name = util.gen_name("oracle_metadata")
@@ -602,6 +615,68 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
 
         return sch.Schema(schema)
 
+    def _can_fetch_arrow(self, schema: sch.Schema) -> bool:
+        """Whether results of `schema` can be fetched as Arrow by the driver."""
+        return hasattr(self.con, "fetch_df_batches") and all(
+            dtype.is_numeric()
+            or dtype.is_string()
+            or dtype.is_boolean()
+            or dtype.is_date()
+            or (dtype.is_timestamp() and dtype.timezone is None)
+            for dtype in schema.types
+        )
+
+    def to_pyarrow(
+        self,
+        expr: ir.Expr,
+        /,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        **kwargs: Any,
+    ) -> pa.Table:
+        table_expr = expr.as_table()
+        schema = table_expr.schema()
+        if not self._can_fetch_arrow(schema):
+            return super().to_pyarrow(expr, params=params, limit=limit, **kwargs)
+
+        self._run_pre_execute_hooks(expr)
+        sql = self.compile(table_expr, limit=limit, params=params, **kwargs)
+        df = self.con.fetch_df_all(sql, arraysize=_FETCH_ARRAY_SIZE)
+        return expr.__pyarrow_result__(_df_to_pyarrow(df, schema))
+
+    @util.experimental
+    def to_pyarrow_batches(
+        self,
+        expr: ir.Expr,
+        /,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        chunk_size: int = 1_000_000,
+        **_: Any,
+    ) -> pa.ipc.RecordBatchReader:
+        import pyarrow as pa
+
+        from ibis.formats.pyarrow import PyArrowData
+
+        schema = expr.as_table().schema()
+        if not self._can_fetch_arrow(schema):
+            return super().to_pyarrow_batches(
+                expr, params=params, limit=limit, chunk_size=chunk_size
+            )
+
+        self._run_pre_execute_hooks(expr)
+        sql = self.compile(expr, limit=limit, params=params)
+        target_schema = schema.to_pyarrow()
+
+        def batch_producer():
+            for df in self.con.fetch_df_batches(sql, size=chunk_size):
+                table = PyArrowData.convert_table(_df_to_pyarrow(df, schema), schema)
+                yield from table.to_batches()
+
+        return pa.ipc.RecordBatchReader.from_batches(target_schema, batch_producer())
+
     def _fetch_from_cursor(self, cursor, schema: sch.Schema) -> pd.DataFrame:
         # TODO(gforsyth): this can probably be generalized a bit and put into
         # the base backend (or a mixin)
@@ -633,3 +708,10 @@ class Backend(SQLBackend, CanListDatabase, PyArrowExampleLoader):
                 bind.execute(drop)
 
     _finalize_memtable = _drop_cached_table = _clean_up_tmp_table
+
+
+def _df_to_pyarrow(df: Any, schema: sch.Schema) -> pa.Table:
+    """Convert a python-oracledb `DataFrame` to a PyArrow table."""
+    import pyarrow as pa
+
+    return pa.Table.from_arrays(df.column_arrays(), names=list(schema.names))
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pandas as pd
 
 from ibis.formats.pandas import PandasData
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    import ibis.expr.schema as sch
+
 
 class OraclePandasData(PandasData):
     @classmethod
@@ -17,3 +24,34 @@ class OraclePandasData(PandasData):
     @classmethod
     def convert_Time_element(cls, dtype):
         return pd.Timestamp.fromisoformat
+
+
+# VARCHAR2 columns are created with a maximum length of 4000
+_MAX_VARCHAR_LENGTH = 4000
+
+
+def to_input_sizes(table: pa.Table, schema: sch.Schema) -> list:
+    """Compute the `Cursor.setinputsizes` type hints for inserting `table`.
+
+    Hinting the bind types up front avoids rebinding the arrays when a batch
+    starts with NULLs or contains strings longer than the ones seen so far.
+    Columns without a hint are `None`, leaving them to the driver.
+    """
+    import oracledb
+    import pyarrow.compute as pc
+
+    sizes = []
+    for name, dtype in schema.items():
+        if dtype.is_numeric():
+            size = oracledb.DB_TYPE_NUMBER
+        elif dtype.is_string():
+            length = pc.max(pc.utf8_length(table.column(name))).as_py() or 1
+            size = length if length <= _MAX_VARCHAR_LENGTH else None
+        elif dtype.is_date():
+            size = oracledb.DB_TYPE_DATE
+        elif dtype.is_timestamp() and dtype.timezone is None:
+            size = oracledb.DB_TYPE_TIMESTAMP
+        else:
+            size = None
+        sizes.append(size)
+    return sizes
@@ -87,3 +87,40 @@ def test_invalid_port(con):
         match="DPY-6005: cannot connect to database",
     ):
         ibis.connect(url)
+
+
+def test_memtable_array_dml(con):
+    data = {
+        "x": [None, *range(1, 20_001)],
+        "y": [None, *(str(i) * (i % 7) for i in range(1, 20_001))],
+        "z": [float("nan"), *(i / 2 for i in range(1, 20_001))],
+    }
+    t = ibis.memtable(data, schema={"x": "int64", "y": "string", "z": "float64"})
+
+    result = con.to_pyarrow(t.aggregate(n=t.count(), nx=t.x.count(), ny=t.y.count()))
+
+    assert result.to_pylist() == [{"n": 20_001, "nx": 20_000, "ny": 17_143}]
+
+
+def test_arrow_fetch(con, mocker):
+    spy = mocker.spy(con.con, "fetch_df_batches")
+    t = con.tables.functional_alltypes.select("id", "string_col", "double_col")
+
+    batches = list(con.to_pyarrow_batches(t.limit(10), chunk_size=3))
+
+    spy.assert_called_once()
+    assert sum(map(len, batches)) == 10
+    assert all(batch.schema.equals(t.schema().to_pyarrow()) for batch in batches)
+
+
+@pytest.mark.parametrize(
+    ("schema", "expected"),
+    [
+        ({"a": "int64", "b": "string", "c": "decimal(10, 2)"}, True),
+        ({"a": "date", "b": "timestamp", "c": "boolean"}, True),
+        ({"a": "int64", "b": "timestamp('UTC')"}, False),
+        ({"a": "int64", "b": "binary"}, False),
+    ],
+)
+def test_can_fetch_arrow(con, schema, expected):
+    assert con._can_fetch_arrow(ibis.schema(schema)) is expected
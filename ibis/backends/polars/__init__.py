@@ -17,7 +17,11 @@ from ibis.backends.polars.compiler import translate
 from ibis.backends.polars.rewrites import bind_unbound_table, rewrite_join
 from ibis.backends.sql.dialects import Polars
 from ibis.common.dispatch import lazy_singledispatch
-from ibis.expr.rewrites import lower_stringslice, replace_parameter
+from ibis.expr.rewrites import (
+    approximate_reductions,
+    lower_stringslice,
+    replace_parameter,
+)
 from ibis.formats.polars import PolarsSchema
 from ibis.util import gen_name, normalize_filename, normalize_filenames
 
@@ -31,6 +35,7 @@ if TYPE_CHECKING:
 class Backend(BaseBackend, NoUrl, DirectExampleLoader):
     name = "polars"
     dialect = Polars
+    supports_cache_spill = True
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -288,8 +293,11 @@ class Backend(BaseBackend, NoUrl, DirectExampleLoader):
         **kwargs
             Additional keyword arguments passed to Polars loading function.
             See https://pola-rs.github.io/polars/py-polars/html/reference/api/polars.scan_parquet.html
-            for more information (if loading a single file or glob; when loading
-            multiple files polars' `scan_pyarrow_dataset` method is used instead).
+            for more information.
+
+            Polars pushes column selections and filters into the scan, skipping
+            row groups using their statistics and, with `hive_partitioning`
+            (enabled by default for directories), entire partitions.
 
         Returns
         -------
@@ -301,17 +309,12 @@ class Backend(BaseBackend, NoUrl, DirectExampleLoader):
             path = path[0]
 
         if not isinstance(path, (str, Path)) and len(path) > 1:
-            self._import_pyarrow()
-            import pyarrow.dataset as ds
-
+            # scan the files natively rather than through a pyarrow dataset,
+            # which can't use the parquet statistics to skip row groups
             path = [normalize_filename(p) for p in path]
-            obj = pl.scan_pyarrow_dataset(
-                source=ds.dataset(path, format="parquet"), **kwargs
-            )
-            self._add_table(table_name, obj)
         else:
             path = normalize_filename(path)
-            self._add_table(table_name, pl.scan_parquet(path, **kwargs))
+        self._add_table(table_name, pl.scan_parquet(path, **kwargs))
 
         return self.table(table_name)
 
@@ -421,6 +424,8 @@ class Backend(BaseBackend, NoUrl, DirectExampleLoader):
             rewrite_join | replace_parameter | bind_unbound_table | lower_stringslice,
             context={"params": params, "backend": self},
         )
+        if ibis.options.approximate:
+            node = approximate_reductions(node, self.has_operation)
 
         return translate(node, ctx=self._context)
 
@@ -548,6 +553,11 @@ class Backend(BaseBackend, NoUrl, DirectExampleLoader):
     def _drop_cached_table(self, name):
         self.drop_table(name, force=True)
 
+    def _register_spilled_table(self, name, path):
+        # polars memory-maps IPC files it scans
+        self._add_table(name, pl.scan_ipc(path))
+        return self.table(name)
+
 
 @lazy_singledispatch
 def _read_in_memory(source: Any, table_name: str, _conn: Backend, **kwargs: Any):
@@ -76,3 +76,28 @@ def test_engine(con, mocker, to_method):
     mocked_collect = mocker.patch("polars.LazyFrame.collect")
     getattr(con, to_method)(t, engine="gpu")
     mocked_collect.assert_called_once_with(engine="gpu")
+
+
+def test_read_parquet_pushdown(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    paths = []
+    for day in (1, 2):
+        directory = tmp_path / f"date=2024-01-0{day}"
+        directory.mkdir()
+        paths.append(directory / "part-0.parquet")
+        pq.write_table(pa.table({"x": range(10), "y": ["a"] * 10}), paths[-1])
+
+    con = ibis.polars.connect()
+    t = con.read_parquet(paths, hive_partitioning=True)
+    assert "date" in t.columns
+
+    expr = t.filter(t.x > 5).select("x")
+    assert expr.count().execute() == 8
+
+    # the files are scanned natively, with the filter and projection pushed down
+    plan = con.compile(expr).explain()
+    assert "Parquet SCAN" in plan
+    assert "PROJECT 1/3 COLUMNS" in plan
+    assert "SELECTION" in plan
@@ -22,6 +22,7 @@ import hypothesis.strategies as st
 import numpy as np
 import pandas as pd
 import pandas.testing as tm
+import pyarrow as pa
 import pytest
 import sqlglot as sg
 from pytest import param
@@ -495,3 +496,75 @@ def test_insert_overwrite(con, tmp_db, overwrite, insert_overwrite, expected_cou
     con.insert(table, obj=t, overwrite=insert_overwrite, database=schema)
     assert table in con.list_tables(database=schema)
     assert con.table(table, database=schema).count().execute() == expected_count
+
+
+def test_to_pyarrow_batches_copy(con, alltypes, mocker):
+    copy = mocker.spy(con, "_copy_batches")
+    expr = alltypes.mutate(
+        u=ibis.uuid(), j=ibis.literal('{"a": 1}', type="json"), arr=ibis.array([1, 2])
+    ).order_by("id")
+
+    with con.to_pyarrow_batches(expr, chunk_size=1000) as reader:
+        batches = list(reader)
+
+    assert copy.call_count == 1
+    assert [len(batch) for batch in batches[:-1]] == [1000] * (len(batches) - 1)
+
+    result = pa.Table.from_batches(batches)
+    expected = con.execute(alltypes.order_by("id"))
+    tm.assert_frame_equal(
+        result.select(alltypes.columns).to_pandas(), expected, check_dtype=False
+    )
+
+    assert all(len(u) == 36 for u in result["u"].to_pylist())
+    assert set(result["j"].to_pylist()) == {'{"a": 1}'}
+    assert set(map(tuple, result["arr"].to_pylist())) == {(1, 2)}
+
+
+def test_to_pyarrow_batches_uncopyable_types(con, mocker):
+    cursor = mocker.spy(con, "_cursor_batches")
+    expr = ibis.memtable({"a": [1, 2]}).mutate(i=ibis.interval(days=1))
+
+    result = con.to_pyarrow(expr)
+
+    assert cursor.call_count == 1
+    assert result.num_rows == 2
+
+
+def test_incremental_refresh(con):
+    source_name = gen_name("events")
+    totals_name = gen_name("totals")
+    events = con.create_table(
+        source_name,
+        ibis.memtable(
+            {
+                "ts": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+                "user": ["a", "b"],
+                "n": [1, 2],
+            }
+        ),
+        temp=True,
+    )
+    try:
+        totals = con.create_table(
+            totals_name,
+            events.group_by("user").agg(total=events.n.sum(), last=events.ts.max()),
+            incremental_on="ts",
+        )
+
+        con.insert(
+            source_name,
+            ibis.memtable(
+                {"ts": pd.to_datetime(["2024-01-03"]), "user": ["a"], "n": [5]}
+            ),
+        )
+        con.refresh(totals_name)
+
+        result = totals.order_by("user").execute()
+        assert result.total.tolist() == [6, 2]
+        assert result["last"].tolist() == list(
+            pd.to_datetime(["2024-01-03", "2024-01-02"])
+        )
+    finally:
+        con.drop_table(totals_name, force=True)
+        con.drop_table(f"_ibis_incremental_{totals_name}", force=True)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import collections
+import concurrent.futures
 import contextlib
 import functools
 import glob
@@ -520,8 +522,39 @@ $$ {defn["source"]} $$"""
         params: Mapping[ir.Scalar, Any] | None = None,
         limit: int | str | None = None,
         chunk_size: int = 1_000_000,
+        max_workers: int | None = None,
         **kwargs: Any,
     ) -> pa.ipc.RecordBatchReader:
+        """Execute expression and return an iterator of PyArrow record batches.
+
+        This method is eager and will execute the associated expression
+        immediately.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        chunk_size
+            Maximum number of rows in each returned record batch.
+        max_workers
+            If greater than one, download and decode the result chunks that
+            Snowflake produces using up to this many threads. Batches are still
+            returned in result order, and at most `max_workers` chunks are
+            held in memory at a time. By default chunks are fetched one at a
+            time.
+        kwargs
+            Keyword arguments
+
+        Returns
+        -------
+        RecordBatchReader
+            Collection of pyarrow `RecordBatch`s.
+        """
         self._run_pre_execute_hooks(expr)
         sql = self.compile(expr, limit=limit, params=params, **kwargs)
         target_schema = expr.as_table().schema().to_pyarrow()
@@ -529,19 +562,36 @@ $$ {defn["source"]} $$"""
         return pa.ipc.RecordBatchReader.from_batches(
             target_schema,
             self._make_batch_iter(
-                sql, target_schema=target_schema, chunk_size=chunk_size
+                sql,
+                target_schema=target_schema,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
             ),
         )
 
     def _make_batch_iter(
-        self, sql: str, *, target_schema: sch.Schema, chunk_size: int
+        self,
+        sql: str,
+        *,
+        target_schema: sch.Schema,
+        chunk_size: int,
+        max_workers: int | None = None,
     ) -> Iterator[pa.RecordBatch]:
         with self._safe_raw_sql(sql) as cur:
+            if max_workers is not None and max_workers > 1:
+                tables = _fetch_result_batches(
+                    cur.get_result_batches() or [],
+                    connection=self.con,
+                    max_workers=max_workers,
+                )
+            else:
+                tables = cur.fetch_arrow_batches()
+
             yield from itertools.chain.from_iterable(
                 t.rename_columns(target_schema.names)
                 .cast(target_schema)
                 .to_batches(max_chunksize=chunk_size)
-                for t in cur.fetch_arrow_batches()
+                for t in tables
             )
 
     def get_schema(
@@ -583,13 +633,11 @@ $$ {defn["source"]} $$"""
                 raise com.TableNotFound(table.sql(self.dialect)) from e
             raise
 
-        type_mapper = self.compiler.type_mapper
-        return sch.Schema(
-            {
-                name: type_mapper.from_string(typ, nullable=nullable == "Y")
-                for name, typ, _, nullable, *_ in result
-            }
+        names, types, _, nullables, *_ = zip(*result)
+        dtypes = self.compiler.type_mapper.from_strings(
+            types, [nullable == "Y" for nullable in nullables]
         )
+        return sch.Schema(dict(zip(names, dtypes)))
 
     def _get_schema_using_query(self, query: str) -> sch.Schema:
         dialect = self.dialect
@@ -1215,3 +1263,32 @@ $$ {defn["source"]} $$"""
         statement = ";".join(statements)
         with self._safe_raw_sql(statement):
             pass
+
+
+def _fetch_result_batches(
+    result_batches: Iterable[Any], *, connection: Any, max_workers: int
+) -> Iterator[pa.Table]:
+    """Download and decode Snowflake result batches concurrently.
+
+    Tables are yielded in the order of `result_batches`. A new download is only
+    started once the consumer is done with the previously yielded table, so at
+    most `max_workers` batches, including the one being consumed, are in
+    flight or buffered at any time.
+    """
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    pending = collections.deque()
+    batches = iter(result_batches)
+
+    def submit(batch):
+        pending.append(executor.submit(batch.to_arrow, connection=connection))
+
+    try:
+        for batch in itertools.islice(batches, max_workers):
+            submit(batch)
+
+        while pending:
+            yield pending.popleft().result()
+            if (batch := next(batches, None)) is not None:
+                submit(batch)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -462,3 +462,53 @@ def test_fancy_column_names(con, column_name):
     )
     assert t.columns == (column_name,)
     assert t[column_name].sum().execute() == value
+
+
+def test_to_pyarrow_batches_max_workers(con):
+    t = con.tables.functional_alltypes.select("id", "string_col").order_by("id")
+
+    expected = con.to_pyarrow_batches(t).read_all()
+    result = con.to_pyarrow_batches(t, max_workers=4).read_all()
+
+    assert result.equals(expected)
+
+
+def test_fetch_result_batches_preserves_order():
+    import time
+
+    from ibis.backends.snowflake import _fetch_result_batches
+
+    class ResultBatch:
+        def __init__(self, i):
+            self.i = i
+
+        def to_arrow(self, connection=None):
+            # finish later batches first
+            time.sleep(0.001 * (10 - self.i))
+            return pa.table({"i": [self.i]})
+
+    tables = _fetch_result_batches(
+        map(ResultBatch, range(10)), connection=None, max_workers=4
+    )
+    assert [t["i"][0].as_py() for t in tables] == list(range(10))
+
+
+def test_fetch_result_batches_bounds_chunks_in_memory():
+    from ibis.backends.snowflake import _fetch_result_batches
+
+    started = []
+
+    class ResultBatch:
+        def __init__(self, i):
+            self.i = i
+
+        def to_arrow(self, connection=None):
+            started.append(self.i)
+            return pa.table({"i": [self.i]})
+
+    tables = _fetch_result_batches(
+        map(ResultBatch, range(10)), connection=None, max_workers=4
+    )
+    for table in tables:
+        # the table being consumed counts towards the limit
+        assert len(started) - table["i"][0].as_py() <= 4
@@ -1,6 +1,13 @@
 from __future__ import annotations
 
 import abc
+import contextlib
+import functools
+import inspect
+import itertools
+import math
+import re
+import time
 from functools import partial
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -14,9 +21,10 @@ import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
 from ibis.backends import BaseBackend
+from ibis.backends.sql.compilers.base import lowering_in_values
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
 
     import pandas as pd
     import pyarrow as pa
@@ -25,17 +33,346 @@ if TYPE_CHECKING:
     from ibis.expr.schema import SchemaLike
 
 
+def _to_pylist(column: pa.ChunkedArray) -> list:
+    """Convert `column` to a list of Python objects.
+
+    Primitive and string columns are converted through NumPy, whose `tolist`
+    is an order of magnitude faster than `pyarrow.ChunkedArray.to_pylist`.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    typ = column.type
+    if (
+        pa.types.is_integer(typ)
+        or pa.types.is_floating(typ)
+        or pa.types.is_boolean(typ)
+    ):
+        if not column.null_count:
+            return column.to_numpy().tolist()
+        # fill nulls before converting, otherwise integers are upcast to floats
+        mask = column.is_null().to_numpy()
+        values = pc.fill_null(column, False if pa.types.is_boolean(typ) else 0)
+        values = values.to_numpy().astype(object)
+        values[mask] = None
+        return values.tolist()
+    elif (
+        pa.types.is_string(typ)
+        or pa.types.is_large_string(typ)
+        or pa.types.is_binary(typ)
+        or pa.types.is_large_binary(typ)
+    ):
+        return column.to_numpy().tolist()
+    return column.to_pylist()
+
+
+# Maximum number of cached metadata lookups per backend
+_METADATA_CACHE_SIZE = 4096
+
+
+# backend methods whose results are cached, see `SQLBackend.refresh_metadata`
+_CACHED_METADATA_METHODS = frozenset(("get_schema", "list_tables"))
+
+# backend methods that may create, drop or change tables
+_METADATA_METHODS = frozenset(
+    (
+        "attach",
+        "attach_sqlite",
+        "create_catalog",
+        "create_database",
+        "create_materialized_view",
+        "create_sink",
+        "create_source",
+        "create_table",
+        "create_view",
+        "detach",
+        "disconnect",
+        "do_connect",
+        "drop_catalog",
+        "drop_database",
+        "drop_materialized_view",
+        "drop_sink",
+        "drop_source",
+        "drop_table",
+        "drop_table_or_view",
+        "drop_view",
+        "read_csv",
+        "read_csv_dir",
+        "read_delta",
+        "read_geo",
+        "read_json",
+        "read_json_dir",
+        "read_kafka",
+        "read_mysql",
+        "read_parquet",
+        "read_parquet_dir",
+        "read_postgres",
+        "read_sqlite",
+        "read_xlsx",
+        "rename_table",
+    )
+)
+
+# backend methods that may change the data in tables
+_DATA_METHODS = frozenset(("drop_partition", "insert", "truncate_table"))
+
+# backend methods that execute expressions, see `lowering_in_values`
+_EXECUTE_METHODS = frozenset(
+    (
+        "execute",
+        "to_csv",
+        "to_csv_dir",
+        "to_delta",
+        "to_geo",
+        "to_json",
+        "to_pandas",
+        "to_pandas_batches",
+        "to_parquet",
+        "to_parquet_dir",
+        "to_polars",
+        "to_pyarrow",
+        "to_pyarrow_batches",
+        "to_torch",
+        "to_xlsx",
+    )
+)
+
+# leading keywords of statements that don't change tables or data
+_QUERY = re.compile(r"\s*\(*\s*(SELECT|WITH|VALUES|SHOW|DESCRIBE|DESC|EXPLAIN)\b", re.I)
+
+
+def _is_query(query: str | sge.Expression) -> bool:
+    """Whether `query` only reads tables."""
+    if isinstance(query, sge.Expression):
+        return isinstance(query, (sge.Query, sge.Describe))
+    return isinstance(query, str) and _QUERY.match(query) is not None
+
+
+def _cached_metadata(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if ibis.options.sql.metadata_cache_ttl == 0:
+            return method(self, *args, **kwargs)
+        try:
+            key = (method.__name__, args, frozenset(kwargs.items()))
+            value = self._get_cached_metadata(key)
+        except TypeError:
+            # unhashable arguments are never cached
+            return method(self, *args, **kwargs)
+        except KeyError:
+            value = method(self, *args, **kwargs)
+            self._set_cached_metadata(key, value)
+        return list(value) if isinstance(value, list) else value
+
+    return wrapper
+
+
+def _invalidates_metadata(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.refresh_metadata()
+
+    return wrapper
+
+
+def _modifies_data(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._data_version += 1
+
+    return wrapper
+
+
+def _executes(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with lowering_in_values():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _runs_statement(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self, query, *args, **kwargs):
+        try:
+            return method(self, query, *args, **kwargs)
+        finally:
+            if not _is_query(query):
+                self.refresh_metadata()
+
+    return wrapper
+
+
+def _instrument(cls: type) -> None:
+    """Wrap the metadata and data methods of backend class `cls`.
+
+    Methods are looked up through the MRO, so that methods of mixins are
+    wrapped too, and each function is wrapped once.
+    """
+    wrappers = {
+        **dict.fromkeys(_CACHED_METADATA_METHODS, _cached_metadata),
+        **dict.fromkeys(_METADATA_METHODS, _invalidates_metadata),
+        **dict.fromkeys(_DATA_METHODS, _modifies_data),
+        **dict.fromkeys(_EXECUTE_METHODS, _executes),
+        "raw_sql": _runs_statement,
+    }
+    for name, wrap in wrappers.items():
+        method = next(
+            (klass.__dict__[name] for klass in cls.__mro__ if name in klass.__dict__),
+            None,
+        )
+        if inspect.isfunction(method) and not hasattr(method, "__ibis_wrapped__"):
+            wrapper = wrap(method)
+            wrapper.__ibis_wrapped__ = method
+            setattr(cls, name, wrapper)
+
+
 class SQLBackend(BaseBackend):
     compiler: ClassVar[SQLGlotCompiler]
     name: ClassVar[str]
 
     _top_level_methods = ("from_connection",)
 
+    _insert_nan_as_null: ClassVar[bool] = False
+    """Whether NaN is inserted as NULL, for databases that can't store NaN."""
+
+    _data_version: int = 0
+    """Incremented whenever the data in the backend may have changed.
+
+    Used to invalidate results cached on the client, such as interactive
+    previews of expressions.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _instrument(cls)
+
     @property
     def dialect(self) -> sg.Dialect:
         """Return the SQL dialect used by the backend."""
         return self.compiler.dialect
 
+    @functools.cached_property
+    def _metadata_cache(self) -> dict[Hashable, tuple[float, Any]]:
+        return {}
+
+    def _get_cached_metadata(self, key: Hashable) -> Any:
+        """Return the unexpired cached value of `key`, or raise `KeyError`."""
+        if ibis.options.sql.metadata_cache_ttl == 0:
+            raise KeyError(key)
+        expires, value = self._metadata_cache[key]
+        if expires <= time.monotonic():
+            raise KeyError(key)
+        return value
+
+    def _set_cached_metadata(self, key: Hashable, value: Any) -> None:
+        if (ttl := ibis.options.sql.metadata_cache_ttl) == 0:
+            return
+        cache = self._metadata_cache
+        expires = math.inf if ttl is None else time.monotonic() + ttl
+        cache[key] = expires, value
+        if len(cache) > _METADATA_CACHE_SIZE:
+            # evict the oldest entry
+            del cache[next(iter(cache))]
+
+    def refresh_metadata(self) -> None:
+        """Discard cached table schemas, table listings and previews.
+
+        Metadata is only cached when `ibis.options.sql.metadata_cache_ttl` is
+        nonzero. The cache is discarded automatically by DDL issued through
+        the backend, such as `create_table` or `drop_view`, and by statements
+        other than queries run with `raw_sql`; call this method after changing
+        tables from another connection or process.
+        """
+        self._metadata_cache.clear()
+        self._data_version += 1
+
+    def tables_schemas(
+        self,
+        names: Iterable[str],
+        /,
+        *,
+        database: tuple[str, str] | str | None = None,
+    ) -> dict[str, sch.Schema]:
+        """Return the schemas of many tables at once.
+
+        Schemas that aren't cached are fetched together, using a single
+        catalog query on backends that support it, and cached for subsequent
+        calls to `table` and `get_schema`.
+
+        Parameters
+        ----------
+        names
+            Table names
+        database
+            Database containing the tables. To specify a table in a separate
+            catalog, you can pass in the catalog and database as a string
+            `"catalog.database"`, or as a tuple of strings `("catalog",
+            "database")`.
+
+        Returns
+        -------
+        dict[str, Schema]
+            Mapping of table name to schema, in the order of `names`
+
+        Raises
+        ------
+        TableNotFound
+            If any of the tables doesn't exist
+        """
+        table_loc = self._to_sqlglot_table(database)
+        catalog = table_loc.catalog or None
+        database = table_loc.db or None
+
+        def key(name):
+            # matches the way `table` calls `get_schema`
+            kwargs = {"catalog": catalog, "database": database}
+            return "get_schema", (name,), frozenset(kwargs.items())
+
+        schemas = {}
+        missing = []
+        for name in names:
+            try:
+                schemas[name] = self._get_cached_metadata(key(name))
+            except KeyError:
+                schemas[name] = None
+                missing.append(name)
+
+        if missing:
+            fetched = self._get_schemas(missing, catalog=catalog, database=database)
+            for name in missing:
+                if (schema := fetched.get(name)) is None:
+                    raise exc.TableNotFound(name)
+                self._set_cached_metadata(key(name), schema)
+                schemas[name] = schema
+        return schemas
+
+    def _get_schemas(
+        self,
+        names: list[str],
+        *,
+        catalog: str | None = None,
+        database: str | None = None,
+    ) -> dict[str, sch.Schema]:
+        """Fetch the schemas of the existing tables among `names`.
+
+        Backends that can look up many tables in one query override this.
+        """
+        schemas = {}
+        for name in names:
+            with contextlib.suppress(exc.TableNotFound):
+                schemas[name] = self.get_schema(
+                    name, catalog=catalog, database=database
+                )
+        return schemas
+
     @classmethod
     def has_operation(cls, operation: type[ops.Value], /) -> bool:
         """Return whether the backend supports the given operation.
@@ -45,15 +382,7 @@ class SQLBackend(BaseBackend):
         operation
             Operation type, a Python class object.
         """
-        compiler = cls.compiler
-        if operation in compiler.extra_supported_ops:
-            return True
-        method = getattr(compiler, f"visit_{operation.__name__}", None)
-        return method not in (
-            None,
-            compiler.visit_Undefined,
-            compiler.visit_Unsupported,
-        )
+        return cls.compiler.has_operation(operation)
 
     def _fetch_from_cursor(self, cursor, schema: sch.Schema) -> pd.DataFrame:
         import pandas as pd
@@ -200,20 +529,49 @@ class SQLBackend(BaseBackend):
         sql = self.compiler.add_query_to_expr(name=name, table=table, query=query)
         return self._get_schema_using_query(sql)
 
+    def _register_in_memory_tables(self, expr: ir.Expr) -> None:
+        # when executing, large literal `isin` lists are compiled to
+        # semi-joins against in-memory tables, which are registered here
+        op = self.compiler.lower_in_values(expr.op())
+        super()._register_in_memory_tables(op.to_expr())
+
+    @property
+    def _registered_udfs(self) -> dict[str, Hashable]:
+        """The UDF definitions registered on the current connection, by name.
+
+        The mapping is reset whenever the underlying connection changes, so
+        UDFs are registered again after a `reconnect`.
+        """
+        con = getattr(self, "con", None)
+        registered_con, registered = self.__dict__.get("_udf_registry", (None, None))
+        if registered is None or registered_con is not con:
+            registered = {}
+            self._udf_registry = con, registered
+        return registered
+
     def _register_udfs(self, expr: ir.Expr) -> None:
+        registered = self._registered_udfs
         udf_sources = []
+        udfs = {}
         compiler = self.compiler
         for udf_node in expr.op().find(ops.ScalarUDF):
+            # udf node classes are unique per definition, so the class
+            # identifies the function, its signature and its configuration
+            name = type(udf_node).__name__
+            if registered.get(name) is type(udf_node):
+                continue
             compile_func = getattr(
                 compiler, f"_compile_{udf_node.__input_type__.name.lower()}_udf"
             )
             if sql := compile_func(udf_node):
                 udf_sources.append(sql)
+            udfs[name] = type(udf_node)
         if udf_sources:
             # define every udf in one execution to avoid the overhead of db
             # round trips per udf
             with self._safe_raw_sql(";\n".join(udf_sources)):
                 pass
+        registered.update(udfs)
 
     def create_view(
         self,
@@ -500,6 +858,7 @@ class SQLBackend(BaseBackend):
         catalog: str | None = None,
         columns: bool = False,
         placeholder: str = "?",
+        rows: int = 1,
     ) -> str:
         """Builds an INSERT INTO table VALUES query string with placeholders.
 
@@ -515,6 +874,9 @@ class SQLBackend(BaseBackend):
             Whether to render the columns to insert into
         placeholder
             Placeholder string. Can be a format string with a single `{i}` spec.
+        rows
+            Number of rows in the VALUES clause. Placeholders are numbered
+            consecutively across rows.
 
         Returns
         -------
@@ -522,15 +884,17 @@ class SQLBackend(BaseBackend):
             The query string
         """
         quoted = self.compiler.quoted
+        ncols = len(schema)
         return sge.insert(
             sge.Values(
                 expressions=[
                     sge.Tuple(
                         expressions=[
                             sge.Var(this=placeholder.format(i=i))
-                            for i in range(len(schema))
+                            for i in range(row * ncols, (row + 1) * ncols)
                         ]
                     )
+                    for row in range(rows)
                 ]
             ),
             into=sg.table(name, catalog=catalog, quoted=quoted),
@@ -541,6 +905,113 @@ class SQLBackend(BaseBackend):
             ),
         ).sql(self.dialect)
 
+    def _to_insert_columns(self, table: pa.Table, schema: sch.Schema) -> list[list]:
+        """Convert `table` to one list of driver-bindable values per column.
+
+        Backends whose driver can't bind some of the resulting Python values
+        override this.
+        """
+        columns = [_to_pylist(table.column(name)) for name in schema.names]
+        if self._insert_nan_as_null:
+            for i, dtype in enumerate(schema.types):
+                if dtype.is_floating():
+                    columns[i] = [None if v != v else v for v in columns[i]]
+        return columns
+
+    def _to_insert_table(self, op: ops.InMemoryTable) -> pa.Table:
+        """Return the data backing `op` as an Arrow table with its schema."""
+        return op.data.to_pyarrow(op.schema)
+
+    def _iter_insert_chunks(
+        self, table: pa.Table, schema: sch.Schema, *, chunk_size: int
+    ) -> Iterator[Iterator[tuple]]:
+        """Yield the rows of `table`, `chunk_size` rows at a time.
+
+        Each chunk is converted to Python values a column at a time.
+        """
+        for offset in range(0, table.num_rows, chunk_size):
+            chunk = table.slice(offset, chunk_size)
+            yield zip(*self._to_insert_columns(chunk, schema))
+
+    def _bulk_insert(
+        self,
+        cur: Any,
+        op: ops.InMemoryTable,
+        *,
+        name: str,
+        catalog: str | None = None,
+        columns: bool = True,
+        placeholder: str = "?",
+        max_rows_per_statement: int = 1,
+        max_parameters: int | None = None,
+        chunk_size: int = 100_000,
+    ) -> None:
+        """Insert the data backing `op` into the table `name` using `cur`.
+
+        Rows are passed to `cur.executemany` in chunks of `chunk_size` rows.
+        When `max_rows_per_statement` is greater than one, rows are bound
+        through a prepared multi-row VALUES statement of up to that many rows
+        (and at most `max_parameters` placeholders), with the remainder of each
+        chunk inserted one row at a time.
+
+        Parameters
+        ----------
+        cur
+            DB-API cursor to insert with
+        op
+            In-memory table whose data is inserted
+        name
+            Name of the table to insert into
+        catalog
+            Catalog name of the table to insert into
+        columns
+            Whether to insert into the columns of `op` by name, as opposed to
+            by position
+        placeholder
+            Placeholder string. Can be a format string with a single `{i}` spec.
+        max_rows_per_statement
+            Maximum number of rows in a single INSERT statement
+        max_parameters
+            Maximum number of placeholders in a single INSERT statement
+        chunk_size
+            Number of rows converted and passed to the driver at a time
+        """
+        schema = op.schema
+        if not (ncols := len(schema)):
+            return
+
+        rows_per_stmt = max_rows_per_statement
+        if max_parameters is not None:
+            rows_per_stmt = min(rows_per_stmt, max_parameters // ncols)
+        rows_per_stmt = max(1, rows_per_stmt)
+        # keep chunk boundaries aligned to whole multi-row statements
+        chunk_size = max(rows_per_stmt, chunk_size - chunk_size % rows_per_stmt)
+
+        make_template = partial(
+            self._build_insert_template,
+            name,
+            schema=schema,
+            catalog=catalog,
+            columns=columns,
+            placeholder=placeholder,
+        )
+        single_row_stmt = make_template()
+        multi_row_stmt = (
+            make_template(rows=rows_per_stmt) if rows_per_stmt > 1 else None
+        )
+
+        table = self._to_insert_table(op)
+        for rows in self._iter_insert_chunks(table, schema, chunk_size=chunk_size):
+            if multi_row_stmt is not None:
+                rows = list(rows)
+                if nmulti := len(rows) - len(rows) % rows_per_stmt:
+                    values = itertools.chain.from_iterable(rows[:nmulti])
+                    cur.executemany(
+                        multi_row_stmt, zip(*[values] * (rows_per_stmt * ncols))
+                    )
+                rows = rows[nmulti:]
+            cur.executemany(single_row_stmt, rows)
+
     def truncate_table(self, name: str, /, *, database: str | None = None) -> None:
         """Delete all rows from a table.
 
@@ -684,3 +1155,6 @@ class SQLBackend(BaseBackend):
 
     def _finalize_memtable(self, name: str) -> None:
         self.drop_table(name, force=True)
+
+
+_instrument(SQLBackend)
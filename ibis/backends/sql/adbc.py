@@ -0,0 +1,181 @@
+"""Arrow Database Connectivity (ADBC) transport for SQL backends."""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
+
+import ibis.expr.operations as ops
+from ibis import util
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    import pandas as pd
+    import pyarrow as pa
+
+    import ibis.expr.types as ir
+
+
+class AdbcTransport:
+    """A mixin for SQL backends that can move data through an ADBC driver.
+
+    ADBC drivers exchange Arrow data with the database, so results are fetched
+    as columnar batches instead of row by row through a DB-API cursor, and
+    in-memory data is loaded with the driver's bulk ingestion.
+
+    Backends opt in by listing this class before `SQLBackend` in their bases,
+    setting `adbc_driver` and calling `_adbc_connect` from `do_connect`. The
+    ADBC connection is opened next to the backend's own connection to the same
+    database, which still handles everything else. Queries that depend on
+    objects only that connection knows about, such as in-memory tables and
+    Python UDFs, keep using it. Backends that implement `to_pyarrow_batches`
+    or `execute` themselves defer to this class when `_uses_adbc` is true.
+    """
+
+    adbc_driver: ClassVar[str]
+    """Name of the ADBC driver, e.g. `"sqlite"` for `adbc_driver_sqlite`."""
+
+    _adbc = None
+
+    def _adbc_connect(self, uri: str, /, **kwargs: Any) -> None:
+        """Open an ADBC connection to `uri` with the backend's driver."""
+        package = f"adbc_driver_{self.adbc_driver}"
+        try:
+            dbapi = importlib.import_module(f"{package}.dbapi")
+        except ImportError:
+            raise ImportError(
+                f"The {package} package is required to use ADBC with the "
+                f"{self.name} backend. You can install it using pip:\n\n"
+                f"pip install {package.replace('_', '-')}\n"
+            )
+        self._adbc = dbapi.connect(uri, **kwargs)
+
+    def disconnect(self) -> None:
+        if self._adbc is not None:
+            self._adbc.close()
+            self._adbc = None
+        super().disconnect()
+
+    def _uses_adbc(self, expr: ir.Expr) -> bool:
+        """Whether the result of `expr` is fetched through ADBC."""
+        return self._adbc is not None and not expr.op().find(
+            (ops.InMemoryTable, ops.ScalarUDF, ops.AggUDF)
+        )
+
+    @contextlib.contextmanager
+    def _adbc_cursor(self) -> Iterator[Any]:
+        """Yield an ADBC cursor in a transaction that is committed on success."""
+        cursor = self._adbc.cursor()
+        try:
+            yield cursor
+        except BaseException:
+            self._adbc.rollback()
+            raise
+        else:
+            self._adbc.commit()
+        finally:
+            cursor.close()
+
+    def _adbc_fetch(self, query: str, /) -> pa.RecordBatchReader:
+        """Execute `query` and stream its result."""
+        import pyarrow as pa
+
+        con = self._adbc
+        cursor = con.cursor()
+        try:
+            cursor.execute(query)
+            reader = cursor.fetch_record_batch()
+        except BaseException:
+            cursor.close()
+            con.rollback()
+            raise
+
+        def batches():
+            # the transaction ends once the result is consumed or discarded
+            try:
+                yield from reader
+            except BaseException:
+                con.rollback()
+                raise
+            else:
+                con.commit()
+            finally:
+                cursor.close()
+
+        return pa.RecordBatchReader.from_batches(reader.schema, batches())
+
+    @staticmethod
+    def _adbc_ingest(
+        cursor: Any,
+        name: str,
+        /,
+        data: pa.Table | pa.RecordBatchReader,
+        *,
+        mode: Literal["append", "create", "replace", "create_append"] = "append",
+        catalog: str | None = None,
+        database: str | None = None,
+        temporary: bool = False,
+    ) -> int:
+        """Bulk load `data` into table `name`, returning the number of rows."""
+        namespace = {"catalog_name": catalog, "db_schema_name": database}
+        return cursor.adbc_ingest(
+            name,
+            data,
+            mode=mode,
+            temporary=temporary,
+            **{key: value for key, value in namespace.items() if value is not None},
+        )
+
+    @util.experimental
+    def to_pyarrow_batches(
+        self,
+        expr: ir.Expr,
+        /,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        chunk_size: int = 1_000_000,
+        **kwargs: Any,
+    ) -> pa.ipc.RecordBatchReader:
+        if not self._uses_adbc(expr):
+            return super().to_pyarrow_batches(
+                expr, params=params, limit=limit, chunk_size=chunk_size, **kwargs
+            )
+
+        import pyarrow as pa
+
+        from ibis.formats.pyarrow import PyArrowData
+
+        self._run_pre_execute_hooks(expr)
+
+        schema = expr.as_table().schema()
+        reader = self._adbc_fetch(self.compile(expr, limit=limit, params=params))
+
+        def batches():
+            for batch in reader:
+                # drivers type columns from their values, e.g. timestamps
+                # stored as text come back as strings
+                batch = PyArrowData.convert_table(batch, schema)
+                for start in range(0, max(batch.num_rows, 1), chunk_size):
+                    yield batch.slice(start, chunk_size)
+
+        return pa.RecordBatchReader.from_batches(schema.to_pyarrow(), batches())
+
+    def execute(
+        self,
+        expr: ir.Expr,
+        /,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        **kwargs: Any,
+    ) -> pd.DataFrame | pd.Series | Any:
+        if not self._uses_adbc(expr):
+            return super().execute(expr, params=params, limit=limit, **kwargs)
+
+        with self.to_pyarrow_batches(
+            expr, params=params, limit=limit, **kwargs
+        ) as reader:
+            return expr.__pandas_result__(reader.read_pandas(timestamp_as_object=True))
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import abc
 import calendar
+import contextlib
+import contextvars
 import itertools
 import math
 import operator
@@ -25,13 +27,14 @@ from ibis.backends.sql.rewrites import (
     empty_in_values_right_side,
     lower_bucket,
     lower_capitalize,
+    lower_large_in_values,
     lower_sample,
     one_to_zero_index,
     sqlize,
 )
 from ibis.config import options
 from ibis.expr.operations.udf import InputType
-from ibis.expr.rewrites import lower_stringslice
+from ibis.expr.rewrites import approximate_reductions, lower_stringslice
 from ibis.util import get_subclasses
 
 try:
@@ -60,6 +63,24 @@ if TYPE_CHECKING:
 
 ALL_OPERATIONS = frozenset(get_subclasses(ops.Node))
 
+_lowering_in_values: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "lowering_in_values", default=False
+)
+
+
+@contextlib.contextmanager
+def lowering_in_values():
+    """Lower large literal `isin` lists while the block runs.
+
+    Backends enter this while executing an expression, after which the
+    in-memory tables that the lists are lowered to must be registered.
+    """
+    token = _lowering_in_values.set(True)
+    try:
+        yield
+    finally:
+        _lowering_in_values.reset(token)
+
 
 class AggGen:
     """A descriptor for compiling aggregate functions.
@@ -274,6 +295,13 @@ class SQLGlotCompiler(abc.ABC):
     supports_qualify: bool = False
     """Whether the backend supports the QUALIFY clause."""
 
+    supports_in_subquery: bool = True
+    """Whether `x IN (SELECT ...)` is supported wherever a boolean is.
+
+    Large literal `isin` lists are only compiled to semi-joins against
+    in-memory tables when this is true.
+    """
+
     NAN: ClassVar[sge.Expression] = sge.Cast(
         this=sge.convert("NaN"), to=sge.DataType(this=sge.DataType.Type.DOUBLE)
     )
@@ -603,6 +631,37 @@ class SQLGlotCompiler(abc.ABC):
         assert not isinstance(sql, sge.Subquery)
         return sql
 
+    def lower_in_values(self, op: ops.Node) -> ops.Node:
+        """Lower large literal `isin` lists in `op` to in-memory table semi-joins.
+
+        Lists are lowered when they're longer than
+        `ibis.options.sql.isin_memtable_threshold`, and only inside
+        `lowering_in_values`: the in-memory tables are temporary, so SQL that
+        outlives the expression must keep the literal lists.
+        """
+        if not _lowering_in_values.get():
+            return op
+        threshold = options.sql.isin_memtable_threshold
+        return lower_large_in_values(
+            op, threshold if self.supports_in_subquery else None
+        )
+
+    def has_operation(self, operation: type[ops.Value], /) -> bool:
+        """Return whether the compiler can translate `operation`."""
+        if operation in self.extra_supported_ops:
+            return True
+        method = getattr(self, f"visit_{operation.__name__}", None)
+        return method not in (None, self.visit_Undefined, self.visit_Unsupported)
+
+    def lower_to_approximate(self, op: ops.Node) -> ops.Node:
+        """Rewrite exact reductions in `op` to supported approximate ones.
+
+        Reductions are rewritten when `ibis.options.approximate` is set.
+        """
+        if not options.approximate:
+            return op
+        return approximate_reductions(op, self.has_operation)
+
     def translate(self, op, *, params: Mapping[ir.Value, Any]) -> sge.Expression:
         """Translate an ibis operation to a sqlglot expression.
 
@@ -628,6 +687,8 @@ class SQLGlotCompiler(abc.ABC):
         # substitute parameters immediately to avoid having to define a
         # ScalarParameter translation rule
         params = self._prepare_params(params)
+        op = self.lower_in_values(op)
+        op = self.lower_to_approximate(op)
         if self.lowered_ops:
             op = op.replace(reduce(operator.or_, self.lowered_ops.values()))
         op, ctes = sqlize(
@@ -241,7 +241,8 @@ class BigQueryCompiler(SQLGlotCompiler):
         table_expr = expr.as_table()
 
         memtable_names = frozenset(
-            op.name for op in table_expr.op().find(ops.InMemoryTable)
+            op.name
+            for op in self.lower_in_values(table_expr.op()).find(ops.InMemoryTable)
         )
 
         result = sql.transform(
@@ -27,6 +27,8 @@ class DataFusionCompiler(SQLGlotCompiler):
 
     agg = AggGen(supports_filter=True, supports_order_by=True)
 
+    supports_in_subquery = False
+
     post_rewrites = (split_select_distinct_with_order_by,)
 
     UNSUPPORTED_OPS = (
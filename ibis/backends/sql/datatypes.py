@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
+import itertools
 from functools import partial
-from typing import NoReturn
+from typing import TYPE_CHECKING, NoReturn
 
 import sqlglot as sg
 import sqlglot.expressions as sge
@@ -12,6 +14,9 @@ from ibis.common.collections import FrozenDict
 from ibis.formats import TypeMapper
 from ibis.util import get_subclasses
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 typecode = sge.DataType.Type
 
 _from_sqlglot_types = {
@@ -180,11 +185,49 @@ class SqlglotType(TypeMapper):
 
     @classmethod
     def from_string(cls, text: str, nullable: bool | None = None) -> dt.DataType:
-        if dtype := cls.unknown_type_strings.get(text.lower()):
-            return dtype
-
         if nullable is None:
             nullable = cls.default_nullable
+        return cls._from_string(text, nullable)
+
+    @classmethod
+    def from_strings(
+        cls,
+        texts: Iterable[str],
+        nullable: bool | Iterable[bool | None] | None = None,
+    ) -> list[dt.DataType]:
+        """Convert many type strings to ibis types.
+
+        Each distinct type string (and nullability) is parsed once, which
+        matters for wide tables where the same types repeat across columns.
+
+        Parameters
+        ----------
+        texts
+            The type strings to convert.
+        nullable
+            Either a single nullability applied to every type, or one
+            nullability per type string.
+
+        Returns
+        -------
+        list[dt.DataType]
+            The ibis types, in the same order as `texts`.
+        """
+        if nullable is None or isinstance(nullable, bool):
+            nullable = itertools.repeat(nullable)
+        keys = list(zip(texts, nullable))
+        dtypes = {
+            key: cls.from_string(key[0], nullable=key[1]) for key in dict.fromkeys(keys)
+        }
+        return [dtypes[key] for key in keys]
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _from_string(cls, text: str, nullable: bool) -> dt.DataType:
+        # memoized per type mapper class (and therefore per dialect), since
+        # parsing with sqlglot dominates the cost of fetching a schema
+        if dtype := cls.unknown_type_strings.get(text.lower()):
+            return dtype
 
         try:
             sgtype = sg.parse_one(text, into=sge.DataType, read=cls.dialect)
@@ -0,0 +1,352 @@
+"""Incrementally maintained tables for SQL backends."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import sqlglot as sg
+import sqlglot.expressions as sge
+
+import ibis
+import ibis.common.exceptions as exc
+import ibis.expr.operations as ops
+import ibis.expr.types as ir
+from ibis import util
+
+if TYPE_CHECKING:
+    import ibis.expr.datatypes as dt
+
+# reductions whose results over a new slice can be merged with the stored
+# results, mapped to the reduction that merges them
+_MERGEABLE_REDUCTIONS = {
+    ops.Sum: "sum",
+    ops.Count: "sum",
+    ops.CountStar: "sum",
+    ops.Min: "min",
+    ops.Max: "max",
+}
+
+
+class CanMaterializeIncrementally:
+    """A mixin for SQL backends whose tables can be refreshed from new rows.
+
+    Each maintained table has a one row state table next to it, holding the
+    definition of the table as JSON, that is its source table, watermark
+    column and how aggregates are merged, and the range `(watermark, upper]`
+    of watermark values to read next, in columns of the watermark's type.
+
+    The rows to merge are computed by a view over the source restricted to
+    that range, compiled from the table's expression when it's created.
+    """
+
+    _incremental_state_prefix: ClassVar[str] = "_ibis_incremental_"
+    """Prefix of the names of the tables storing definitions and watermarks."""
+
+    _incremental_delta_prefix: ClassVar[str] = "_ibis_delta_"
+    """Prefix of the names of the views computing the rows to merge."""
+
+    @staticmethod
+    def _incremental_source(expr: ir.Table, column: str) -> ops.UnboundTable:
+        """Return the source table of unbound `expr` if it can be maintained."""
+        node = expr.op()
+        if isinstance(node, ops.Aggregate):
+            for name, metric in node.metrics.items():
+                if type(metric) not in _MERGEABLE_REDUCTIONS:
+                    raise exc.UnsupportedOperationError(
+                        f"Metric {name!r} is a {type(metric).__name__}, which "
+                        "cannot be merged incrementally; only "
+                        f"{', '.join(t.__name__ for t in _MERGEABLE_REDUCTIONS)} "
+                        "are supported"
+                    )
+            node = node.parent
+
+        relations = node.find(ops.Relation)
+        for rel in relations:
+            if not isinstance(rel, (ops.Filter, ops.Project, ops.PhysicalTable)):
+                raise exc.UnsupportedOperationError(
+                    f"{type(rel).__name__} cannot be maintained incrementally; "
+                    "only filters and projections, optionally followed by an "
+                    "aggregation, are supported"
+                )
+        if node.find((ops.WindowFunction, ops.Reduction, ops.Impure)):
+            raise exc.UnsupportedOperationError(
+                "Window functions, subqueries and impure functions cannot be "
+                "maintained incrementally"
+            )
+
+        sources = node.find(ops.PhysicalTable)
+        if len(sources) != 1 or not isinstance(sources[0], ops.UnboundTable):
+            raise exc.UnsupportedOperationError(
+                "Incrementally maintained tables must derive from exactly one "
+                "database table"
+            )
+        (source,) = sources
+        if column not in source.schema:
+            raise exc.IbisInputError(
+                f"Column {column!r} is not in the source table {source.name!r}"
+            )
+        return source
+
+    @staticmethod
+    def _incremental_slice(table: ir.Table, column: str, state: ir.Table) -> ir.Table:
+        """Restrict `table` to the rows whose `column` is in the range of `state`."""
+        col = table[column]
+        lower = state.watermark.as_scalar()
+        return table.filter(
+            col <= state.upper.as_scalar(), lower.isnull() | (col > lower)
+        )
+
+    @staticmethod
+    def _incremental_state(
+        definition: str, watermark: Any, upper: Any, dtype: dt.DataType
+    ) -> ir.Table:
+        """Return the row of a state table as an expression."""
+        dtype = dtype.copy(nullable=True)
+        return (
+            ibis.literal(definition)
+            .name("definition")
+            .as_table()
+            .mutate(
+                watermark=ibis.literal(watermark, type=dtype),
+                upper=ibis.literal(upper, type=dtype),
+            )
+        )
+
+    def _set_incremental_state(
+        self,
+        name: str,
+        definition: str,
+        watermark: Any,
+        upper: Any,
+        dtype: dt.DataType,
+        *,
+        catalog: str | None,
+        db: str | None,
+    ) -> list[sge.Expression]:
+        """Return the statements replacing the row of state table `name`."""
+        return [
+            sge.delete(
+                sg.table(name, db=db, catalog=catalog, quoted=self.compiler.quoted)
+            ),
+            self._build_insert_from_table(
+                target=name,
+                source=self._incremental_state(definition, watermark, upper, dtype),
+                db=db,
+                catalog=catalog,
+            ),
+        ]
+
+    def _create_incremental_table(
+        self,
+        name: str,
+        obj: ir.Table,
+        *,
+        incremental_on: str,
+        database: str | None = None,
+        temp: bool = False,
+        overwrite: bool = False,
+    ) -> ir.Table:
+        if not isinstance(obj, ir.Table):
+            raise exc.IbisInputError(
+                "`incremental_on` requires `obj` to be an ibis table expression"
+            )
+        expr = obj.unbind()
+        source = self._incremental_source(expr, incremental_on)
+        dtype = source.schema[incremental_on]
+        watermark = self.to_pyarrow(source.to_expr()[incremental_on].max()).as_py()
+
+        node = expr.op()
+        definition = {
+            "source": [
+                source.name,
+                source.namespace.catalog,
+                source.namespace.database,
+            ],
+            "column": incremental_on,
+        }
+        if isinstance(node, ops.Aggregate):
+            definition["groups"] = list(node.groups)
+            definition["metrics"] = {
+                metric: _MERGEABLE_REDUCTIONS[type(op)]
+                for metric, op in node.metrics.items()
+            }
+        definition = json.dumps(definition)
+
+        # the table starts out as the rows up to the current watermark
+        state_name = f"{self._incremental_state_prefix}{name}"
+        state = self.create_table(
+            state_name,
+            self._incremental_state(definition, None, watermark, dtype),
+            database=database,
+            temp=temp,
+            overwrite=True,
+        )
+        sliced = self._incremental_slice(source.to_expr(), incremental_on, state)
+        delta = node.replace({source: sliced.op()}).to_expr()
+        delta_name = f"{self._incremental_delta_prefix}{name}"
+        catalog, db = self._to_catalog_db_tuple(self._to_sqlglot_table(database))
+        view = sg.table(delta_name, db=db, catalog=catalog, quoted=self.compiler.quoted)
+        self.drop_view(delta_name, database=database, force=True)
+        with self._safe_raw_sql(
+            sge.Create(
+                this=view,
+                kind="VIEW",
+                expression=self.compile(delta),
+                properties=sge.Properties(expressions=[sge.TemporaryProperty()])
+                if temp
+                else None,
+            )
+        ):
+            pass
+
+        result = self.create_table(
+            name,
+            delta,
+            database=database,
+            temp=temp,
+            overwrite=overwrite,
+        )
+        with self.begin() as cur:
+            for statement in self._set_incremental_state(
+                state_name,
+                definition,
+                watermark,
+                watermark,
+                dtype,
+                catalog=catalog,
+                db=db,
+            ):
+                cur.execute(statement.sql(self.dialect))
+        return result
+
+    def refresh(
+        self, name: str, /, *, database: str | tuple[str, str] | None = None
+    ) -> ir.Table:
+        """Bring an incrementally maintained table up to date with its source.
+
+        Only source rows whose watermark column is greater than the largest
+        value seen by the previous refresh are computed and merged into the
+        table: they are appended for filters and projections, and combined with
+        the existing groups for aggregations. Sources are assumed to be append
+        only, with rows arriving in watermark order; rows whose watermark
+        column is `NULL` are never included. The table and its watermark are
+        updated in a single transaction.
+
+        Parameters
+        ----------
+        name
+            Name of a table created with `create_table(..., incremental_on=...)`.
+        database
+            The database the table was created in.
+
+        Returns
+        -------
+        Table
+            The refreshed table.
+
+        Examples
+        --------
+        >>> import ibis
+        >>> con = ibis.duckdb.connect()
+        >>> events = con.create_table(
+        ...     "events", ibis.memtable({"ts": [1, 2], "user": ["a", "b"], "n": [1, 2]})
+        ... )
+        >>> totals = con.create_table(
+        ...     "totals",
+        ...     events.group_by("user").agg(n=events.n.sum()),
+        ...     incremental_on="ts",
+        ... )
+        >>> con.insert("events", ibis.memtable({"ts": [3], "user": ["a"], "n": [5]}))
+        >>> con.refresh("totals").order_by("user").to_pyarrow().to_pylist()
+        [{'user': 'a', 'n': 6}, {'user': 'b', 'n': 2}]
+
+        """
+        state_name = f"{self._incremental_state_prefix}{name}"
+        try:
+            state = self.table(state_name, database=database)
+        except exc.TableNotFound:
+            raise exc.IbisInputError(
+                f"{name!r} was not created with `incremental_on`"
+            ) from None
+        dtype = state.schema()["watermark"]
+        (row,) = state.to_pyarrow().to_pylist()
+        definition = json.loads(row["definition"])
+        watermark = row["watermark"]
+
+        source_name, source_catalog, source_db = definition["source"]
+        source = self.table(
+            source_name,
+            database=source_db
+            if source_catalog is None
+            else (source_catalog, source_db),
+        )
+        upper = self.to_pyarrow(source[definition["column"]].max()).as_py()
+        if upper is None or (watermark is not None and upper <= watermark):
+            return self.table(name, database=database)
+
+        catalog, db = self._to_catalog_db_tuple(self._to_sqlglot_table(database))
+        quoted = self.compiler.quoted
+        # the view reads the rows up to `upper` once it's stored
+        with self.begin() as cur:
+            for statement in self._set_incremental_state(
+                state_name,
+                row["definition"],
+                watermark,
+                upper,
+                dtype,
+                catalog=catalog,
+                db=db,
+            ):
+                cur.execute(statement.sql(self.dialect))
+
+        current = self.table(name, database=database)
+        schema = current.schema()
+        # the types of the view are those the backend infers, e.g. wider sums
+        delta = self.table(
+            f"{self._incremental_delta_prefix}{name}", database=database
+        ).cast(schema)
+        staging = util.gen_name("incremental")
+        try:
+            if (groups := definition.get("groups")) is not None:
+                combined = current.union(delta)
+                merged = combined.group_by(groups).agg(
+                    {
+                        metric: getattr(combined[metric], how)()
+                        for metric, how in definition["metrics"].items()
+                    }
+                )
+                # the merged groups are read from the table, so they are
+                # materialized before its rows are replaced
+                self.create_table(staging, merged.cast(schema), temp=True)
+                statements = [
+                    sge.delete(sg.table(name, db=db, catalog=catalog, quoted=quoted)),
+                    self._build_insert_from_table(
+                        target=name,
+                        source=self.table(staging),
+                        db=db,
+                        catalog=catalog,
+                    ),
+                ]
+            else:
+                statements = [
+                    self._build_insert_from_table(
+                        target=name, source=delta, db=db, catalog=catalog
+                    )
+                ]
+            statements += self._set_incremental_state(
+                state_name,
+                row["definition"],
+                upper,
+                upper,
+                dtype,
+                catalog=catalog,
+                db=db,
+            )
+            with self.begin() as cur:
+                for statement in statements:
+                    cur.execute(statement.sql(self.dialect))
+        finally:
+            self._data_version += 1
+            self.drop_table(staging, force=True)
+        return self.table(name, database=database)
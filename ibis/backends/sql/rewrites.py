@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import operator
 import sys
+import weakref
 from collections.abc import Mapping
 from functools import reduce
 from typing import TYPE_CHECKING, Any
@@ -470,6 +471,81 @@ def add_order_by_to_empty_ranking_window_functions(_, **kwargs):
 empty_in_values_right_side = p.InValues(options=()) >> d.Literal(False, dtype=dt.bool)
 
 
+# The in-memory table of each lowered `isin` call, so that compiling an
+# expression and registering its memtables agree on the same table. Entries
+# live exactly as long as the `isin` node, which keeps its table alive (and
+# registered) for as long as an expression referencing it exists.
+_in_values_memtables: weakref.WeakKeyDictionary[
+    ops.InValues, ops.InMemoryTable | None
+] = weakref.WeakKeyDictionary()
+
+
+def _in_values_memtable(node: ops.InValues) -> ops.InMemoryTable | None:
+    try:
+        return _in_values_memtables[node]
+    except KeyError:
+        table = _in_values_memtables[node] = _make_in_values_memtable(node)
+        return table
+
+
+def _make_in_values_memtable(node: ops.InValues) -> ops.InMemoryTable | None:
+    import pyarrow as pa
+
+    import ibis
+    from ibis.formats.pyarrow import PyArrowType
+
+    dtype = node.value.dtype
+    if dtype.is_null() or not all(
+        isinstance(option, ops.Literal) for option in node.options
+    ):
+        return None
+    try:
+        values = pa.array(
+            [option.value for option in node.options],
+            type=PyArrowType.from_ibis(dtype.copy(nullable=True)),
+        )
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+    return ibis.memtable(pa.table({"value": values})).op()
+
+
+@replace(p.InValues)
+def in_values_to_memtable(_, threshold, **kwargs):
+    """Replace a large literal `isin` list with a semi-join on an in-memory table."""
+    if len(_.options) <= threshold or (table := _in_values_memtable(_)) is None:
+        return _
+    return ops.InSubquery(
+        ops.Project(table, {"value": ops.Field(table, "value")}), _.value
+    )
+
+
+def lower_large_in_values(node: ops.Node, threshold: int | None) -> ops.Node:
+    """Lower literal `isin` lists with more than `threshold` values to semi-joins.
+
+    Parameters
+    ----------
+    node
+        The root node of the expression graph.
+    threshold
+        The maximum number of values to keep as an `IN (...)` list, or `None`
+        to leave every list as is.
+
+    Returns
+    -------
+    The rewritten expression graph.
+
+    """
+    if threshold is None:
+        return node
+    # literals can't contain an `InValues`, and skipping them keeps the
+    # traversal cheap for the very lists this rewrite is meant for
+    return node.replace(
+        in_values_to_memtable,
+        filter=lambda node: not isinstance(node, ops.Literal),
+        context={"threshold": threshold},
+    )
+
+
 @replace(
     p.WindowFunction(p.RankBase | p.NTile)
     | p.StringFind
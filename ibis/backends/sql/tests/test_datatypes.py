@@ -85,3 +85,29 @@ def test_interval_without_unit():
 )
 def test_unsupported_dtypes_are_unknown(typengine, typ):
     assert typengine.to_ibis(sge.DataType(this=typ)) == dt.unknown
+
+
+def test_from_string_is_cached_per_dialect():
+    typ = "STRUCT(a INTEGER, b VARCHAR[])"
+    assert DuckDBType.from_string(typ) is DuckDBType.from_string(typ)
+    assert DuckDBType.from_string(typ, nullable=False) == dt.Struct(
+        {"a": "int32", "b": "array<string>"}, nullable=False
+    )
+    assert PostgresType.from_string("INTERVAL") != DuckDBType.from_string("INTERVAL")
+
+
+def test_from_strings():
+    types = ["INTEGER", "VARCHAR", "INTEGER", "not a type"]
+    assert DuckDBType.from_strings(types, [True, False, False, True]) == [
+        dt.int32,
+        dt.String(nullable=False),
+        dt.Int32(nullable=False),
+        dt.unknown,
+    ]
+    assert DuckDBType.from_strings(types, nullable=False) == [
+        DuckDBType.from_string(typ, nullable=False) for typ in types
+    ]
+    assert ClickHouseType.from_strings(["Nullable(Int8)", "Int8"]) == [
+        dt.int8,
+        dt.Int8(nullable=False),
+    ]
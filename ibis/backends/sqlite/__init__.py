@@ -16,10 +16,19 @@ import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis import util
-from ibis.backends import PyArrowExampleLoader, UrlFromPath
+from ibis.backends import (
+    PyArrowExampleLoader,
+    UrlFromPath,
+)
 from ibis.backends.sql import SQLBackend
+from ibis.backends.sql.adbc import AdbcTransport
 from ibis.backends.sql.compilers.base import C
-from ibis.backends.sqlite.converter import SQLitePandasData
+from ibis.backends.sql.incremental import CanMaterializeIncrementally
+from ibis.backends.sqlite.converter import (
+    SQLitePandasData,
+    to_sqlite_arrow,
+    to_sqlite_columns,
+)
 from ibis.backends.sqlite.udf import ignore_nulls, register_all
 
 if TYPE_CHECKING:
@@ -43,10 +52,35 @@ def _quote(name: str) -> str:
     return sg.to_identifier(name, quoted=True).sql("sqlite")
 
 
-class Backend(SQLBackend, UrlFromPath, PyArrowExampleLoader):
+# Pragmas applied for the duration of a bulk load
+_BULK_LOAD_PRAGMAS = {
+    # negative values are in KiB, so this is a 256 MiB page cache
+    "cache_size": -262_144,
+}
+
+# Pragmas that relax durability for the duration of a bulk load. A crash with
+# these set can corrupt the whole database file, so they're only applied to
+# databases that aren't backed by a file, such as the temporary database
+# holding memtables.
+_BULK_LOAD_UNSAFE_PRAGMAS = {"journal_mode": "MEMORY", "synchronous": "OFF"}
+
+# Number of rows bound per multi-row INSERT statement
+_BULK_LOAD_ROWS_PER_STATEMENT = 64
+
+
+class Backend(
+    AdbcTransport,
+    SQLBackend,
+    CanMaterializeIncrementally,
+    UrlFromPath,
+    PyArrowExampleLoader,
+):
     name = "sqlite"
     compiler = sc.sqlite.compiler
     supports_python_udfs = True
+    adbc_driver = "sqlite"
+
+    _temp_tables: tuple[int | None, frozenset[str]] = (None, frozenset())
 
     @property
     def current_database(self) -> str:
@@ -60,6 +94,8 @@ class Backend(SQLBackend, UrlFromPath, PyArrowExampleLoader):
         self,
         database: str | Path | None = None,
         type_map: dict[str, str | dt.DataType] | None = None,
+        *,
+        _use_adbc: bool = False,
     ) -> None:
         """Create an Ibis client connected to a SQLite database.
 
@@ -91,10 +127,20 @@ class Backend(SQLBackend, UrlFromPath, PyArrowExampleLoader):
         """
         _init_sqlite3()
 
-        self.con = sqlite3.connect(":memory:" if database is None else database)
+        # Fetching and bulk loading through the SQLite ADBC driver is private
+        # until the driver is installed in CI
+        if _use_adbc and database in (None, ":memory:"):
+            # both connections must see the same in-memory database
+            database = f"file:{util.gen_name('sqlite')}?mode=memory&cache=shared"
+            self.con = sqlite3.connect(database, uri=True)
+        else:
+            self.con = sqlite3.connect(":memory:" if database is None else database)
 
         self._post_connect(type_map)
 
+        if _use_adbc:
+            self._adbc_connect(str(database))
+
     @util.experimental
     @classmethod
     def from_connection(
@@ -308,6 +354,28 @@ class Backend(SQLBackend, UrlFromPath, PyArrowExampleLoader):
                 # drop the view when we're done with it
                 cur.execute(f"DROP VIEW IF EXISTS {view}")
 
+    def _uses_adbc(self, expr: ir.Expr) -> bool:
+        if not super()._uses_adbc(expr):
+            return False
+        # temporary and attached databases are local to the sqlite3 connection
+        tables = expr.op().find(ops.DatabaseTable)
+        if any(op.namespace.database not in (None, "main") for op in tables):
+            return False
+        unqualified = {op.name for op in tables if op.namespace.database is None}
+        return not (unqualified and unqualified & self._temp_table_names())
+
+    def _temp_table_names(self) -> frozenset[str]:
+        """Return the names in the temp database, cached by its schema version."""
+        (version,) = self.con.execute("PRAGMA temp.schema_version").fetchone()
+        cached_version, names = self._temp_tables
+        if version != cached_version:
+            query = (
+                "SELECT name FROM temp.sqlite_master WHERE type IN ('table', 'view')"
+            )
+            names = frozenset(name for (name,) in self.con.execute(query))
+            self._temp_tables = version, names
+        return names
+
     def _fetch_from_cursor(
         self, cursor: sqlite3.Cursor, schema: sch.Schema
     ) -> pd.DataFrame:
@@ -327,6 +395,11 @@ class Backend(SQLBackend, UrlFromPath, PyArrowExampleLoader):
         chunk_size: int = 1_000_000,
         **_: Any,
     ) -> pa.ipc.RecordBatchReader:
+        if self._uses_adbc(expr):
+            return super().to_pyarrow_batches(
+                expr, params=params, limit=limit, chunk_size=chunk_size
+            )
+
         import pyarrow as pa
 
         self._run_pre_execute_hooks(expr)
@@ -349,29 +422,97 @@ class Backend(SQLBackend, UrlFromPath, PyArrowExampleLoader):
     def _register_in_memory_table(self, op: ops.InMemoryTable) -> None:
         table = sg.table(op.name, quoted=self.compiler.quoted, catalog="temp")
         create_stmt = self._generate_create_table(table, op.schema).sql(self.name)
-        df = op.data.to_frame()
 
-        data = df.itertuples(index=False)
-        insert_stmt = self._build_insert_template(
-            op.name, schema=op.schema, catalog="temp", columns=True
-        )
-
-        with self.begin() as cur:
+        with self._bulk_load(database="temp") as cur:
             cur.execute(create_stmt)
-            cur.executemany(insert_stmt, data)
+            self._bulk_insert(cur, op, name=op.name, database="temp")
+
+    @contextlib.contextmanager
+    def _bulk_load(self, *, database: str | None = None) -> Iterator[sqlite3.Cursor]:
+        """Begin a transaction tuned for loading a large amount of data.
+
+        The pragmas in `_BULK_LOAD_PRAGMAS`, and `_BULK_LOAD_UNSAFE_PRAGMAS`
+        if `database` isn't backed by a file, are applied to `database` and
+        restored once the transaction ends. They're left untouched if a
+        transaction is already open, because SQLite refuses to change the
+        journal mode inside one.
+        """
+        con = self.con
+        name = database or "main"
+        schema = _quote(name)
+        previous = {}
+
+        if not con.in_transaction:
+            pragmas = _BULK_LOAD_PRAGMAS
+            [(path,)] = con.execute(
+                "SELECT file FROM pragma_database_list() WHERE name = ?", (name,)
+            ).fetchall() or [(None,)]
+            if path == "":
+                pragmas = {**_BULK_LOAD_UNSAFE_PRAGMAS, **pragmas}
+            for pragma, value in pragmas.items():
+                [(current,)] = con.execute(f"PRAGMA {schema}.{pragma}").fetchall()
+                if str(current).lower() == str(value).lower():
+                    continue
+                con.execute(f"PRAGMA {schema}.{pragma} = {value}").fetchall()
+                previous[pragma] = current
+
+        try:
+            with self.begin() as cur:
+                yield cur
+        finally:
+            for pragma, value in previous.items():
+                con.execute(f"PRAGMA {schema}.{pragma} = {value}").fetchall()
+
+    def _to_insert_table(self, op: ops.InMemoryTable) -> pa.Table:
+        import pyarrow as pa
+
+        try:
+            return super()._to_insert_table(op)
+        except pa.ArrowInvalid:
+            # pandas can't convert some values straight to the type of their
+            # column, e.g. integers to decimals, but Arrow can cast them
+            table = pa.Table.from_pandas(op.data.to_frame(), preserve_index=False)
+            return table.select(op.schema.names).cast(op.schema.to_pyarrow())
+
+    def _to_insert_columns(self, table: pa.Table, schema: sch.Schema) -> list[list]:
+        return to_sqlite_columns(super()._to_insert_columns(table, schema), schema)
+
+    def _bulk_insert(
+        self,
+        cur: sqlite3.Cursor,
+        op: ops.InMemoryTable,
+        *,
+        name: str,
+        database: str | None = None,
+        columns: bool = True,
+    ) -> None:
+        super()._bulk_insert(
+            cur,
+            op,
+            name=name,
+            catalog=database,
+            columns=columns,
+            max_rows_per_statement=_BULK_LOAD_ROWS_PER_STATEMENT,
+            max_parameters=_max_variable_number(self.con),
+        )
 
     def _register_udfs(self, expr: ir.Expr) -> None:
         import ibis.expr.operations as ops
 
         con = self.con
+        registered = self._registered_udfs
 
         for udf_node in expr.op().find(ops.ScalarUDF):
+            name = type(udf_node).__name__
+            if registered.get(name) is type(udf_node):
+                continue
             compile_func = getattr(
                 self, f"_register_{udf_node.__input_type__.name.lower()}_udf"
             )
             registration_func = compile_func(udf_node)
             if registration_func is not None:
                 registration_func(con)
+            registered[name] = type(udf_node)
 
     def _register_python_udf(self, udf_node: ops.ScalarUDF) -> None:
         name = type(udf_node).__name__
@@ -436,6 +577,7 @@ class Backend(SQLBackend, UrlFromPath, PyArrowExampleLoader):
         database: str | None = None,
         temp: bool = False,
         overwrite: bool = False,
+        incremental_on: str | None = None,
     ):
         """Create a table in SQLite.
 
@@ -457,22 +599,41 @@ class Backend(SQLBackend, UrlFromPath, PyArrowExampleLoader):
         overwrite
             If `True`, replace the table if it already exists, otherwise fail
             if the table exists
+        incremental_on
+            Name of a monotonically increasing column of the source of `obj`,
+            such as an event timestamp. The table then keeps track of the
+            largest value it has seen, and
+            [`refresh`](#ibis.backends.sqlite.Backend.refresh) only computes the
+            rows added since. `obj` must be a table expression over a single
+            table made of filters and projections, optionally followed by an
+            aggregation with `sum`, `count`, `min` or `max` metrics.
         """
+        if incremental_on is not None:
+            return self._create_incremental_table(
+                name,
+                obj,
+                incremental_on=incremental_on,
+                database=database,
+                temp=temp,
+                overwrite=overwrite,
+            )
+
         if schema is None and obj is None:
             raise ValueError("Either `obj` or `schema` must be specified")
 
         if schema is not None:
             schema = ibis.schema(schema)
 
+        insert_query = None
         if obj is not None:
             if not isinstance(obj, ir.Expr):
                 obj = ibis.memtable(obj)
 
-            self._run_pre_execute_hooks(obj)
-
-            insert_query = self.compiler.to_sqlglot(obj)
-        else:
-            insert_query = None
+            # in-memory data is bulk loaded straight into the new table
+            # instead of going through a temporary table
+            if not isinstance(obj.op(), ops.InMemoryTable):
+                self._run_pre_execute_hooks(obj)
+                insert_query = self.compiler.to_sqlglot(obj)
 
         if temp:
             if database not in (None, "temp"):
@@ -498,7 +659,13 @@ class Backend(SQLBackend, UrlFromPath, PyArrowExampleLoader):
             created_table, schema=(schema or obj.schema())
         ).sql(self.name)
 
-        with self.begin() as cur:
+        # only loads of in-memory data into a new table are tuned for speed
+        load = (
+            self.begin()
+            if insert_query is not None
+            else self._bulk_load(database=database)
+        )
+        with load as cur:
             cur.execute(create_stmt)
 
             if insert_query is not None:
@@ -507,6 +674,14 @@ class Backend(SQLBackend, UrlFromPath, PyArrowExampleLoader):
                         self.name
                     )
                 )
+            elif obj is not None:
+                self._bulk_insert(
+                    cur,
+                    obj.op(),
+                    name=created_table.name,
+                    database=database,
+                    columns=False,
+                )
 
             if overwrite:
                 cur.execute(
@@ -603,12 +778,44 @@ class Backend(SQLBackend, UrlFromPath, PyArrowExampleLoader):
             If the type of `obj` isn't supported
         """
         table = sg.table(name, catalog=database, quoted=self.compiler.quoted)
+        dialect = self.dialect
+
         if not isinstance(obj, ir.Expr):
-            obj = ibis.memtable(obj)
+            # bulk load in-memory data directly into the target table
+            op = ibis.memtable(obj).op()
+            target_cols = self.get_schema(name, database=database).keys()
+
+            # a temporary table shadows the table of the same name, which is
+            # local to the sqlite3 connection
+            if self._adbc is not None and (
+                database == "main"
+                or (database is None and name not in self._temp_table_names())
+            ):
+                data = to_sqlite_arrow(self._to_insert_table(op), op.schema)
+                if not op.schema.keys() <= target_cols:
+                    data = data.rename_columns(list(target_cols)[: data.num_columns])
+                with self._adbc_cursor() as cur:
+                    if overwrite:
+                        cur.execute(sge.Delete(this=table).sql(dialect))
+                    self._adbc_ingest(cur, name, data, mode="append")
+                return
+
+            with self._bulk_load(database=database) as cur:
+                if overwrite:
+                    cur.execute(sge.Delete(this=table).sql(dialect))
+                self._bulk_insert(
+                    cur,
+                    op,
+                    name=name,
+                    database=database,
+                    # use positional ordering unless the source columns are
+                    # a subset of the target's, like `_build_insert_from_table`
+                    columns=op.schema.keys() <= target_cols,
+                )
+            return
 
         self._run_pre_execute_hooks(obj)
 
-        dialect = self.dialect
         query = self._build_insert_from_table(target=name, source=obj, catalog=database)
         insert_stmt = query.sql(dialect)
 
@@ -616,3 +823,13 @@ class Backend(SQLBackend, UrlFromPath, PyArrowExampleLoader):
             if overwrite:
                 cur.execute(sge.Delete(this=table).sql(dialect))
             cur.execute(insert_stmt)
+
+
+def _max_variable_number(con: sqlite3.Connection) -> int:
+    """Return the maximum number of parameters a statement can bind."""
+    try:
+        return con.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    except AttributeError:
+        # Connection.getlimit was added in Python 3.11; 999 is the smallest
+        # limit any SQLite build uses
+        return 999
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pandas as pd
 from packaging.version import parse as vparse
 
 from ibis.formats.pandas import PandasData
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    import ibis.expr.datatypes as dt
+    import ibis.expr.schema as sch
+
 # The "mixed" format was added in pandas 2
 _DATETIME_FORMAT = "mixed" if vparse(pd.__version__) >= vparse("2.0.0") else None
 
@@ -22,3 +30,39 @@ class SQLitePandasData(PandasData):
         except ValueError:
             # Parsing failed, try a more relaxed parser
             return pd.to_datetime(s, format=_DATETIME_FORMAT, utc=True)
+
+
+def _to_sqlite_values(values: list, dtype: dt.DataType) -> list:
+    if dtype.is_timestamp() or dtype.is_date() or dtype.is_time():
+        return [None if value is None else value.isoformat() for value in values]
+    elif dtype.is_decimal():
+        return [None if value is None else str(value) for value in values]
+    return values
+
+
+def to_sqlite_columns(columns: list[list], schema: sch.Schema) -> list[list]:
+    """Convert per-column Python values into SQLite-bindable values.
+
+    Temporal values are stored as ISO 8601 strings, matching what the
+    `pd.Timestamp` adapter registered by the backend produces.
+    """
+    return [
+        _to_sqlite_values(values, dtype) for values, dtype in zip(columns, schema.types)
+    ]
+
+
+def to_sqlite_arrow(table: pa.Table, schema: sch.Schema) -> pa.Table:
+    """Convert the columns of `table` that SQLite stores as text.
+
+    The values are formatted exactly like `to_sqlite_columns` does, so that
+    data loaded through ADBC compares equal to data loaded through `sqlite3`.
+    """
+    import pyarrow as pa
+
+    for i, dtype in enumerate(schema.types):
+        if dtype.is_temporal() or dtype.is_decimal():
+            values = _to_sqlite_values(table.column(i).to_pylist(), dtype)
+            table = table.set_column(
+                i, table.field(i).name, pa.array(values, pa.string())
+            )
+    return table
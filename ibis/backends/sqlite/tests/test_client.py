@@ -101,3 +101,247 @@ def test_list_temp_tables_by_default(con):
     con.create_table(name, schema={"a": "int"}, temp=True)
     assert name in con.list_tables(database="temp")
     assert name in con.list_tables()
+
+
+@pytest.mark.parametrize("nrows", [0, 1, 64, 1_000])
+def test_bulk_insert(tmp_path, nrows):
+    con = ibis.sqlite.connect(tmp_path / "bulk.db")
+    data = {
+        "a": list(range(nrows)),
+        "b": [f"s{i}" if i % 3 else None for i in range(nrows)],
+    }
+
+    t = con.create_table("t", data)
+    assert t.count().execute() == nrows
+
+    con.insert("t", data)
+    assert t.count().execute() == 2 * nrows
+
+    con.insert("t", data, overwrite=True)
+    result = t.order_by("a").execute()
+    assert result.a.tolist() == data["a"]
+    assert result.b.tolist() == data["b"]
+
+
+def test_bulk_insert_restores_pragmas(tmp_path):
+    con = ibis.sqlite.connect(tmp_path / "pragmas.db")
+
+    def pragmas():
+        return {
+            name: con.raw_sql(f"PRAGMA {name}").fetchone()[0]
+            for name in ("journal_mode", "synchronous", "cache_size")
+        }
+
+    before = pragmas()
+    con.create_table("t", {"a": [1, 2, 3]})
+    con.insert("t", {"a": [4, 5]})
+    assert pragmas() == before
+
+
+def test_bulk_insert_keeps_file_durability(tmp_path):
+    con = ibis.sqlite.connect(tmp_path / "durable.db")
+    con.create_table("t", schema={"a": "int64"})
+    statements = []
+    con.con.set_trace_callback(statements.append)
+
+    con.create_table("u", {"a": [1, 2, 3]})
+    con.insert("t", {"a": [4, 5]})
+
+    assert statements
+    assert not [s for s in statements if "journal_mode =" in s]
+    assert not [s for s in statements if "synchronous =" in s]
+
+
+def test_insert_positional(con):
+    name = ibis.util.gen_name("sqlite_insert_positional")
+    t = con.create_table(name, schema={"a": "int64", "b": "string"}, temp=True)
+
+    con.insert(name, {"x": [1, 2], "y": ["a", "b"]})
+    assert t.order_by("a").execute().b.tolist() == ["a", "b"]
+
+
+def test_incremental_refresh():
+    con = ibis.sqlite.connect()
+    events = con.create_table(
+        "events", ibis.memtable({"ts": [1, 2], "user": ["a", "b"], "n": [1, 2]})
+    )
+    totals = con.create_table(
+        "totals",
+        events.group_by("user").agg(total=events.n.sum(), events=events.count()),
+        incremental_on="ts",
+    )
+
+    con.insert("events", ibis.memtable({"ts": [3], "user": ["a"], "n": [5]}))
+    con.refresh("totals")
+    con.refresh("totals")
+
+    result = totals.order_by("user").to_pyarrow().to_pylist()
+    assert result == [
+        {"user": "a", "total": 6, "events": 2},
+        {"user": "b", "total": 2, "events": 1},
+    ]
+
+
+def test_to_sqlite_arrow_matches_columns():
+    import datetime
+    import decimal
+
+    import pyarrow as pa
+
+    from ibis.backends.sqlite.converter import to_sqlite_arrow, to_sqlite_columns
+
+    schema = ibis.schema(
+        {"ts": "timestamp", "d": "date", "x": "decimal(5, 2)", "i": "int64"}
+    )
+    data = {
+        "ts": [datetime.datetime(2024, 1, 1, 12, 30), None],
+        "d": [datetime.date(2024, 1, 1), None],
+        "x": [decimal.Decimal("1.50"), None],
+        "i": [1, None],
+    }
+    table = to_sqlite_arrow(pa.table(data, schema=schema.to_pyarrow()), schema)
+    assert table.to_pydict() == dict(
+        zip(schema.names, to_sqlite_columns(list(data.values()), schema))
+    )
+
+
+@pytest.fixture
+def adbc_con(tmp_path):
+    pytest.importorskip("adbc_driver_sqlite")
+    con = ibis.sqlite.connect(tmp_path / "adbc.db", _use_adbc=True)
+    yield con
+    con.disconnect()
+
+
+def test_adbc_fetch(adbc_con, tmp_path, mocker):
+    import datetime
+
+    data = {
+        "ts": [datetime.datetime(2024, 1, 1), None],
+        "flag": [True, False],
+        "s": ["a", None],
+    }
+    t = adbc_con.create_table(
+        "t", schema={"ts": "timestamp", "flag": "boolean", "s": "string"}
+    )
+    adbc_con.insert("t", data)
+
+    fetch = mocker.spy(adbc_con, "_adbc_fetch")
+    result = adbc_con.to_pyarrow(t.order_by("flag"))
+    assert fetch.call_count == 1
+
+    expected = ibis.sqlite.connect(tmp_path / "adbc.db").table("t").order_by("flag")
+    assert result.equals(expected.to_pyarrow())
+    assert adbc_con.execute(t.s.count()) == 1
+
+
+def test_adbc_insert_matches_sqlite3(adbc_con, tmp_path):
+    import datetime
+
+    schema = {"ts": "timestamp", "d": "date"}
+    data = {"ts": [datetime.datetime(2024, 1, 1, 1)], "d": [datetime.date(2024, 1, 2)]}
+    adbc_con.create_table("adbc", schema=schema)
+    adbc_con.insert("adbc", data)
+
+    con = ibis.sqlite.connect(tmp_path / "adbc.db")
+    con.create_table("dbapi", schema=schema)
+    con.insert("dbapi", data)
+
+    def raw(name):
+        return con.con.execute(f"SELECT ts, d FROM {name}").fetchall()
+
+    assert raw("adbc") == raw("dbapi")
+
+    adbc_con.insert("adbc", data, overwrite=True)
+    assert raw("adbc") == raw("dbapi")
+
+
+def test_adbc_fallback(adbc_con, mocker):
+    adbc_con.create_table("t", schema={"a": "int64"}, temp=True)
+    fetch = mocker.spy(adbc_con, "_adbc_fetch")
+
+    assert adbc_con.execute(adbc_con.table("t").count()) == 0
+    assert adbc_con.execute(ibis.memtable({"a": [1, 2]}).a.sum()) == 3
+    assert fetch.call_count == 0
+
+
+def test_adbc_temp_table_names(adbc_con):
+    adbc_con.create_table("t", schema={"a": "int64"})
+    t = adbc_con.table("t")
+    assert adbc_con._uses_adbc(t)
+
+    # a temporary table shadows the table of the same name
+    adbc_con.create_table("t", schema={"a": "int64"}, temp=True)
+    assert not adbc_con._uses_adbc(t)
+
+    adbc_con.drop_table("t", database="temp")
+    assert adbc_con._uses_adbc(t)
+
+
+class FakeAdbcCursor:
+    def __init__(self, con):
+        self.con = con
+
+    def execute(self, query):
+        self.con.statements.append(query)
+
+    def adbc_ingest(self, name, data, *, mode, temporary):
+        if self.con.fail:
+            raise RuntimeError("ingest failed")
+        self.con.ingested.append((name, data.to_pydict(), mode))
+        return data.num_rows
+
+    def close(self):
+        pass
+
+
+class FakeAdbcConnection:
+    def __init__(self):
+        self.statements = []
+        self.ingested = []
+        self.fail = False
+        self.commits = self.rollbacks = 0
+
+    def cursor(self):
+        return FakeAdbcCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+
+def test_adbc_insert_fake_driver(tmp_path, monkeypatch):
+    con = ibis.sqlite.connect(tmp_path / "fake.db")
+    con.create_table("t", schema={"a": "int64"})
+    adbc = FakeAdbcConnection()
+    monkeypatch.setattr(con, "_adbc", adbc)
+
+    con.insert("t", {"a": [1, 2]}, overwrite=True)
+    assert adbc.ingested == [("t", {"a": [1, 2]}, "append")]
+    assert adbc.statements == ['DELETE FROM "t"']
+    assert (adbc.commits, adbc.rollbacks) == (1, 0)
+
+    adbc.fail = True
+    with pytest.raises(RuntimeError, match="ingest failed"):
+        con.insert("t", {"a": [3]})
+    assert (adbc.commits, adbc.rollbacks) == (1, 1)
+
+    # a temporary table shadows the table of the same name
+    con.create_table("t", schema={"a": "int64"}, temp=True)
+    con.insert("t", {"a": [4]})
+    assert con.con.execute("SELECT a FROM temp.t").fetchall() == [(4,)]
+    assert len(adbc.ingested) == 1
+
+
+@pytest.mark.parametrize("database", [None, ":memory:"])
+def test_adbc_in_memory(database):
+    pytest.importorskip("adbc_driver_sqlite")
+    con = ibis.sqlite.connect(database, _use_adbc=True)
+    t = con.create_table("t", schema={"a": "int64"})
+    con.insert("t", {"a": [1, 2, 3]})
+    assert con.to_pyarrow(t.a.sum()).as_py() == 6
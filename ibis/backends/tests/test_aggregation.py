@@ -37,6 +37,7 @@ from ibis.legacy.udf.vectorized import reduction
 
 np = pytest.importorskip("numpy")
 pd = pytest.importorskip("pandas")
+tm = pytest.importorskip("pandas.testing")
 
 with pytest.warns(FutureWarning, match="v9.0"):
 
@@ -1145,6 +1146,49 @@ def test_approx_median(alltypes):
     assert isinstance(result, float)
 
 
+def test_approximate_mode(alltypes, df):
+    expr = alltypes.int_col.nunique()
+    with ibis.approximate():
+        result = expr.execute()
+
+    # backends without an approximation fall back to the exact count
+    assert result == pytest.approx(df.int_col.nunique(), rel=0.2)
+
+
+def test_collect_fuses_aggregations(con, alltypes, df, mocker):
+    grouped = alltypes.group_by("string_col")
+    exprs = [
+        alltypes.int_col.sum(),
+        alltypes.double_col.max() + 1,
+        alltypes.count(),
+        grouped.agg(total=alltypes.int_col.sum()),
+        grouped.agg(top=alltypes.int_col.max()),
+        alltypes.filter(alltypes.int_col > 5).count(),
+    ]
+    spy = mocker.spy(con, "execute")
+    results = ibis.collect(exprs)
+
+    # one query for the scalars, one for the grouped aggregates and one for
+    # the filtered count, which has a different parent
+    assert spy.call_count == 3
+
+    total, top, count, grouped_total, grouped_top, filtered = results
+    assert total == df.int_col.sum()
+    assert top == pytest.approx(df.double_col.max() + 1)
+    assert count == len(df)
+    assert filtered == (df.int_col > 5).sum()
+
+    expected = df.groupby("string_col").int_col.agg(["sum", "max"])
+    grouped_total = grouped_total.set_index("string_col").total
+    grouped_top = grouped_top.set_index("string_col").top
+    tm.assert_series_equal(
+        grouped_total.sort_index(), expected["sum"].rename("total"), check_dtype=False
+    )
+    tm.assert_series_equal(
+        grouped_top.sort_index(), expected["max"].rename("top"), check_dtype=False
+    )
+
+
 @pytest.mark.notimpl(
     ["bigquery", "druid", "sqlite"], raises=com.OperationNotDefinedError
 )
@@ -926,7 +926,6 @@ def test_self_join_memory_table(backend, con, monkeypatch):
                     [
                         "bigquery",
                         "clickhouse",
-                        "duckdb",
                         "exasol",
                         "impala",
                         "mssql",
@@ -56,6 +56,29 @@ def test_persist_expression_contextmanager(backend, con, alltypes):
     assert non_cached_table.op() not in con._cache_op_to_entry
 
 
+@mark.notimpl(["flink", "impala", "trino", "druid"])
+@mark.notimpl(["exasol"], reason="Exasol does not support temporary tables")
+@pytest.mark.never(
+    ["risingwave"],
+    raises=com.UnsupportedOperationError,
+    reason="Feature is not yet implemented: CREATE TEMPORARY TABLE",
+)
+def test_cache_not_shared_with_approximate_mode(con, alltypes):
+    expr = alltypes.group_by("string_col").agg(n=alltypes.int_col.nunique())
+
+    with expr.cache() as exact:
+        with ibis.approximate():
+            with expr.cache() as approximate:
+                assert approximate.op() is not exact.op()
+                # results computed in approximate mode aren't reused either
+                with expr.cache() as again:
+                    assert again.op() is not approximate.op()
+
+        # releasing approximate results keeps the exact one cached
+        assert con._cache_op_to_entry[expr.op()].cached_op_ref() is exact.op()
+        assert expr.cache().op() is exact.op()
+
+
 @mark.notimpl(["flink", "impala", "trino", "druid"])
 @pytest.mark.never(
     ["risingwave"],
@@ -150,3 +173,58 @@ def test_persist_expression_release(con, alltypes):
 
     with pytest.raises(Exception, match=cached_table.op().name):
         cached_table.execute()
+
+
+@pytest.fixture
+def spill_dir(con, tmp_path, monkeypatch):
+    if not con.supports_cache_spill:
+        pytest.skip(f"{con.name} cannot spill cached tables")
+    monkeypatch.setattr(ibis.options.cache, "spill", True)
+    monkeypatch.setattr(ibis.options.cache, "directory", str(tmp_path))
+    return tmp_path
+
+
+def test_persist_expression_spill(backend, alltypes, spill_dir):
+    non_cached_table = alltypes.mutate(test_column=ibis.literal("spilled"))
+    cached_table = non_cached_table.cache()
+
+    [path] = spill_dir.iterdir()
+    assert path.name == f"{cached_table.op().name}.arrow"
+
+    backend.assert_frame_equal(
+        non_cached_table.order_by("id").to_pandas(),
+        cached_table.order_by("id").to_pandas(),
+    )
+
+    cached_table.release()
+    assert not list(spill_dir.iterdir())
+
+
+def test_persist_expression_spill_evicts_least_recently_used(
+    con, alltypes, spill_dir, monkeypatch
+):
+    monkeypatch.setattr(ibis.options.cache, "max_size", 1)
+
+    first = alltypes.filter(alltypes.id > 1).cache()
+    second = alltypes.filter(alltypes.id > 2).cache()
+
+    # only the most recently cached table fits in the budget
+    [path] = spill_dir.iterdir()
+    assert path.name == f"{second.op().name}.arrow"
+    assert (
+        second.count().execute() == alltypes.filter(alltypes.id > 2).count().execute()
+    )
+
+    # evicted tables are recomputed when they're used again
+    assert first.count().execute() == alltypes.filter(alltypes.id > 1).count().execute()
+    [path] = spill_dir.iterdir()
+    assert path.name == f"{first.op().name}.arrow"
+    assert second.op().name in con._cache_name_to_entry
+    assert (
+        second.count().execute() == alltypes.filter(alltypes.id > 2).count().execute()
+    )
+
+    # releasing them removes their files
+    del first, second
+    assert not list(spill_dir.iterdir())
+    assert not con._evicted_tables
@@ -322,6 +322,71 @@ def test_notin(backend, alltypes, sorted_df, column, elements):
     backend.assert_series_equal(result, expected)
 
 
+@pytest.mark.parametrize(
+    ("column", "elements"),
+    [
+        param("int_col", list(range(1, 8, 2)), id="int"),
+        param("string_col", list(map(str, range(1, 8, 2))), id="string"),
+    ],
+)
+@pytest.mark.notimpl(["druid"])
+def test_isin_large(backend, alltypes, sorted_df, monkeypatch, column, elements):
+    # force the values into an in-memory table that's semi-joined against
+    monkeypatch.setattr(ibis.options.sql, "isin_memtable_threshold", 2)
+
+    sorted_alltypes = alltypes.order_by("id")
+    expr = sorted_alltypes.select(
+        "id",
+        sorted_alltypes[column].isin(elements).name("tmp"),
+        sorted_alltypes[column].notin(elements).name("not_tmp"),
+    ).order_by("id")
+    result = expr.execute()
+
+    expected = sorted_df[column].isin(elements)
+    backend.assert_series_equal(result.tmp, backend.default_series_rename(expected))
+    backend.assert_series_equal(
+        result.not_tmp, backend.default_series_rename(~expected, name="not_tmp")
+    )
+
+
+@pytest.mark.notimpl(["druid"])
+def test_isin_large_many_lists(backend, alltypes, sorted_df, monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "isin_memtable_threshold", 2)
+
+    sorted_alltypes = alltypes.order_by("id")
+    lists = [list(range(i, i + 3)) for i in range(12)]
+    expr = sorted_alltypes.select(
+        "id",
+        **{
+            f"tmp{i}": sorted_alltypes.int_col.isin(values)
+            for i, values in enumerate(lists)
+        },
+    ).order_by("id")
+    result = expr.execute()
+
+    for i, values in enumerate(lists):
+        expected = sorted_df.int_col.isin(values)
+        backend.assert_series_equal(
+            result[f"tmp{i}"], backend.default_series_rename(expected, name=f"tmp{i}")
+        )
+
+
+@pytest.mark.notimpl(["druid"])
+@pytest.mark.notimpl(["polars"], raises=ValueError, reason="not a SQL backend")
+def test_isin_large_view(ddl_con, temp_view, monkeypatch):
+    monkeypatch.setattr(ibis.options.sql, "isin_memtable_threshold", 2)
+
+    t = ddl_con.table("functional_alltypes")
+    expr = t.filter(t.int_col.isin([1, 3, 5])).select("id")
+    expected = expr.count().execute()
+
+    # SQL that outlives the expression keeps the literal list
+    assert "memtable" not in ibis.to_sql(expr, dialect=ddl_con.name)
+    view = ddl_con.create_view(temp_view, expr)
+    del expr
+    assert view.count().execute() == expected
+
+
 @pytest.mark.parametrize(
     ("predicate_fn", "expected_fn"),
     [
@@ -2200,6 +2265,42 @@ def test_dynamic_table_slice_with_computed_offset(backend):
     backend.assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize(
+    "order_by",
+    [
+        param(["id"], id="single"),
+        param([ibis.desc("string_col"), "id"], id="composite"),
+        param(
+            ["timestamp_col", "id"],
+            id="timestamp",
+            marks=pytest.mark.notimpl(
+                ["sqlite"],
+                raises=com.IbisError,
+                reason="timestamps are stored as text that literals don't match",
+            ),
+        ),
+        param([ibis.desc(_.timestamp_col.date()), "id"], id="date"),
+    ],
+)
+def test_paginate(alltypes, order_by):
+    t = alltypes.select("id", "string_col", "timestamp_col")
+    expected = t.order_by(order_by).id.to_pyarrow().to_pylist()
+
+    pages = list(t.paginate(order_by, page_size=3000))
+    assert [cursor is None for _, cursor in pages] == [False, False, True]
+    result = [id for page, _ in pages for id in page["id"].to_pylist()]
+    assert result == expected
+    assert all(
+        page.column_names == ["id", "string_col", "timestamp_col"] for page, _ in pages
+    )
+
+    # resume after the first page
+    _, cursor = pages[0]
+    resumed = t.paginate(order_by, page_size=3000, cursor=cursor)
+    result = [id for page, _ in resumed for id in page["id"].to_pylist()]
+    assert result == expected[3000:]
+
+
 @pytest.mark.notimpl(["druid", "risingwave"], raises=com.OperationNotDefinedError)
 @pytest.mark.parametrize("method", ["row", "block"])
 @pytest.mark.parametrize("subquery", [True, False], ids=["subquery", "table"])
@@ -14,11 +14,13 @@
 from __future__ import annotations
 
 import shutil
+from collections import OrderedDict
 
 import pytest
 
 import ibis
 import ibis.common.exceptions as exc
+from ibis.expr.types import pretty
 
 
 @pytest.fixture
@@ -27,6 +29,8 @@ def queries(monkeypatch):
     monkeypatch.setattr(ibis.options, "verbose", True)
     monkeypatch.setattr(ibis.options, "verbose_log", queries.append)
     monkeypatch.setattr(ibis.options, "interactive", True)
+    # start without any cached previews, so that every repr executes a query
+    monkeypatch.setattr(pretty, "_previews", OrderedDict())
     return queries
 
 
@@ -82,6 +86,34 @@ def test_disable_query_limit(table, queries, monkeypatch):
     assert len(queries) >= 1
 
 
+@pytest.mark.notimpl(["polars"])
+def test_repr_reuses_preview(con, table, queries, monkeypatch):
+    monkeypatch.setattr(ibis.options.repr.interactive, "reuse_previews", True)
+    expr = table.select("id", "int_col")
+
+    repr(expr)
+    assert queries
+
+    del queries[:]
+    repr(expr)
+    assert not queries
+
+    # refreshing the backend's metadata discards previews
+    con.refresh_metadata()
+    repr(expr)
+    assert queries
+
+
+@pytest.mark.notimpl(["polars"])
+def test_repr_reexecutes_preview_by_default(table, queries):
+    expr = table.select("id", "int_col")
+
+    repr(expr)
+    del queries[:]
+    repr(expr)
+    assert queries
+
+
 def test_interactive_non_compilable_repr_does_not_fail(table):
     """https://github.com/ibis-project/ibis/issues/170"""
     repr(table.string_col.topk(3))
@@ -4,7 +4,6 @@ import contextlib
 import decimal
 import math
 import operator
-import sqlite3
 from operator import and_, lshift, or_, rshift, xor
 
 import pytest
@@ -1610,16 +1609,6 @@ def test_scalar_round_is_integer(con):
         ),
         param(
             [decimal.Decimal("1.1"), decimal.Decimal("2.2"), decimal.Decimal("3.3")],
-            marks=[
-                pytest.mark.notimpl(
-                    ["sqlite"],
-                    raises=(
-                        sqlite3.ProgrammingError,
-                        # With Python 3.10, the same code raises a different exception type :(
-                        sqlite3.InterfaceError,
-                    ),
-                )
-            ],
             id="decimals",
         ),
     ],
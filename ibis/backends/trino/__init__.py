@@ -161,14 +161,9 @@ class Backend(SQLBackend, CanListCatalog, CanCreateDatabase, NoExampleLoader):
             fqn = sg.table(table_name, db=database, catalog=catalog).sql(self.name)
             raise com.TableNotFound(fqn)
 
-        type_mapper = self.compiler.type_mapper
-
-        return sch.Schema(
-            {
-                name: type_mapper.from_string(typ, nullable=nullable)
-                for name, typ, nullable in meta
-            }
-        )
+        names, types, nullables = zip(*meta)
+        dtypes = self.compiler.type_mapper.from_strings(types, nullables)
+        return sch.Schema(dict(zip(names, dtypes)))
 
     @cached_property
     def version(self) -> str:
@@ -39,12 +39,59 @@ class SQL(Config):
         explicit limit. [](`None`) means no limit.
     default_dialect : str
         Dialect to use for printing SQL when the backend cannot be determined.
+    metadata_cache_ttl : int | None
+        Number of seconds for which table schemas and table listings fetched
+        by a backend are cached. `0` disables caching and [](`None`) caches
+        metadata until it is invalidated, either by DDL issued through the
+        backend or by calling its `refresh_metadata` method.
+    isin_memtable_threshold : int | None
+        Literal `isin` lists with more than this many values are executed as
+        a semi-join against an in-memory table instead of an `IN (...)` list.
+        SQL that outlives the expression, such as the SQL of views and of
+        `ibis.to_sql`, always uses `IN (...)`, as does [](`None`).
 
     """
 
     fuse_selects: bool = True
     default_limit: Optional[PosInt] = None
     default_dialect: str = "duckdb"
+    metadata_cache_ttl: Optional[PosInt] = 0
+    isin_memtable_threshold: Optional[PosInt] = 10_000
+
+
+class Cache(Config):
+    """Options controlling `Table.cache`.
+
+    Attributes
+    ----------
+    spill : bool
+        Store the cached tables of in-process backends (DuckDB, DataFusion and
+        Polars) in Arrow IPC files that are memory-mapped back into the engine,
+        instead of materializing them in engine memory.
+    directory : str | None
+        Directory in which spilled cached tables are written. [](`None`) uses
+        the system's temporary directory.
+    max_size : int | None
+        Total size in bytes of the spilled and persisted cached tables of a
+        backend. When a new cached table pushes the total over this budget,
+        persisted entries that no cached table uses are deleted, oldest first,
+        and then the files of the least recently used cached tables; those
+        are recomputed when an expression referring to them is executed.
+        [](`None`) means no limit.
+    persist : bool
+        Store cached tables of in-process backends in `directory` under a
+        fingerprint of their expression, so that other processes caching the
+        same expression reuse them. Entries are recomputed when the source
+        tables they were computed from have changed, for backends that can
+        tell. Expressions without a stable fingerprint, such as those using
+        Python UDFs or tables of in-memory databases, are cached as usual.
+
+    """
+
+    spill: bool = False
+    directory: Optional[str] = None
+    max_size: Optional[PosInt] = None
+    persist: bool = False
 
 
 class Interactive(Config):
@@ -66,6 +113,11 @@ class Interactive(Config):
         Maximum depth for nested data types.
     show_types : bool
         Show the inferred type of value expressions in the interactive repr.
+    reuse_previews : bool
+        Reuse the result of an earlier repr of the same expression until the
+        data in its backend changes through ibis. Changes made outside of
+        ibis, for example by another process or to the files a table reads,
+        aren't detected, so this is disabled by default.
 
     """
 
@@ -75,6 +127,7 @@ class Interactive(Config):
     max_string: int = 80
     max_depth: int = 1
     show_types: bool = True
+    reuse_previews: bool = False
 
 
 class Repr(Config):
@@ -129,6 +182,8 @@ class Options(Config):
         set.
     sql: SQL
         SQL-related options.
+    cache : Cache
+        Options controlling `Table.cache`.
     clickhouse : Config | None
         Clickhouse specific options.
     impala : Config | None
@@ -137,6 +192,14 @@ class Options(Config):
         Pandas specific options.
     pyspark : Config | None
         PySpark specific options.
+    nested_arrow_dtypes : bool
+        Return struct, array and map columns of pandas results as
+        `pandas.ArrowDtype` columns backed by Arrow memory instead of object
+        columns of Python values.
+    approximate : bool
+        Compile exact distinct counts, medians and quantiles to their
+        approximate counterparts on backends that support them. See
+        [`ibis.approximate`](#ibis.approximate).
 
     """
 
@@ -147,10 +210,13 @@ class Options(Config):
     graphviz_repr: bool = False
     default_backend: Optional[Any] = None
     sql: SQL = SQL()
+    cache: Cache = Cache()
     clickhouse: Optional[Config] = None
     impala: Optional[Config] = None
     pandas: Optional[Config] = None
     pyspark: Optional[Config] = None
+    nested_arrow_dtypes: bool = False
+    approximate: bool = False
 
 
 def _default_backend() -> Any:
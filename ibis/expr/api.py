@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import builtins
+import contextlib
 import datetime
 import functools
 import itertools
 import numbers
 import operator
-from collections import Counter
+from collections import Counter, defaultdict
 from typing import TYPE_CHECKING, Any, overload
 
 import ibis.expr.builders as bl
@@ -20,7 +21,7 @@ from ibis import selectors, util
 from ibis.backends import BaseBackend, connect
 from ibis.common.deferred import Deferred, _, deferrable
 from ibis.common.dispatch import lazy_singledispatch
-from ibis.common.exceptions import IbisInputError
+from ibis.common.exceptions import IbisInputError, RelationError
 from ibis.common.grounds import Concrete
 from ibis.common.temporal import normalize_datetime, normalize_timezone
 from ibis.expr.datatypes import DataType
@@ -45,7 +46,7 @@ from ibis.expr.types import (
 from ibis.util import deprecated, experimental
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
     from pathlib import Path
 
     import geopandas as gpd
@@ -68,11 +69,13 @@ __all__ = (
     "_",
     "aggregate",
     "and_",
+    "approximate",
     "array",
     "asc",
     "case",
     "cases",
     "coalesce",
+    "collect",
     "connect",
     "cross_join",
     "cume_dist",
@@ -694,6 +697,87 @@ def following(value, /) -> ir.Value:
     return ops.WindowBoundary(value, preceding=False).to_expr()
 
 
+def _as_aggregate(expr: ir.Expr) -> ops.Aggregate | None:
+    """Return the aggregation computing `expr`, if it is one."""
+    if isinstance(expr, ir.Scalar):
+        try:
+            expr = expr.as_table()
+        except RelationError:
+            return None
+    node = expr.op()
+    return node if isinstance(node, ops.Aggregate) else None
+
+
+def collect(
+    exprs: Iterable[ir.Expr],
+    /,
+    *,
+    params: Mapping[ir.Scalar, Any] | None = None,
+    limit: int | str | None = "default",
+) -> builtins.list[Any]:
+    """Execute many expressions, sharing scans between their aggregations.
+
+    Scalar reductions and aggregations with the same parent table and
+    grouping keys are fused into a single aggregation, which is executed once
+    and then split back into one result per expression. Other expressions are
+    executed on their own.
+
+    Parameters
+    ----------
+    exprs
+        Expressions to execute.
+    params
+        Mapping of scalar parameter expressions to values.
+    limit
+        An integer to effect a specific row limit for table results. A value
+        of `None` means "no limit". The default is in `ibis/config.py`.
+
+    Returns
+    -------
+    list
+        The result of executing each expression, in the same order and with
+        the same type as `expr.execute()` returns.
+
+    Examples
+    --------
+    >>> import ibis
+    >>> t = ibis.memtable({"x": [1, 2, 2, 3], "y": ["a", "b", "a", "b"]})
+    >>> total, distinct, rows = ibis.collect([t.x.sum(), t.x.nunique(), t.count()])
+    >>> total, distinct, rows
+    (8, 3, 4)
+    """
+    exprs = builtins.list(exprs)
+    results = [None] * len(exprs)
+
+    fusable = defaultdict(builtins.list)
+    for i, expr in enumerate(exprs):
+        if (node := _as_aggregate(expr)) is not None:
+            fusable[node.parent, node.groups].append((i, node))
+        else:
+            results[i] = expr.execute(params=params, limit=limit)
+
+    for (parent, groups), members in fusable.items():
+        if len(members) == 1:
+            [(i, _)] = members
+            results[i] = exprs[i].execute(params=params, limit=limit)
+            continue
+
+        metrics = {
+            f"_{i}_{name}": value
+            for i, node in members
+            for name, value in node.metrics.items()
+        }
+        fused = ops.Aggregate(parent, groups, metrics).to_expr()
+        df = fused.execute(params=params, limit=limit)
+
+        for i, node in members:
+            columns = [*groups, *(f"_{i}_{name}" for name in node.metrics)]
+            part = df[columns].set_axis(node.schema.names, axis=1)
+            results[i] = exprs[i].__pandas_result__(part)
+
+    return results
+
+
 def and_(*predicates: ir.BooleanValue) -> ir.BooleanValue:
     """Combine multiple predicates using `&`.
 
@@ -734,6 +818,40 @@ def or_(*predicates: ir.BooleanValue) -> ir.BooleanValue:
     return functools.reduce(operator.or_, predicates)
 
 
+@contextlib.contextmanager
+def approximate(enabled: bool = True, /) -> Iterator[None]:
+    """Compute distinct counts, medians and quantiles approximately in a block.
+
+    While active, exact reductions compile to their approximate counterparts
+    on backends that support them, trading exactness for speed on large
+    tables. This sets `ibis.options.approximate` for the duration of the
+    block.
+
+    Parameters
+    ----------
+    enabled
+        Whether to compute approximately inside the block.
+
+    Examples
+    --------
+    >>> import ibis
+    >>> t = ibis.table({"a": "int64"}, name="t")
+    >>> with ibis.approximate():
+    ...     print(ibis.to_sql(t.a.nunique(), dialect="duckdb"))
+    SELECT
+      APPROX_COUNT_DISTINCT("t0"."a") AS "CountDistinct(a)"
+    FROM "t" AS "t0"
+    """
+    from ibis.config import options
+
+    previous = options.approximate
+    options.approximate = enabled
+    try:
+        yield
+    finally:
+        options.approximate = previous
+
+
 def random() -> ir.FloatingScalar:
     """Return a random floating point number in the range [0.0, 1.0).
 
@@ -0,0 +1,171 @@
+"""Process independent fingerprints of expressions."""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+import enum
+import hashlib
+import uuid
+import weakref
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+import ibis
+import ibis.expr.datatypes as dt
+import ibis.expr.operations as ops
+import ibis.expr.schema as sch
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_SCALARS = (
+    type(None),
+    bool,
+    int,
+    float,
+    str,
+    bytes,
+    decimal.Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    uuid.UUID,
+)
+
+# digests of in-memory table data, which is expensive to hash
+_data_digests = weakref.WeakKeyDictionary()
+
+
+class Unfingerprintable(Exception):
+    """Raised when part of an expression has no stable fingerprint."""
+
+
+class _Digest(str):
+    """The digest of a child node, as opposed to a string argument."""
+
+    __slots__ = ()
+
+
+class _HashWriter:
+    """File-like sink that hashes everything written to it."""
+
+    def __init__(self, hasher):
+        self.hasher = hasher
+        self.closed = False
+
+    def write(self, data) -> int:
+        self.hasher.update(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _data_digest(op: ops.InMemoryTable) -> str:
+    try:
+        return _data_digests[op]
+    except KeyError:
+        pass
+
+    import pyarrow as pa
+
+    table = op.data.to_pyarrow(op.schema)
+    hasher = hashlib.sha256()
+    with pa.ipc.new_stream(
+        pa.PythonFile(_HashWriter(hasher), mode="w"), table.schema
+    ) as writer:
+        writer.write_table(table)
+    _data_digests[op] = digest = hasher.hexdigest()
+    return digest
+
+
+def _encode(value, identify: Callable) -> str:
+    if isinstance(value, _Digest):
+        return f"#{value}"
+    elif isinstance(value, enum.Enum):
+        return f"{type(value).__qualname__}.{value.name}"
+    elif isinstance(value, _SCALARS):
+        return f"{type(value).__name__}:{value!r}"
+    elif isinstance(value, dt.DataType):
+        return f"dtype:{value}"
+    elif isinstance(value, sch.Schema):
+        return f"schema:{_encode(tuple(value.items()), identify)}"
+    elif isinstance(value, ops.Namespace):
+        return f"namespace:{value.catalog!r}.{value.database!r}"
+    elif isinstance(value, Mapping):
+        items = (
+            f"{_encode(k, identify)}={_encode(v, identify)}" for k, v in value.items()
+        )
+        return f"{{{','.join(items)}}}"
+    elif isinstance(value, (tuple, list)):
+        return f"({','.join(_encode(v, identify) for v in value)})"
+    elif isinstance(value, (set, frozenset)):
+        return f"set({','.join(sorted(_encode(v, identify) for v in value))})"
+    elif (identity := identify(value)) is not None:
+        return f"source:{identity}"
+    raise Unfingerprintable(f"cannot fingerprint {type(value).__name__} values")
+
+
+def _node_name(node: ops.Node) -> str:
+    if isinstance(node, ops.Impure):
+        raise Unfingerprintable(f"{type(node).__name__} is impure")
+    elif (func_name := getattr(node, "__func_name__", None)) is not None:
+        # UDF classes get a per-process name, so describe them instead
+        if node.__input_type__ is not ops.udf.InputType.BUILTIN:
+            raise Unfingerprintable(f"{func_name} is a Python UDF")
+        namespace = node.__udf_namespace__
+        return f"udf:{func_name}:{namespace.catalog!r}.{namespace.database!r}"
+    cls = type(node)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def fingerprint(node: ops.Node, identify: Callable) -> str | None:
+    """Compute a fingerprint of `node` that is stable across processes.
+
+    Two expressions get the same fingerprint when they have the same node
+    tree, schemas and sources. In-memory tables are identified by a digest of
+    their data and other sources by `identify`, which maps a source object
+    such as a backend to a string or [](`None`) if it has no stable identity.
+
+    Parameters
+    ----------
+    node
+        The node to fingerprint.
+    identify
+        Callable returning a stable identity for the sources of physical
+        tables.
+
+    Returns
+    -------
+    str | None
+        A hex digest, or [](`None`) if part of the expression (e.g. a Python
+        UDF, an impure function or a source without an identity) has no stable
+        fingerprint.
+
+    """
+    # references get their identifiers from a per-process counter, so number
+    # them in traversal order instead
+    references = {}
+
+    def fn(node, _, **kwargs):
+        if isinstance(node, ops.Reference):
+            kwargs["identifier"] = references.setdefault(node, len(references))
+        elif isinstance(node, ops.InMemoryTable):
+            # the generated name is random, the data is what matters
+            kwargs["name"] = None
+            kwargs["data"] = _data_digest(node)
+
+        args = ",".join(f"{k}={_encode(v, identify)}" for k, v in kwargs.items())
+        text = f"{_node_name(node)}({args})"
+        return _Digest(hashlib.sha256(text.encode()).hexdigest())
+
+    try:
+        digest = node.map(fn)[node]
+    except Unfingerprintable:
+        return None
+
+    return hashlib.sha256(f"{ibis.__version__}:{digest}".encode()).hexdigest()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from typing import TYPE_CHECKING
 
 import toolz
 
@@ -17,6 +18,9 @@ from ibis.common.patterns import Check, pattern, replace
 from ibis.common.typing import VarTuple  # noqa: TC001
 from ibis.util import Namespace, promote_list
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 p = Namespace(pattern, module=ops)
 d = Namespace(deferred, module=ops)
 
@@ -222,6 +226,49 @@ def lower_stringslice(_, **kwargs):
     return ops.Substring(_.arg, start=_.start, length=length)
 
 
+_APPROXIMATE_REDUCTIONS = {
+    ops.CountDistinct: ops.ApproxCountDistinct,
+    ops.Median: ops.ApproxMedian,
+    ops.Quantile: ops.ApproxQuantile,
+    ops.MultiQuantile: ops.ApproxMultiQuantile,
+}
+
+
+@replace(p.CountDistinct | p.Median | p.Quantile | p.MultiQuantile)
+def exact_to_approx(_, supported, **kwargs):
+    """Rewrite an exact reduction to its approximate counterpart."""
+    # the approximate operations subclass the exact ones, so match exactly
+    approx = _APPROXIMATE_REDUCTIONS.get(type(_))
+    if approx is None or not supported(approx):
+        return _
+    if (
+        isinstance(_, (ops.Quantile, ops.MultiQuantile))
+        and not _.arg.dtype.is_numeric()
+    ):
+        # the approximate quantiles are only defined for numeric columns
+        return _
+    return approx(*_.__args__)
+
+
+def approximate_reductions(node: ops.Node, supported: Callable) -> ops.Node:
+    """Rewrite exact reductions in `node` to approximate ones.
+
+    Parameters
+    ----------
+    node
+        The root node of the expression graph.
+    supported
+        Callable returning whether the backend supports an operation class,
+        reductions without supported approximations are left as is.
+
+    Returns
+    -------
+    The rewritten expression graph.
+
+    """
+    return node.replace(exact_to_approx, context={"supported": supported})
+
+
 @replace(p.Analytic)
 def wrap_analytic(_, **__):
     # Wrap analytic functions in a window function
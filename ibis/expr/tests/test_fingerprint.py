@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import ibis
+import ibis.expr.operations as ops
+from ibis.expr.fingerprint import fingerprint
+
+t = ibis.table(name="t", schema={"a": "int64", "b": "string"})
+
+
+def no_identity(_):
+    return None
+
+
+def make_expr(threshold=1):
+    return t.filter(t.a > threshold).group_by("b").agg(total=t.a.sum())
+
+
+def test_fingerprint_is_structural():
+    assert fingerprint(make_expr().op(), no_identity) == fingerprint(
+        make_expr().op(), no_identity
+    )
+    assert fingerprint(make_expr().op(), no_identity) != fingerprint(
+        make_expr(2).op(), no_identity
+    )
+
+
+def test_fingerprint_covers_schemas():
+    other = ibis.table(name="t", schema={"a": "int32", "b": "string"})
+    assert fingerprint(t.op(), no_identity) != fingerprint(other.op(), no_identity)
+
+
+def test_fingerprint_self_join():
+    def self_join():
+        right = t.view()
+        return t.join(right, t.a == right.a)
+
+    assert fingerprint(self_join().op(), no_identity) == fingerprint(
+        self_join().op(), no_identity
+    )
+
+
+def test_fingerprint_memtable_uses_data():
+    def memtable(values):
+        return ibis.memtable({"a": values}).mutate(b=1)
+
+    assert fingerprint(memtable([1, 2]).op(), no_identity) == fingerprint(
+        memtable([1, 2]).op(), no_identity
+    )
+    assert fingerprint(memtable([1, 2]).op(), no_identity) != fingerprint(
+        memtable([1, 3]).op(), no_identity
+    )
+
+
+def test_fingerprint_database_table_source():
+    class Source:
+        def __init__(self, identity):
+            self.identity = identity
+
+    def table(source):
+        return ops.DatabaseTable(name="t", schema=t.schema(), source=source)
+
+    def identify(source):
+        return source.identity
+
+    assert fingerprint(table(Source(None)), identify) is None
+    assert fingerprint(table(Source("a")), identify) == fingerprint(
+        table(Source("a")), identify
+    )
+    assert fingerprint(table(Source("a")), identify) != fingerprint(
+        table(Source("b")), identify
+    )
+
+
+@ibis.udf.scalar.python
+def add_one(x: int) -> int:
+    return x + 1
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        pytest.param(lambda: t.mutate(r=ibis.random()), id="impure"),
+        pytest.param(lambda: t.mutate(c=add_one(t.a)), id="python_udf"),
+    ],
+)
+def test_fingerprint_unstable(expr):
+    assert fingerprint(expr().op(), no_identity) is None
+
+
+def test_fingerprint_builtin_udf():
+    @ibis.udf.scalar.builtin
+    def my_func(x: int) -> int: ...
+
+    @ibis.udf.scalar.builtin(name="my_func")
+    def my_func_again(x: int) -> int: ...
+
+    assert fingerprint(t.select(x=my_func(t.a)).op(), no_identity) == fingerprint(
+        t.select(x=my_func_again(t.a)).op(), no_identity
+    )
+
+
+def test_fingerprint_is_process_independent():
+    code = """\
+import ibis
+from ibis.expr.fingerprint import fingerprint
+
+t = ibis.table(name="t", schema={"a": "int64", "b": "string"})
+right = t.view()
+expr = t.join(right, t.a == right.a).filter(t.b == "x").select(t.a)
+print(fingerprint(expr.op(), lambda _: None))
+"""
+    results = {
+        subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        for _ in range(2)
+    }
+    assert len(results) == 1
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import ibis
 import ibis.expr.operations as ops
-from ibis.expr.rewrites import simplify
+from ibis.expr.rewrites import approximate_reductions, simplify
 
 t = ibis.table(
     name="t",
@@ -102,3 +102,33 @@ def test_simplify_project_filter_project():
 
     t4_opt = simplify(t4.op())
     assert t4_opt == proj.op()
+
+
+def test_approximate_reductions():
+    expr = t.agg(
+        n=t.int_col.nunique(),
+        m=t.float_col.median(),
+        q=t.int_col.quantile(0.25),
+        qs=t.int_col.quantile([0.25, 0.75]),
+        sq=t.string_col.quantile(0.5),
+        a=t.int_col.approx_nunique(),
+    )
+    result = approximate_reductions(expr.op(), lambda _: True)
+
+    assert isinstance(result.metrics["n"], ops.ApproxCountDistinct)
+    assert isinstance(result.metrics["m"], ops.ApproxMedian)
+    assert isinstance(result.metrics["q"], ops.ApproxQuantile)
+    assert isinstance(result.metrics["qs"], ops.ApproxMultiQuantile)
+    # approximate quantiles are only defined for numeric columns
+    assert type(result.metrics["sq"]) is ops.Quantile
+    assert result.metrics["a"] == expr.op().metrics["a"]
+    assert result.schema == expr.op().schema
+
+
+def test_approximate_reductions_unsupported():
+    expr = t.agg(n=t.int_col.nunique(), m=t.float_col.median())
+    supported = {ops.ApproxMedian}
+    result = approximate_reductions(expr.op(), supported.__contains__)
+
+    assert type(result.metrics["n"]) is ops.CountDistinct
+    assert isinstance(result.metrics["m"], ops.ApproxMedian)
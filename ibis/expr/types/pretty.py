@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import datetime
 import json
+import weakref
+from collections import OrderedDict
 from functools import singledispatch
 from math import isfinite
 from typing import TYPE_CHECKING
@@ -19,8 +21,20 @@ import ibis
 import ibis.expr.datatypes as dt
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from ibis.expr.types import Column, Expr, Scalar, Table
 
+# Number of interactive previews to keep, so that rendering an expression
+# again (e.g. in a notebook, or on terminal resize) doesn't re-execute it
+_PREVIEW_CACHE_SIZE = 16
+
+# Strings are truncated before formatting, but not so much that links in
+# them stop working
+_MAX_URL_LENGTH = 2048
+
+_previews: OrderedDict[tuple, tuple[weakref.ref, int, pa.Table]] = OrderedDict()
+
 
 def _format_nested(
     values,
@@ -210,7 +224,6 @@ def format_column(
 ):
     import pandas as pd
 
-    null_str = Text.styled("NULL", style="dim")
     if dtype.is_floating():
         # We don't want to treat `nan` as `NULL` for floating point types
         def isnull(x):
@@ -223,19 +236,57 @@ def format_column(
             # pd.isna broadcasts if `x` is an array
             return o if isinstance(o, bool) else False
 
-    nonnull = [v for v in values if not isnull(v)]
-    if nonnull:
-        formatted = format_values(
-            dtype,
-            nonnull,
-            max_length=max_length,
-            max_string=max_string,
-            max_depth=max_depth,
+    nulls = list(map(isnull, values))
+    return _format_column(
+        dtype,
+        [v for v, null in zip(values, nulls) if not null],
+        nulls,
+        max_length=max_length,
+        max_string=max_string,
+        max_depth=max_depth,
+    )
+
+
+def format_arrow_column(
+    dtype,
+    column: pa.ChunkedArray,
+    *,
+    max_length: int | None = None,
+    max_string: int | None = None,
+    max_depth: int | None = None,
+):
+    """Format an Arrow column, like `format_column`.
+
+    Nulls are found and long strings are truncated with Arrow compute
+    kernels, so only the values that are displayed are converted to Python.
+    """
+    import pyarrow.compute as pc
+
+    # only truncate strings; other types stored as strings, such as JSON, are
+    # parsed before they're formatted
+    if dtype.is_string():
+        max_string = max_string or ibis.options.repr.interactive.max_string
+        column = pc.utf8_slice_codeunits(
+            column, 0, max(max_string + 1, _MAX_URL_LENGTH)
         )
+    return _format_column(
+        dtype,
+        column.drop_null().to_pylist(),
+        column.is_null().to_pylist(),
+        max_length=max_length,
+        max_string=max_string,
+        max_depth=max_depth,
+    )
+
+
+def _format_column(dtype, nonnull: list, nulls: list[bool], **fmt_kwargs):
+    null_str = Text.styled("NULL", style="dim")
+    if nonnull:
+        formatted = format_values(dtype, nonnull, **fmt_kwargs)
         next_f = iter(formatted).__next__
-        out = [null_str if isnull(v) else next_f() for v in values]
+        out = [null_str if null else next_f() for null in nulls]
     else:
-        out = [null_str] * len(values)
+        out = [null_str] * len(nulls)
 
     try:
         max_width = max(map(len, out))
@@ -310,6 +361,36 @@ def _to_rich_scalar(
     return Panel(formatted_value, expand=False, box=box.SQUARE)
 
 
+def _fetch_preview(table: Table, limit: int) -> pa.Table:
+    """Execute `table.limit(limit)`, reusing the result of earlier previews.
+
+    Results are only reused if `ibis.options.repr.interactive.reuse_previews`
+    is set, until the backend reports that its data may have changed.
+    """
+    expr = table.limit(limit)
+    if not ibis.options.repr.interactive.reuse_previews:
+        return expr.to_pyarrow()
+
+    backend = expr._find_backend(use_default=True)
+    if (version := getattr(backend, "_data_version", None)) is None:
+        return expr.to_pyarrow()
+
+    key = expr.op(), id(backend), ibis.options.approximate
+    if (entry := _previews.get(key)) is not None:
+        ref, cached_version, result = entry
+        if ref() is backend and cached_version == version:
+            _previews.move_to_end(key)
+            return result
+
+    result = expr.to_pyarrow()
+    # executing may itself bump the version, e.g. by going through `raw_sql`
+    _previews[key] = weakref.ref(backend), backend._data_version, result
+    _previews.move_to_end(key)
+    if len(_previews) > _PREVIEW_CACHE_SIZE:
+        _previews.popitem(last=False)
+    return result
+
+
 def _to_rich_table(
     tablish: Table | Column,
     *,
@@ -355,7 +436,7 @@ def _to_rich_table(
         if orig_ncols > len(computed_cols):
             table = table.select(*computed_cols)
 
-    result = table.limit(max_rows + 1).to_pyarrow()
+    result = _fetch_preview(table, max_rows + 1)
     # Now format the columns in order, stopping if the console width would
     # be exceeded.
     col_info = []
@@ -363,9 +444,9 @@ def _to_rich_table(
     formatted_dtypes = []
     remaining = console_width - 1  # 1 char for left boundary
     for name, dtype in table.schema().items():
-        formatted, min_width, max_width = format_column(
+        formatted, min_width, max_width = format_arrow_column(
             dtype,
-            result[name].to_pylist()[:max_rows],
+            result[name].slice(0, max_rows),
             max_length=max_length,
             max_string=max_string,
             max_depth=max_depth,
@@ -142,6 +142,14 @@ def unwrap_aliases(values: Iterator[ir.Value]) -> Mapping[str, ir.Value]:
     return result
 
 
+def _cursor_default(value: Any) -> str:
+    """Encode sort key values that JSON doesn't support in pagination cursors."""
+    try:
+        return value.isoformat()
+    except AttributeError:
+        return str(value)
+
+
 @public
 class Table(Expr, _FixedTextJupyterMixin):
     """An immutable and lazy dataframe.
@@ -2823,6 +2831,61 @@ class Table(Expr, _FixedTextJupyterMixin):
                 result_columns.append(column)
         return self.select(result_columns)
 
+    def _summarize(self, rows: Sequence[Mapping[str, ir.Scalar]]) -> Table:
+        """Compute a table with one row of summary statistics per entry of `rows`.
+
+        When the backend supports it, every statistic is computed by a single
+        aggregation and the result is unpivoted with an array of structs,
+        instead of scanning the table once per row.
+        """
+        schema = {
+            name: dt.highest_precedence(row[name].type() for row in rows)
+            for name in rows[0]
+        }
+
+        if not self._supports_single_scan_summary():
+            return ibis.union(*(self.agg(**row).cast(schema) for row in rows))
+
+        metrics = {}
+        fields = []
+        for i, row in enumerate(rows):
+            row_fields = {}
+            for name, value in row.items():
+                value = value.cast(schema[name])
+                if value.op().find(ops.Reduction):
+                    key = f"{name}_{i}"
+                    metrics[key] = value
+                    value = key
+                row_fields[name] = value
+            fields.append(row_fields)
+
+        agg = self.agg(**metrics)
+        summary = ibis.array(
+            [
+                ibis.struct(
+                    {
+                        name: agg[value] if isinstance(value, str) else value
+                        for name, value in row_fields.items()
+                    }
+                )
+                for row_fields in fields
+            ]
+        )
+        return agg.select(__summary__=summary.unnest()).unpack("__summary__")
+
+    def _supports_single_scan_summary(self) -> bool:
+        backends, has_unbound = self._find_backends()
+        if has_unbound or len(backends) != 1:
+            return False
+        (backend,) = backends
+        try:
+            return all(
+                backend.has_operation(op)
+                for op in (ops.Array, ops.StructColumn, ops.Unnest)
+            )
+        except NotImplementedError:
+            return False
+
     def info(self) -> Table:
         """Return summary information about a table.
 
@@ -2854,25 +2917,29 @@ class Table(Expr, _FixedTextJupyterMixin):
         """
         from ibis import literal as lit
 
-        aggs = []
-
+        rows = []
         for pos, colname in enumerate(self.columns):
             col = self[colname]
             typ = col.type()
-            agg = self.select(isna=ibis.cases((col.isnull(), 1), else_=0)).agg(
-                name=lit(colname),
-                type=lit(str(typ)),
-                nullable=lit(typ.nullable),
-                nulls=lambda t: t.isna.sum(),
-                non_nulls=lambda t: (1 - t.isna).sum(),
-                null_frac=lambda t: t.isna.mean(),
-                pos=lit(pos, type=dt.int16),
+            isna = ibis.cases((col.isnull(), 1), else_=0)
+            rows.append(
+                dict(
+                    name=lit(colname),
+                    type=lit(str(typ)),
+                    nullable=lit(typ.nullable),
+                    nulls=isna.sum(),
+                    non_nulls=(1 - isna).sum(),
+                    null_frac=isna.mean(),
+                    pos=lit(pos, type=dt.int16),
+                )
             )
-            aggs.append(agg)
-        return ibis.union(*aggs).order_by(ibis.asc("pos"))
+        return self._summarize(rows).order_by(ibis.asc("pos"))
 
     def describe(
-        self, *, quantile: Sequence[ir.NumericValue | float] = (0.25, 0.5, 0.75)
+        self,
+        *,
+        quantile: Sequence[ir.NumericValue | float] = (0.25, 0.5, 0.75),
+        approx: bool = False,
     ) -> Table:
         """Return summary information about a table.
 
@@ -2880,6 +2947,9 @@ class Table(Expr, _FixedTextJupyterMixin):
         ----------
         quantile
             The quantiles to compute for numerical columns. Defaults to (0.25, 0.5, 0.75).
+        approx
+            Compute the number of unique values and the quantiles approximately,
+            which is much cheaper on large tables.
 
         Returns
         -------
@@ -2893,6 +2963,10 @@ class Table(Expr, _FixedTextJupyterMixin):
         standard deviation, and quantiles. For string columns, it computes the mode
         and the number of unique values.
 
+        Like [`info`](#ibis.expr.types.relations.Table.info), the statistics of
+        all columns are computed in a single scan of the table when its backend
+        supports arrays and structs.
+
         Examples
         --------
         >>> import ibis
@@ -2941,7 +3015,7 @@ class Table(Expr, _FixedTextJupyterMixin):
         from ibis import literal as lit
 
         quantile = sorted(quantile)
-        aggs = []
+        rows = []
         string_col = False
         numeric_col = False
         for pos, colname in enumerate(self.columns):
@@ -2965,8 +3039,9 @@ class Table(Expr, _FixedTextJupyterMixin):
                 col_std = col.std()
                 col_min = col.min().cast(float)
                 col_max = col.max().cast(float)
+                col_quantile = col.approx_quantile if approx else col.quantile
                 quantile_values = {
-                    f"p{100 * q:.6f}".rstrip("0").rstrip("."): col.quantile(q).cast(
+                    f"p{100 * q:.6f}".rstrip("0").rstrip("."): col_quantile(q).cast(
                         float
                     )
                     for q in quantile
@@ -2981,28 +3056,24 @@ class Table(Expr, _FixedTextJupyterMixin):
                 # Will not calculate statistics for other types
                 continue
 
-            agg = self.agg(
-                name=lit(colname),
-                pos=lit(pos, type=dt.int16),
-                type=lit(str(typ)),
-                count=col.isnull().count(),
-                nulls=col.isnull().sum(),
-                unique=col.nunique(),
-                mode=col_mode,
-                mean=col_mean,
-                std=col_std,
-                min=col_min,
-                **quantile_values,
-                max=col_max,
+            rows.append(
+                dict(
+                    name=lit(colname),
+                    pos=lit(pos, type=dt.int16),
+                    type=lit(str(typ)),
+                    count=col.isnull().count(),
+                    nulls=col.isnull().sum(),
+                    unique=col.approx_nunique() if approx else col.nunique(),
+                    mode=col_mode,
+                    mean=col_mean,
+                    std=col_std,
+                    min=col_min,
+                    **quantile_values,
+                    max=col_max,
+                )
             )
-            aggs.append(agg)
 
-        names = aggs[0].schema().names
-        new_schema = {
-            name: dt.highest_precedence(types)
-            for name, *types in zip(names, *(agg.schema().types for agg in aggs))
-        }
-        t = ibis.union(*(agg.cast(new_schema) for agg in aggs))
+        t = self._summarize(rows)
 
         # TODO(jiting): Need a better way to remove columns with all NULL
         if string_col and not numeric_col:
@@ -3671,6 +3742,147 @@ class Table(Expr, _FixedTextJupyterMixin):
         current_backend = self._find_backend(use_default=True)
         return current_backend._cached_table(self)
 
+    def paginate(
+        self,
+        order_by: str | ir.Column | Sequence[str | ir.Column],
+        /,
+        *,
+        page_size: int = 1000,
+        cursor: str | None = None,
+    ) -> Iterator[tuple[pa.Table, str | None]]:
+        """Iterate over the rows of a table in pages, using keyset pagination.
+
+        Each page is fetched with a predicate seeking past the sort keys of
+        the previous page's last row instead of an `OFFSET`, so fetching a
+        page costs the same no matter how deep it is when the backend can use
+        an index on the keys.
+
+        ::: {.callout-note}
+        ## The sort keys must uniquely identify rows
+
+        Rows tied with the last row of a page on every sort key are skipped.
+        :::
+
+        An `IbisError` is raised if a page doesn't start after the previous
+        one, as happens when a backend stores a sort key in a format that its
+        literals don't compare equal to.
+
+        Parameters
+        ----------
+        order_by
+            Expressions to sort the table by, as accepted by
+            [`order_by`](#ibis.expr.types.relations.Table.order_by).
+        page_size
+            The maximum number of rows per page.
+        cursor
+            A cursor returned with an earlier page, to resume iterating
+            after that page. [](`None`) starts at the first page.
+
+        Returns
+        -------
+        Iterator[tuple[pa.Table, str | None]]
+            Pairs of a page of rows and the cursor to resume after it, which
+            is [](`None`) for the last page.
+
+        Examples
+        --------
+        >>> import ibis
+        >>> t = ibis.memtable({"id": [1, 2, 3, 4, 5], "x": list("abcde")})
+        >>> pages = t.paginate("id", page_size=2)
+        >>> page, cursor = next(pages)
+        >>> page["x"].to_pylist()
+        ['a', 'b']
+
+        Resume from the cursor, e.g. in a later request
+
+        >>> page, _ = next(t.paginate("id", page_size=2, cursor=cursor))
+        >>> page["x"].to_pylist()
+        ['c', 'd']
+        """
+        import base64
+        import json
+
+        if page_size < 1:
+            raise com.IbisInputError("`page_size` must be at least 1")
+
+        keys = self.order_by(order_by).op().keys
+        if not keys:
+            raise com.IbisInputError("`paginate` requires at least one sort key")
+
+        names = [f"__ibis_page_key_{i}__" for i in range(len(keys))]
+        table = self.mutate(
+            **{name: key.expr.to_expr() for name, key in zip(names, keys)}
+        )
+        sort_keys = []
+        for name, key in zip(names, keys):
+            col = table[name]
+            if key.dtype.nullable:
+                # place nulls with a key of their own; where a sort key omits
+                # NULLS FIRST/LAST, the placement can depend on session settings
+                # and wouldn't match the seek predicate below
+                nulls = col.isnull().ifelse(1, 0)
+                sort_keys.append(ops.SortKey(nulls, ascending=not key.nulls_first))
+            sort_keys.append(
+                ops.SortKey(col, ascending=key.ascending, nulls_first=key.nulls_first)
+            )
+
+        def seek_past(values):
+            # rows sorting after `values`: tied on a prefix of the keys and
+            # strictly after on the next one
+            predicates = []
+            ties = []
+            for name, key, value in zip(names, keys, values):
+                col = table[name]
+                if value is None:
+                    after = col.notnull() if key.nulls_first else ibis.literal(False)
+                    equal = col.isnull()
+                else:
+                    value = literal(value, type=key.dtype)
+                    after = col > value if key.ascending else col < value
+                    if not key.nulls_first:
+                        after |= col.isnull()
+                    equal = col == value
+                predicates.append(ibis.and_(*ties, after))
+                ties.append(equal)
+            return ibis.or_(*predicates)
+
+        def cursor_at(result, i):
+            values = [result[name][i].as_py() for name in names]
+            return base64.urlsafe_b64encode(
+                json.dumps(values, default=_cursor_default).encode()
+            ).decode()
+
+        while True:
+            page = table
+            if cursor is not None:
+                values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+                if len(values) != len(keys):
+                    raise com.IbisInputError(
+                        "`cursor` doesn't match the sort keys of this table"
+                    )
+                page = page.filter(seek_past(values))
+
+            result = page.order_by(sort_keys).limit(page_size + 1).to_pyarrow()
+            n = min(result.num_rows, page_size)
+            seen = {cursor_at(result, 0), cursor_at(result, n - 1)} if n else set()
+            if cursor in seen:
+                # the backend compared the keys of a row against literals of
+                # its own values as if they were different, e.g. timestamps
+                # that SQLite stores as text in another format, and would
+                # return rows again or never reach the end
+                raise com.IbisError(
+                    "`paginate` can't seek past the rows of the previous page, "
+                    "because the backend doesn't compare the sort keys with "
+                    "literals of their values as equal"
+                )
+            if result.num_rows <= page_size:
+                yield result.drop_columns(names), None
+                return
+
+            result = result.slice(0, page_size)
+            cursor = cursor_at(result, -1)
+            yield result.drop_columns(names), cursor
+
     def pivot_longer(
         self,
         col: str | s.Selector,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 import datetime
+import functools
 from functools import partial
 from importlib.util import find_spec as _find_spec
 from typing import TYPE_CHECKING
@@ -29,6 +30,10 @@ if TYPE_CHECKING:
 geospatial_supported = _find_spec("geopandas") is not None
 
 
+def _identity(value):
+    return value
+
+
 class PandasType(NumpyType):
     @classmethod
     def to_ibis(cls, typ, nullable=True):
@@ -119,9 +124,15 @@ class PandasData(DataMapper):
         if schema.names != tuple(df.columns):
             raise ValueError("schema names don't match input data columns")
 
-        columns = {
-            name: cls.convert_column(df[name], dtype) for name, dtype in schema.items()
-        }
+        return cls._construct_frame(
+            {
+                name: convert(df[name])
+                for name, convert in cls.get_table_converter(schema)
+            }
+        )
+
+    @staticmethod
+    def _construct_frame(columns):
         df = pd.DataFrame(columns)
 
         if geospatial_supported:
@@ -143,14 +154,66 @@ class PandasData(DataMapper):
         return df
 
     @classmethod
-    def convert_column(cls, obj, dtype):
+    def convert_pyarrow(cls, table: pa.Table, schema: sch.Schema) -> pd.DataFrame:
+        """Convert a PyArrow table or record batch to a DataFrame matching `schema`.
+
+        When `ibis.options.nested_arrow_dtypes` is set, nested columns are
+        returned as `pandas.ArrowDtype` columns that share the Arrow memory
+        instead of being converted to Python objects.
+        """
+        import pyarrow.types as pat
+
+        from ibis.config import options
+
+        if options.nested_arrow_dtypes:
+
+            def types_mapper(typ):
+                return pd.ArrowDtype(typ) if pat.is_nested(typ) else None
+
+        else:
+            types_mapper = None
+
+        return cls.convert_table(table.to_pandas(types_mapper=types_mapper), schema)
+
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def get_table_converter(cls, schema):
+        """Return `(name, converter)` pairs for the columns of `schema`.
+
+        The plan is cached per schema so that converting many batches of the
+        same result, as `to_pandas_batches` does, only resolves it once.
+        """
+        return tuple(
+            (name, cls.get_column_converter(dtype)) for name, dtype in schema.items()
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=512)
+    def get_column_converter(cls, dtype):
         pandas_type = PandasType.from_ibis(dtype)
 
         method_name = f"convert_{dtype.__class__.__name__}"
         convert_method = getattr(cls, method_name, cls.convert_default)
 
-        result = convert_method(obj, dtype, pandas_type)
-        assert not isinstance(result, np.ndarray), f"{convert_method} -> {type(result)}"
+        if dtype.is_nested():
+
+            def convert(obj):
+                if isinstance(obj.dtype, pd.ArrowDtype):
+                    return obj
+                return convert_method(obj, dtype, pandas_type)
+
+        else:
+
+            def convert(obj):
+                return convert_method(obj, dtype, pandas_type)
+
+        return convert
+
+    @classmethod
+    def convert_column(cls, obj, dtype):
+        convert = cls.get_column_converter(dtype)
+        result = convert(obj)
+        assert not isinstance(result, np.ndarray), f"{convert} -> {type(result)}"
         return result
 
     @classmethod
@@ -296,21 +359,33 @@ class PandasData(DataMapper):
         )
 
     @classmethod
+    @functools.lru_cache(maxsize=512)
     def get_element_converter(cls, dtype):
         name = f"convert_{type(dtype).__name__}_element"
-        funcgen = getattr(cls, name, lambda _: lambda x: x)
+        funcgen = getattr(cls, name, lambda _: _identity)
         return funcgen(dtype)
 
     @classmethod
     def convert_Struct_element(cls, dtype):
         converters = tuple(map(cls.get_element_converter, dtype.types))
 
+        if all(converter is _identity for converter in converters):
+
+            def convert(values, names=dtype.names):
+                if values is None:
+                    return values
+                elif isinstance(values, dict):
+                    return {name: values.get(name) for name in names}
+                return dict(zip(names, util.promote_list(values)))
+
+            return convert
+
         def convert(values, names=dtype.names, converters=converters):
             if values is None:
                 return values
 
             items = (
-                values.items()
+                ((name, values.get(name)) for name in names)
                 if isinstance(values, dict)
                 else zip(names, util.promote_list(values))
             )
@@ -373,6 +448,13 @@ class PandasData(DataMapper):
     def convert_Array_element(cls, dtype):
         convert_value = cls.get_element_converter(dtype.value_type)
 
+        if convert_value is _identity:
+
+            def convert(values):
+                return values if values is None else list(values)
+
+            return convert
+
         def convert(values):
             if values is None:
                 return values
@@ -393,6 +475,8 @@ class PandasData(DataMapper):
                 return raw_row
 
             row = dict(raw_row)
+            if convert_key is _identity and convert_value is _identity:
+                return row
             return dict(
                 zip(map(convert_key, row.keys()), map(convert_value, row.values()))
             )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 from typing import TYPE_CHECKING, Any
 
 import pyarrow as pa
@@ -326,13 +327,47 @@ class PyArrowData(DataMapper):
 
     @classmethod
     def convert_table(cls, table: pa.Table, schema: Schema) -> pa.Table:
+        convert = cls.get_table_converter(table.schema, schema)
+        return table if convert is None else convert(table)
+
+    @classmethod
+    def get_table_converter(cls, source: pa.Schema, schema: Schema):
+        """Compute the conversion from Arrow schema `source` to `schema`.
+
+        Returns [](`None`) when the schemas already match, otherwise a function
+        that casts only the columns whose types differ and applies the target
+        field names and nullability. The result is cached so that converting
+        many tables or batches with the same schema only diffs the schemas once.
+        """
+        if source.metadata is not None:
+            # schema metadata is a dict, which makes the schema unhashable
+            source = source.remove_metadata()
+        return cls._get_table_converter(source, schema)
+
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _get_table_converter(cls, source: pa.Schema, schema: Schema):
         desired_schema = PyArrowSchema.from_ibis(schema)
-        if table.schema == desired_schema:
-            return table
-        arrays = [
-            cls.convert_column(table[name], dtype) for name, dtype in schema.items()
-        ]
-        return pa.Table.from_arrays(arrays, schema=desired_schema)
+        if source == desired_schema:
+            return None
+
+        plan = tuple(
+            (name, None if source.field(name).type == field.type else dtype)
+            for (name, dtype), field in zip(schema.items(), desired_schema)
+        )
+
+        def convert(table):
+            arrays = [
+                table.column(name)
+                if dtype is None
+                else cls.convert_column(table.column(name), dtype)
+                for name, dtype in plan
+            ]
+            if isinstance(table, pa.RecordBatch):
+                return pa.RecordBatch.from_arrays(arrays, schema=desired_schema)
+            return pa.Table.from_arrays(arrays, schema=desired_schema)
+
+        return convert
 
 
 class PyArrowTableProxy(TableProxy[V]):
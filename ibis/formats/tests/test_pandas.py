@@ -16,6 +16,7 @@ pd = pytest.importorskip("pandas")
 tm = pytest.importorskip("pandas.testing")
 
 from ibis.formats.pandas import PandasData, PandasSchema, PandasType  # noqa: E402
+from ibis.formats.pyarrow import PyArrowSchema  # noqa: E402
 
 
 @pytest.mark.parametrize(
@@ -440,3 +441,76 @@ def test_schema_doesnt_match_input_columns():
     schema = sch.Schema({"a": "int64", "b": "int64"})
     with pytest.raises(ValueError, match="schema names don't match"):
         PandasData.convert_table(df, schema)
+
+
+NESTED_SCHEMA = sch.Schema(
+    {
+        "a": "array<int64>",
+        "s": "struct<x: int64, ts: timestamp('UTC')>",
+        "m": "map<string, int64>",
+        "i": "int64",
+    }
+)
+
+
+@pytest.fixture
+def nested_table():
+    return pa.table(
+        {
+            "a": [[1, 2], None, []],
+            "s": [
+                {"x": 1, "ts": pd.Timestamp("2020-01-01", tz="UTC")},
+                None,
+                {"x": None, "ts": None},
+            ],
+            "m": pa.array(
+                [[("k", 1)], None, []], type=pa.map_(pa.string(), pa.int64())
+            ),
+            "i": [1, 2, 3],
+        },
+        schema=PyArrowSchema.from_ibis(NESTED_SCHEMA),
+    )
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        param("struct<b: string, a: int64>", id="identity"),
+        param("struct<b: string, a: timestamp('UTC')>", id="converted"),
+    ],
+)
+def test_struct_element_follows_schema(dtype):
+    convert = PandasData.convert_Struct_element(dt.dtype(dtype))
+    result = convert({"a": None, "c": 1, "b": "x"})
+    assert list(result.items()) == [("b", "x"), ("a", None)]
+
+
+def test_convert_pyarrow_matches_convert_table(nested_table):
+    expected = PandasData.convert_table(nested_table.to_pandas(), NESTED_SCHEMA)
+    result = PandasData.convert_pyarrow(nested_table, NESTED_SCHEMA)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_convert_pyarrow_arrow_dtypes(nested_table, monkeypatch):
+    monkeypatch.setattr(ibis.options, "nested_arrow_dtypes", True)
+
+    result = PandasData.convert_pyarrow(nested_table, NESTED_SCHEMA)
+
+    for name in "asm":
+        assert isinstance(result[name].dtype, pd.ArrowDtype)
+        assert (
+            result[name]
+            .array._pa_array.combine_chunks()
+            .equals(nested_table[name].combine_chunks())
+        )
+    assert result.i.dtype == np.dtype("int64")
+
+    # converting the result again leaves Arrow backed columns untouched
+    tm.assert_frame_equal(PandasData.convert_table(result, NESTED_SCHEMA), result)
+
+
+def test_table_converter_is_cached():
+    schema = sch.Schema({"a": "array<int64>", "b": "string"})
+    assert PandasData.get_table_converter(schema) is PandasData.get_table_converter(
+        sch.Schema({"a": "array<int64>", "b": "string"})
+    )
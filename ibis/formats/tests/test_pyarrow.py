@@ -284,3 +284,43 @@ def test_schema___arrow_c_schema__():
     schema = ibis.schema({"a": dt.int64, "b": dt.string, "c": dt.boolean})
     pa_schema = pa.schema(schema)
     assert pa_schema == schema.to_pyarrow()
+
+
+def test_convert_table_matching_schema_is_noop():
+    schema = ibis.schema({"a": "int64", "b": "string"})
+    table = pa.table({"a": [1, 2], "b": ["x", None]}, schema=schema.to_pyarrow())
+
+    assert ipa.PyArrowData.get_table_converter(table.schema, schema) is None
+    assert ipa.PyArrowData.convert_table(table, schema) is table
+
+
+def test_convert_table_only_casts_mismatched_columns():
+    schema = ibis.schema({"a": "int64", "b": "string", "c": "!float64"})
+    table = pa.table(
+        {"c": pa.array([1.0, 2.0]), "b": ["x", None], "a": pa.array([1, 2], pa.int32())}
+    )
+
+    result = ipa.PyArrowData.convert_table(table, schema)
+
+    assert result.schema == schema.to_pyarrow()
+    assert result["a"].to_pylist() == [1, 2]
+    # columns whose type already matches are reused without a copy
+    for name in "bc":
+        [result_chunk] = result[name].chunks
+        [input_chunk] = table[name].chunks
+        assert result_chunk.buffers()[1].address == input_chunk.buffers()[1].address
+
+
+def test_convert_table_with_schema_metadata():
+    schema = ibis.schema({"a": "int64"})
+    table = pa.table({"a": pa.array([1, 2], pa.int32())}).replace_schema_metadata(
+        {"pandas": "{}"}
+    )
+
+    result = ipa.PyArrowData.convert_table(table, schema)
+    assert result.schema == schema.to_pyarrow()
+
+    batch = table.to_batches()[0]
+    result = ipa.PyArrowData.convert_table(batch, schema)
+    assert isinstance(result, pa.RecordBatch)
+    assert result.schema == schema.to_pyarrow()
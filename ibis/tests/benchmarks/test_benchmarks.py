@@ -11,6 +11,7 @@ import operator
 import os
 import random
 import string
+import types
 
 import pytest
 from pytest import param
@@ -642,6 +643,85 @@ def test_repr_join(benchmark, customers, orders, orders_items, products):
     benchmark(repr, op)
 
 
+@pytest.fixture(scope="module")
+def wide_strings_table():
+    pytest.importorskip("duckdb")
+    pa = pytest.importorskip("pyarrow")
+
+    con = ibis.duckdb.connect()
+    column = pa.array(["x" * 10_000] * 11)
+    return con.create_table(
+        "wide", pa.table({f"col{i:03d}": column for i in range(500)})
+    )
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["uncached", "cached"])
+def test_interactive_repr_wide(benchmark, monkeypatch, wide_strings_table, cached):
+    from collections import OrderedDict
+
+    from ibis.expr.types import pretty
+
+    monkeypatch.setattr(ibis.options.repr.interactive, "reuse_previews", cached)
+
+    def render():
+        if not cached:
+            monkeypatch.setattr(pretty, "_previews", OrderedDict())
+        return pretty.to_rich(wide_strings_table, console_width=float("inf"))
+
+    benchmark(render)
+
+
+@pytest.mark.parametrize("cast", [False, True], ids=["matching", "cast"])
+def test_convert_wide_pyarrow_table(benchmark, cast):
+    pa = pytest.importorskip("pyarrow")
+
+    from ibis.formats.pyarrow import PyArrowData
+
+    ncols = 2_000
+    schema = ibis.schema({f"c{i}": "int64" for i in range(ncols)})
+    arrow_type = pa.int32() if cast else pa.int64()
+    table = pa.table(
+        {name: pa.array(range(10), type=arrow_type) for name in schema.names}
+    )
+    if not cast:
+        table = table.cast(schema.to_pyarrow())
+
+    result = benchmark(PyArrowData.convert_table, table, schema)
+    assert result.schema == schema.to_pyarrow()
+
+
+def test_to_pyarrow_wide_duckdb(benchmark):
+    con = ibis.duckdb.connect()
+    ncols = 1_000
+    t = con.sql(
+        "SELECT "
+        + ", ".join(f"CAST(i AS INT) AS c{i}" for i in range(ncols))
+        + " FROM range(100) t (i)"
+    )
+    result = benchmark(t.to_pyarrow)
+    assert result.num_columns == ncols
+
+
+@pytest.mark.parametrize("arrow_dtypes", [False, True], ids=["objects", "arrow"])
+def test_to_pandas_batches_nested(benchmark, monkeypatch, arrow_dtypes):
+    monkeypatch.setattr(ibis.options, "nested_arrow_dtypes", arrow_dtypes)
+    con = ibis.duckdb.connect()
+    t = con.sql(
+        """
+        SELECT
+          [i, i + 1] AS a,
+          {'x': i, 'y': CAST(i AS VARCHAR)} AS s,
+          MAP(['k'], [i]) AS m
+        FROM range(500000) t (i)
+        """
+    )
+
+    def consume():
+        return sum(map(len, con.to_pandas_batches(t, chunk_size=100_000)))
+
+    assert benchmark(consume) == 500_000
+
+
 @pytest.mark.parametrize("overwrite", [True, False], ids=["overwrite", "no_overwrite"])
 def test_insert_duckdb(benchmark, overwrite, tmp_path):
     pytest.importorskip("duckdb")
@@ -656,6 +736,95 @@ def test_insert_duckdb(benchmark, overwrite, tmp_path):
     benchmark(con.insert, table_name, t, overwrite=overwrite)
 
 
+@pytest.mark.parametrize(
+    "threshold", [None, 10_000], ids=["in_list", "memtable_semi_join"]
+)
+def test_large_isin_duckdb(benchmark, monkeypatch, threshold):
+    pytest.importorskip("duckdb")
+
+    monkeypatch.setattr(ibis.options.sql, "isin_memtable_threshold", threshold)
+
+    con = ibis.duckdb.connect()
+    t = ibis.memtable({"a": range(100_000)})
+    expr = t.filter(t.a.isin(range(0, 200_000, 4))).count()
+
+    assert benchmark(con.execute, expr) == 25_000
+
+
+@pytest.fixture(scope="module")
+def arrow_10m():
+    pa = pytest.importorskip("pyarrow")
+    np = pytest.importorskip("numpy")
+
+    n = 10_000_000
+    ints = np.arange(n)
+    return pa.table(
+        {"a": ints, "b": ints.astype("float64"), "c": pa.array(ints).cast("string")}
+    )
+
+
+@pytest.mark.parametrize(
+    "kind", ["pyarrow_table", "pyarrow_rbr", "pyarrow_dataset", "polars"]
+)
+def test_insert_duckdb_arrow(benchmark, arrow_10m, kind):
+    pytest.importorskip("duckdb")
+    pytest.importorskip("pyarrow.dataset")
+
+    if kind == "pyarrow_table":
+        make_source = lambda: arrow_10m
+    elif kind == "pyarrow_rbr":
+        make_source = arrow_10m.to_reader
+    elif kind == "pyarrow_dataset":
+        import pyarrow.dataset as ds
+
+        make_source = functools.partial(ds.dataset, arrow_10m)
+    else:
+        pl = pytest.importorskip("polars")
+        df = pl.from_arrow(arrow_10m)
+        make_source = lambda: df
+
+    con = ibis.duckdb.connect()
+    con.create_table("t", schema=sch.infer(arrow_10m))
+
+    benchmark.pedantic(
+        con.insert,
+        setup=lambda: (("t", make_source()), {"overwrite": True}),
+        rounds=3,
+    )
+    assert con.table("t").count().execute() == arrow_10m.num_rows
+
+
+def test_insert_sqlite_arrow(benchmark, arrow_10m, tmp_path):
+    con = ibis.sqlite.connect(tmp_path / "test_insert.db")
+    con.create_table("t", schema=sch.infer(arrow_10m))
+
+    benchmark.pedantic(
+        con.insert, args=("t", arrow_10m), kwargs={"overwrite": True}, rounds=1
+    )
+    assert con.table("t").count().execute() == arrow_10m.num_rows
+
+
+@pytest.mark.parametrize("kind", ["pyarrow", "polars"])
+def test_memtable_register_arrow(benchmark, arrow_10m, kind):
+    pytest.importorskip("duckdb")
+
+    if kind == "polars":
+        pl = pytest.importorskip("polars")
+        data = pl.from_arrow(arrow_10m)
+    else:
+        data = arrow_10m
+
+    con = ibis.duckdb.connect()
+
+    def register():
+        # a fresh memtable every round, an already registered one isn't
+        # registered again
+        return con.execute(ibis.memtable(data).c.length().sum())
+
+    result = benchmark(register)
+    assert result > 0
+
+
 def test_snowflake_medium_sized_to_pandas(benchmark):
     pytest.importorskip("snowflake.connector")
 
@@ -674,6 +843,83 @@ def test_snowflake_medium_sized_to_pandas(benchmark):
     benchmark.pedantic(lineitem.to_pandas, rounds=5, iterations=1, warmup_rounds=1)
 
 
+class _LocalResultBatch:
+    """Stand-in for a Snowflake result batch that is fetched from storage."""
+
+    def __init__(self, payload: bytes, latency: float) -> None:
+        self.payload = payload
+        self.latency = latency
+
+    def to_arrow(self, connection=None):
+        import time
+
+        import pyarrow as pa
+
+        # simulate the download from cloud storage
+        time.sleep(self.latency)
+        return pa.ipc.open_stream(self.payload).read_all()
+
+
+class _LocalResultCursor:
+    def __init__(self, result_batches):
+        self.result_batches = result_batches
+
+    def execute(self, query, **kwargs):
+        pass
+
+    def get_result_batches(self):
+        return self.result_batches
+
+    def fetch_arrow_batches(self):
+        for batch in self.result_batches:
+            yield batch.to_arrow()
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def snowflake_result_batches():
+    pa = pytest.importorskip("pyarrow")
+
+    # Snowflake splits results into chunks of up to a few tens of MB
+    chunk = pa.table(
+        {
+            "a": pa.array(range(100_000), type=pa.int64()),
+            "b": pa.array(map(float, range(100_000))),
+            "c": pa.array(map(str, range(100_000))),
+        }
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, chunk.schema) as writer:
+        writer.write_table(chunk)
+    payload = sink.getvalue().to_pybytes()
+    return chunk.schema, [_LocalResultBatch(payload, latency=0.02) for _ in range(64)]
+
+
+@pytest.mark.parametrize("max_workers", [None, 8])
+def test_snowflake_to_pyarrow_batches_fan_out(
+    benchmark, snowflake_result_batches, max_workers
+):
+    from ibis.backends.snowflake import Backend
+
+    schema, result_batches = snowflake_result_batches
+    con = Backend()
+    con.con = types.SimpleNamespace(cursor=lambda: _LocalResultCursor(result_batches))
+
+    def consume():
+        batches = con._make_batch_iter(
+            "SELECT * FROM t",
+            target_schema=schema,
+            chunk_size=1_000_000,
+            max_workers=max_workers,
+        )
+        return sum(map(len, batches))
+
+    result = benchmark.pedantic(consume, rounds=3, iterations=1)
+    assert result == 6_400_000
+
+
 def test_parse_many_duckdb_types(benchmark):
     from ibis.backends.sql.datatypes import DuckDBType
 
@@ -684,6 +930,18 @@ def test_parse_many_duckdb_types(benchmark):
     benchmark(parse_many, types)
 
 
+def test_parse_many_duckdb_types_bulk(benchmark):
+    from ibis.backends.sql.datatypes import DuckDBType
+
+    types = [
+        "VARCHAR",
+        "INTEGER",
+        "STRUCT(a DOUBLE, b VARCHAR[], c MAP(VARCHAR, BIGINT))",
+        "TIMESTAMP WITH TIME ZONE",
+    ] * 1000
+    benchmark(DuckDBType.from_strings, types, nullable=True)
+
+
 @pytest.fixture(scope="session")
 def sql() -> str:
     return """
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime
 import decimal
+import json
 
 import pytest
 
@@ -10,7 +11,9 @@ import ibis.expr.datatypes as dt
 
 pytest.importorskip("rich")
 
-from ibis.expr.types.pretty import format_column, format_values
+from rich.console import Console
+
+from ibis.expr.types.pretty import format_arrow_column, format_column, format_values
 
 pd = pytest.importorskip("pandas")
 
@@ -140,6 +143,45 @@ def test_format_string_column():
     assert max_len == max(map(len, strs))
 
 
+@pytest.mark.parametrize(
+    ("dtype", "values"),
+    [
+        (dt.string, [None, "", "test\t\r\n", "a string", "x" * 5000]),
+        (dt.float64, [None, float("nan"), 1.5, float("inf")]),
+        (dt.int64, [None, None]),
+        (dt.date, [datetime.date(2024, 1, 1), None]),
+    ],
+    ids=["string", "float", "null", "date"],
+)
+def test_format_arrow_column(dtype, values):
+    pa = pytest.importorskip("pyarrow")
+
+    column = pa.chunked_array([values], type=dtype.to_pyarrow())
+    expected = format_column(dtype, values)
+    result = format_arrow_column(dtype, column)
+    assert list(map(str, result[0])) == list(map(str, expected[0]))
+    assert result[1:] == expected[1:]
+
+
+def test_format_arrow_json_column_is_not_truncated():
+    pa = pytest.importorskip("pyarrow")
+
+    value = json.dumps({"a": list(range(1000))})
+    column = pa.chunked_array([[value, None]], type=pa.string())
+    result = format_arrow_column(dt.json, column)
+    expected = format_column(dt.json, [value, None])
+
+    console = Console(width=80)
+
+    def render(formatted):
+        with console.capture() as capture:
+            console.print(*formatted)
+        return capture.get()
+
+    assert render(result[0]) == render(expected[0])
+    assert result[1:] == expected[1:]
+
+
 def test_format_short_string_column():
     values = [None, "", "ab", "cd"]
     fmts, min_len, max_len = format_column(dt.string, values)
@@ -14,3 +14,19 @@ def test_sql_config(monkeypatch):
 
     monkeypatch.setattr(options.sql, "default_limit", 100)
     assert options.sql.default_limit == 100
+
+
+def test_approximate():
+    import ibis
+
+    assert not options.approximate
+    with ibis.approximate():
+        assert options.approximate
+        with ibis.approximate(False):
+            assert not options.approximate
+        assert options.approximate
+    assert not options.approximate
+
+    with pytest.raises(ZeroDivisionError), ibis.approximate():
+        1 / 0  # noqa: B018
+    assert not options.approximate